@@ -1,22 +1,29 @@
 # backend/src/api/auth/router.py
-from fastapi import APIRouter, HTTPException, Query, Response, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from fastapi.responses import RedirectResponse
 from typing import Optional
+import asyncio
 import secrets
 import json
 from datetime import datetime
+from bson import ObjectId
 
-from ...database.repositories import user_repo, skill_profile_repo
+from ...database.repositories import user_repo, skill_profile_repo, repository_repo
 from ...services.github_service import github_service
-from ...core.auth import create_access_token
+from ...services.oauth_state_store import oauth_state_store
+from ...core.auth import (
+    RequestUserLoader,
+    create_access_token,
+    get_current_user,
+    get_user_loader,
+)
 from ...core.config import settings
+from ...core.revocation import revocation_list
+from ...core.timing import StepTimer
 from .schemas import GitHubOAuthRequest, GitHubCallbackRequest, AuthResponse, UserInfo
 
 router = APIRouter()
 
-# In-memory state store (use Redis in production)
-oauth_states = {}
-
 
 @router.post("/github", response_model=dict)
 async def initiate_github_oauth(request: GitHubOAuthRequest):
@@ -24,12 +31,15 @@ async def initiate_github_oauth(request: GitHubOAuthRequest):
     # Generate secure random state
     state = secrets.token_urlsafe(32)
 
-    # Store state (in production, use Redis with expiration)
-    oauth_states[state] = {
-        "redirect_uri": request.redirect_uri
-        or f"{settings.FRONTEND_URL}/auth/callback",
-        "created_at": datetime.utcnow().isoformat(),
-    }
+    # Store state until the callback consumes it (expires after OAUTH_STATE_TTL)
+    await oauth_state_store.put(
+        state,
+        {
+            "redirect_uri": request.redirect_uri
+            or f"{settings.FRONTEND_URL}/auth/callback",
+            "created_at": datetime.utcnow().isoformat(),
+        },
+    )
 
     # Get OAuth URL
     auth_url = github_service.get_oauth_url(state)
@@ -38,20 +48,19 @@ async def initiate_github_oauth(request: GitHubOAuthRequest):
 
 
 @router.post("/github/callback", response_model=AuthResponse)
-async def handle_github_callback(request: GitHubCallbackRequest):
+async def handle_github_callback(request: GitHubCallbackRequest, response: Response):
     """Handle GitHub OAuth callback"""
-    # Verify state
-    if request.state not in oauth_states:
+    # Verify and consume state (one-time use)
+    if await oauth_state_store.pop(request.state) is None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid state parameter"
         )
 
-    # Remove state from store
-    oauth_states.pop(request.state)
-
+    timer = StepTimer()
     try:
         # Exchange code for token
-        token_data = await github_service.exchange_code_for_token(request.code)
+        with timer.step("token"):
+            token_data = await github_service.exchange_code_for_token(request.code)
         access_token = token_data.get("access_token")
 
         if not access_token:
@@ -60,58 +69,38 @@ async def handle_github_callback(request: GitHubCallbackRequest):
                 detail="Failed to obtain access token",
             )
 
-        # Get user info
-        github_user = await github_service.get_user_info(access_token)
-
-        # Get primary email
-        emails = await github_service.get_user_emails(access_token)
+        # User info and emails are independent; fetch them together
+        with timer.step("github"):
+            github_user, emails = await asyncio.gather(
+                github_service.get_user_info(access_token),
+                github_service.get_user_emails(access_token),
+            )
         primary_email = next(
             (email["email"] for email in emails if email["primary"]),
             github_user.get("email"),
         )
 
-        # Check if user exists
-        existing_user = await user_repo.find_by_github_id(str(github_user["id"]))
-
-        if existing_user:
-            # Update existing user
-            user_data = {
-                "username": github_user["login"],
-                "email": primary_email,
-                "avatar_url": github_user["avatar_url"],
-                "github_access_token": access_token,
-                "last_login": datetime.utcnow(),
-            }
-            await user_repo.update_by_id(str(existing_user["_id"]), user_data)
-            user = existing_user
-            user.update(user_data)
-        else:
-            # Create new user
-            user_data = {
-                "github_id": str(github_user["id"]),
-                "username": github_user["login"],
-                "email": primary_email,
-                "avatar_url": github_user["avatar_url"],
-                "github_access_token": access_token,
-                "plan": "free",
-                "last_login": datetime.utcnow(),
-            }
-            user = await user_repo.create(user_data)
-
-            # Create skill profile for new user
-            skill_profile = await skill_profile_repo.create(
+        # Create or update the user in a single upsert
+        with timer.step("user"):
+            user, _ = await user_repo.upsert_github_user(
+                str(github_user["id"]),
                 {
-                    "user_id": user["_id"],
-                    "skills": [],
-                    "strengths": [],
-                    "learning_velocity": {},
-                }
+                    "username": github_user["login"],
+                    "email": primary_email,
+                    "avatar_url": github_user["avatar_url"],
+                    "github_access_token": access_token,
+                    "last_login": datetime.utcnow(),
+                },
             )
 
-            # Update user with skill profile ID
-            await user_repo.update_by_id(
-                str(user["_id"]), {"skill_profile_id": skill_profile["_id"]}
-            )
+        if user.get("skill_profile_id"):
+            # The ID was pre-allocated by the upsert, so no relink write. Ensured
+            # on every login, not only for new users: if this insert failed on
+            # the first login, the profile is still missing.
+            with timer.step("profile"):
+                await skill_profile_repo.ensure_for_user(
+                    user["skill_profile_id"], user["_id"]
+                )
 
         # Create JWT token
         jwt_token = create_access_token(
@@ -121,6 +110,7 @@ async def handle_github_callback(request: GitHubCallbackRequest):
                 "email": user["email"],
             }
         )
+        response.headers["Server-Timing"] = timer.server_timing()
 
         return AuthResponse(
             access_token=jwt_token,
@@ -133,6 +123,8 @@ async def handle_github_callback(request: GitHubCallbackRequest):
             ),
         )
 
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -141,18 +133,22 @@ async def handle_github_callback(request: GitHubCallbackRequest):
 
 
 @router.get("/me", response_model=UserInfo)
-async def get_current_user_info(current_user: dict = Depends(get_current_user)):
+async def get_current_user_info(
+    current_user: dict = Depends(get_current_user),
+    user_loader: RequestUserLoader = Depends(get_user_loader),
+):
     """Get current user information"""
-    user = await user_repo.find_by_id(current_user["id"])
+    # The stats query only needs the ID from the token, so both run at once
+    user, repo_count = await asyncio.gather(
+        user_loader.load(current_user["id"], projection="summary"),
+        repository_repo.count({"user_id": ObjectId(current_user["id"])}),
+    )
 
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
         )
 
-    # Get additional stats
-    repo_count = await repository_repo.count({"user_id": user["_id"]})
-
     return UserInfo(
         id=str(user["_id"]),
         username=user["username"],
@@ -168,8 +164,8 @@ async def get_current_user_info(current_user: dict = Depends(get_current_user)):
 
 
 @router.post("/logout")
-async def logout(response: Response):
-    """Logout user (client-side token removal)"""
-    # In a production app, you might want to blacklist the token
-    # For now, we'll just return a success response
+async def logout(current_user: dict = Depends(get_current_user)):
+    """Logout user by revoking the presented token until it expires"""
+    if current_user.get("jti") and current_user.get("exp"):
+        await revocation_list.revoke(current_user["jti"], float(current_user["exp"]))
     return {"message": "Logged out successfully"}
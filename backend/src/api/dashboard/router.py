@@ -0,0 +1,17 @@
+# backend/src/api/dashboard/router.py
+from fastapi import APIRouter, Depends
+
+from ...services.dashboard import dashboard_service
+from ...core.auth import get_current_user
+from .schemas import DashboardOverview
+
+router = APIRouter()
+
+
+@router.get("/", response_model=DashboardOverview)
+async def get_overview(current_user: dict = Depends(get_current_user)):
+    """Repository, translation, learning and skill headlines for the dashboard
+
+    Served from a short-TTL per-user cache that writes invalidate.
+    """
+    return await dashboard_service.get_overview(current_user["id"])
@@ -0,0 +1,61 @@
+# backend/src/api/dashboard/schemas.py
+from pydantic import BaseModel, Field
+from typing import Any, Dict, List, Optional
+from datetime import datetime
+
+
+class RepositoryStats(BaseModel):
+    total: int = 0
+    by_status: Dict[str, int] = Field(default_factory=dict)
+
+
+class RecentTranslation(BaseModel):
+    id: str
+    source: Dict[str, Any]
+    target: Dict[str, Any]
+    metadata: Dict[str, Any] = Field(default_factory=dict)
+    execution_time: Optional[float] = None
+    created_at: Optional[datetime] = None
+
+
+class TargetCount(BaseModel):
+    framework: Optional[str] = None
+    count: int
+
+
+class TranslationStats(BaseModel):
+    total: int = 0
+    avg_execution_time: Optional[float] = None
+    top_targets: List[TargetCount] = Field(default_factory=list)
+    recent: List[RecentTranslation] = Field(default_factory=list)
+
+
+class LearningPathProgress(BaseModel):
+    id: str
+    title: str
+    from_technology: Dict[str, Any] = Field(default_factory=dict)
+    to_technology: Dict[str, Any] = Field(default_factory=dict)
+    difficulty: Optional[str] = None
+    progress: float = 0.0
+    estimated_hours: Optional[float] = None
+    lessons_total: int = 0
+    lessons_completed: int = 0
+
+
+class LearningPathStats(BaseModel):
+    active: int = 0
+    paths: List[LearningPathProgress] = Field(default_factory=list)
+
+
+class SkillStats(BaseModel):
+    metrics: Dict[str, Any] = Field(default_factory=dict)
+    strengths: List[str] = Field(default_factory=list)
+    updated_at: Optional[datetime] = None
+
+
+class DashboardOverview(BaseModel):
+    repositories: RepositoryStats
+    translations: TranslationStats
+    learning_paths: LearningPathStats
+    skills: SkillStats
+    generated_at: datetime
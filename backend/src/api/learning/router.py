@@ -0,0 +1,119 @@
+# backend/src/api/learning/router.py
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from typing import Any, Dict, Optional
+from bson import ObjectId
+
+from ...database.repositories import learning_path_repo
+from ...services.content_refs import content_refs
+from ...services.dashboard import dashboard_service
+from ...services.learning_path_service import learning_path_service
+from ...core.auth import get_current_user
+from .schemas import (
+    LearningPathDetail,
+    LearningPathPage,
+    LearningPathRequest,
+    LearningPathSummary,
+    LessonCompletion,
+    LessonCompletionRequest,
+)
+
+router = APIRouter()
+
+
+def path_fields(path: Dict[str, Any]) -> Dict[str, Any]:
+    """Learning path document -> response fields"""
+    return {
+        **{k: v for k, v in path.items() if k not in ("_id", "user_id", "job_id")},
+        "id": str(path["_id"]),
+        "job_id": str(path["job_id"]) if path.get("job_id") else None,
+    }
+
+
+@router.post("/paths", status_code=status.HTTP_202_ACCEPTED)
+async def create_learning_path(
+    request: LearningPathRequest, current_user: dict = Depends(get_current_user)
+):
+    """Queue generation of a personalized learning path
+
+    The path is returned immediately with status `generating`; poll it until
+    it becomes `active` (or `failed`).
+    """
+    path = await learning_path_service.create_path(
+        ObjectId(current_user["id"]), request.model_dump()
+    )
+    return {
+        "learning_path_id": str(path["_id"]),
+        "job_id": str(path["job_id"]),
+        "status": path["status"],
+    }
+
+
+@router.get("/paths", response_model=LearningPathPage)
+async def list_learning_paths(
+    limit: int = Query(default=20, ge=1, le=100),
+    cursor: Optional[str] = None,
+    current_user: dict = Depends(get_current_user),
+):
+    """List the current user's active learning paths (without lesson bodies)"""
+    try:
+        page = await learning_path_repo.find_page_active_by_user(
+            current_user["id"], limit=limit, cursor=cursor, projection="summary"
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    return LearningPathPage(
+        items=[LearningPathSummary(**path_fields(path)) for path in page["items"]],
+        next_cursor=page["next_cursor"],
+    )
+
+
+@router.get("/paths/{path_id}", response_model=LearningPathDetail)
+async def get_learning_path(
+    path_id: str, current_user: dict = Depends(get_current_user)
+):
+    """Get one of the current user's learning paths with its lessons
+
+    Lesson bodies kept in the blob store are loaded here, in one batch.
+    """
+    if not ObjectId.is_valid(path_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Learning path not found"
+        )
+    path = await learning_path_repo.find_one(
+        {"_id": ObjectId(path_id), "user_id": ObjectId(current_user["id"])}
+    )
+    if not path:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Learning path not found"
+        )
+    path["lessons"] = await content_refs.load_lessons(path.get("lessons", []))
+    return LearningPathDetail(**path_fields(path))
+
+
+@router.post(
+    "/paths/{path_id}/lessons/{lesson_id}/complete", response_model=LessonCompletion
+)
+async def complete_lesson(
+    path_id: str,
+    lesson_id: str,
+    request: LessonCompletionRequest = LessonCompletionRequest(),
+    current_user: dict = Depends(get_current_user),
+):
+    """Mark a lesson completed (or not); progress and status are derived"""
+    path = await learning_path_repo.set_lesson_completed(
+        path_id, current_user["id"], lesson_id, request.completed
+    )
+    if not path:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Lesson not found"
+        )
+    await dashboard_service.invalidate(current_user["id"])
+    return LessonCompletion(
+        learning_path_id=path_id,
+        lesson_id=lesson_id,
+        completed=request.completed,
+        progress=path["progress"],
+        status=path["status"],
+        completed_at=path.get("completed_at"),
+    )
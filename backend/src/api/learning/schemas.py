@@ -0,0 +1,81 @@
+# backend/src/api/learning/schemas.py
+from pydantic import BaseModel, Field
+from typing import Any, Dict, List, Optional
+from datetime import datetime
+
+
+class TechnologyTarget(BaseModel):
+    technology: str = Field(..., min_length=1)
+    current_proficiency: Optional[float] = Field(default=None, ge=0, le=10)
+    target_proficiency: Optional[float] = Field(default=None, ge=0, le=10)
+
+
+class LearningPathRequest(BaseModel):
+    from_technology: TechnologyTarget
+    to_technology: TechnologyTarget
+    difficulty: str = Field(
+        default="intermediate", pattern="^(beginner|intermediate|advanced)$"
+    )
+    title: Optional[str] = None
+    learning_style: Optional[str] = None
+    time_commitment: Optional[str] = None
+    deadline: Optional[datetime] = None
+
+
+class LessonSummary(BaseModel):
+    id: str
+    order: int
+    title: str
+    description: str = ""
+    objectives: List[str] = Field(default_factory=list)
+    estimated_time: int = 0
+    skills: List[str] = Field(default_factory=list)
+    completed: bool = False
+    completed_at: Optional[datetime] = None
+
+
+class Lesson(LessonSummary):
+    content: str = ""
+    examples: List[Dict[str, Any]] = Field(default_factory=list)
+    exercises: List[Dict[str, Any]] = Field(default_factory=list)
+
+
+class LearningPathSummary(BaseModel):
+    id: str
+    title: str
+    from_technology: Dict[str, Any]
+    to_technology: Dict[str, Any]
+    difficulty: str
+    estimated_hours: float = 0.0
+    progress: float = 0.0
+    status: str
+    job_id: Optional[str] = None
+    lessons: List[LessonSummary] = Field(default_factory=list)
+
+
+class LearningPathDetail(LearningPathSummary):
+    lessons: List[Lesson] = Field(default_factory=list)
+    learning_style: Optional[str] = None
+    time_commitment: Optional[str] = None
+    deadline: Optional[datetime] = None
+    started_at: Optional[datetime] = None
+    completed_at: Optional[datetime] = None
+    personalization: Dict[str, Any] = Field(default_factory=dict)
+
+
+class LearningPathPage(BaseModel):
+    items: List[LearningPathSummary]
+    next_cursor: Optional[str] = None
+
+
+class LessonCompletionRequest(BaseModel):
+    completed: bool = True
+
+
+class LessonCompletion(BaseModel):
+    learning_path_id: str
+    lesson_id: str
+    completed: bool
+    progress: float
+    status: str
+    completed_at: Optional[datetime] = None
@@ -0,0 +1,152 @@
+# backend/src/api/translation/router.py
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
+from typing import Optional
+import json
+from bson import ObjectId
+
+from ...database.repositories import repository_repo, translation_repo
+from ...services.batch_translation import create_batch_translation_job
+from ...services.content_refs import content_refs
+from ...services.translation_service import translation_service
+from ...core.auth import get_current_user
+from .schemas import (
+    BatchTranslationRequest,
+    TranslationDetail,
+    TranslationRequest,
+    TranslationSummary,
+    TranslationPage,
+)
+
+router = APIRouter()
+
+
+def sse_event(event: str, data: dict) -> str:
+    """Format one server-sent event"""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+@router.post("/stream")
+async def stream_translation(
+    request: TranslationRequest, current_user: dict = Depends(get_current_user)
+):
+    """Translate code, streaming output as server-sent events
+
+    Emits `chunk` events with `{"text": ...}` as the model produces output,
+    then one `done` event with the stored translation's id and timing.
+    """
+
+    async def events():
+        result = {}
+        try:
+            async for chunk in translation_service.stream_translation(
+                ObjectId(current_user["id"]),
+                request.source.model_dump(),
+                request.target.model_dump(),
+                result,
+            ):
+                yield sse_event("chunk", {"text": chunk})
+        except Exception as e:
+            yield sse_event("error", {"detail": f"Translation failed: {str(e)}"})
+            return
+        yield sse_event("done", result)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.get("/", response_model=TranslationPage)
+async def list_translations(
+    source_framework: Optional[str] = None,
+    target_framework: Optional[str] = None,
+    limit: int = Query(default=20, ge=1, le=100),
+    cursor: Optional[str] = None,
+    current_user: dict = Depends(get_current_user),
+):
+    """List the current user's translations (without code), newest first"""
+    try:
+        page = await translation_repo.find_page_by_user(
+            current_user["id"],
+            source_framework,
+            target_framework,
+            limit=limit,
+            cursor=cursor,
+            projection="summary",
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    return TranslationPage(
+        items=[
+            TranslationSummary(
+                id=str(item["_id"]),
+                source=item["source"],
+                target=item["target"],
+                metadata=item.get("metadata", {}),
+                execution_time=item.get("execution_time"),
+            )
+            for item in page["items"]
+        ],
+        next_cursor=page["next_cursor"],
+    )
+
+
+@router.get("/{translation_id}", response_model=TranslationDetail)
+async def get_translation(
+    translation_id: str, current_user: dict = Depends(get_current_user)
+):
+    """Get one of the current user's translations, including its code"""
+    if not ObjectId.is_valid(translation_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Translation not found"
+        )
+    translation = await translation_repo.find_one(
+        {"_id": ObjectId(translation_id), "user_id": ObjectId(current_user["id"])}
+    )
+    if not translation:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Translation not found"
+        )
+    translation = await content_refs.load_translation(translation)
+    return TranslationDetail(
+        id=str(translation["_id"]),
+        source=translation["source"],
+        target=translation["target"],
+        metadata=translation.get("metadata", {}),
+        execution_time=translation.get("execution_time"),
+        created_at=translation.get("created_at"),
+    )
+
+
+@router.post("/repositories/{repository_id}", status_code=status.HTTP_202_ACCEPTED)
+async def translate_repository(
+    repository_id: str,
+    request: BatchTranslationRequest,
+    current_user: dict = Depends(get_current_user),
+):
+    """Queue translation of every matching file in a repository"""
+    if not ObjectId.is_valid(repository_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Repository not found"
+        )
+    repository = await repository_repo.find_one(
+        {"_id": ObjectId(repository_id), "user_id": ObjectId(current_user["id"])},
+        projection={"_id": 1},
+    )
+    if not repository:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Repository not found"
+        )
+
+    job = await create_batch_translation_job(
+        ObjectId(current_user["id"]),
+        repository,
+        request.source.model_dump(),
+        request.target.model_dump(),
+        extensions=request.extensions,
+        priority=request.priority,
+    )
+    return {"job_id": str(job["_id"]), "status": job["status"]}
@@ -0,0 +1,43 @@
+# backend/src/api/translation/schemas.py
+from pydantic import BaseModel, Field
+from typing import Any, Dict, List, Optional
+from datetime import datetime
+
+
+class CodeSpec(BaseModel):
+    framework: str
+    language: str
+    packages: List[str] = Field(default_factory=list)
+
+
+class SourceCode(CodeSpec):
+    code: str
+
+
+class TranslationRequest(BaseModel):
+    source: SourceCode
+    target: CodeSpec
+
+
+class BatchTranslationRequest(BaseModel):
+    source: CodeSpec
+    target: CodeSpec
+    extensions: Optional[List[str]] = None
+    priority: int = Field(default=5, ge=1, le=10)
+
+
+class TranslationSummary(BaseModel):
+    id: str
+    source: Dict[str, Any]
+    target: Dict[str, Any]
+    metadata: Dict[str, Any] = Field(default_factory=dict)
+    execution_time: Optional[float] = None
+
+
+class TranslationDetail(TranslationSummary):
+    created_at: Optional[datetime] = None
+
+
+class TranslationPage(BaseModel):
+    items: List[TranslationSummary]
+    next_cursor: Optional[str] = None
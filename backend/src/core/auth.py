@@ -1,15 +1,24 @@
 # backend/src/core/auth.py
+import asyncio
+import hashlib
+import uuid
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Union
 from jose import JWTError, jwt
 from passlib.context import CryptContext
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from ..core.cache import LRUCache
 from ..core.config import settings
+from ..core.revocation import revocation_list
+from ..database.repositories import user_repo
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 security = HTTPBearer()
 
+# Verified payloads keyed by token hash; entries expire with the token's `exp`
+token_cache = LRUCache(settings.JWT_CACHE_MAX_ENTRIES)
+
 
 def create_access_token(
     data: Dict[str, Any], expires_delta: Optional[timedelta] = None
@@ -21,7 +30,7 @@ def create_access_token(
     else:
         expire = datetime.utcnow() + timedelta(hours=settings.JWT_EXPIRATION_HOURS)
 
-    to_encode.update({"exp": expire})
+    to_encode.update({"exp": expire, "jti": uuid.uuid4().hex})
     encoded_jwt = jwt.encode(
         to_encode, settings.JWT_SECRET_KEY, algorithm=settings.JWT_ALGORITHM
     )
@@ -30,10 +39,17 @@ def create_access_token(
 
 def decode_access_token(token: str) -> Dict[str, Any]:
     """Decode JWT access token"""
+    key = hashlib.sha256(token.encode()).digest()
+    payload = token_cache.get(key)
+    if payload is not None:
+        return payload
+
     try:
         payload = jwt.decode(
             token, settings.JWT_SECRET_KEY, algorithms=[settings.JWT_ALGORITHM]
         )
+        if "exp" in payload:
+            token_cache.set(key, payload, expires_at=float(payload["exp"]))
         return payload
     except JWTError:
         raise HTTPException(
@@ -57,10 +73,52 @@ async def get_current_user(
             detail="Could not validate credentials",
         )
 
+    jti = payload.get("jti")
+    if jti and await revocation_list.is_revoked(jti):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Token has been revoked",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
     # In production, you would fetch the user from database here
     # For now, return the payload
     return {
         "id": user_id,
         "username": payload.get("username"),
         "email": payload.get("email"),
+        "jti": jti,
+        "exp": payload.get("exp"),
     }
+
+
+class RequestUserLoader:
+    """Per-request user loader that shares one lookup between all callers"""
+
+    def __init__(self):
+        self._loads: Dict[Any, asyncio.Future] = {}
+
+    async def load(
+        self, user_id: str, projection: Optional[Union[str, Dict[str, int]]] = None
+    ) -> Optional[Dict[str, Any]]:
+        key = (
+            user_id,
+            projection
+            if projection is None or isinstance(projection, str)
+            else tuple(sorted(projection.items())),
+        )
+        load = self._loads.get(key)
+        if load is None:
+            load = asyncio.ensure_future(
+                user_repo.find_by_id_cached(user_id, projection)
+            )
+            self._loads[key] = load
+        return await load
+
+
+def get_user_loader(request: Request) -> RequestUserLoader:
+    """Request-scoped user loader"""
+    loader = getattr(request.state, "user_loader", None)
+    if loader is None:
+        loader = request.state.user_loader = RequestUserLoader()
+    return loader
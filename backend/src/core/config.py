@@ -13,19 +13,108 @@ class Settings(BaseSettings):
     # Database
     MONGODB_URI: str
     MONGODB_DB_NAME: str = "codeshift"
+    MONGODB_ENSURE_INDEXES: bool = True
+    MONGODB_VERIFY_QUERY_PLANS: bool = False
+    # Wire compressors offered to the server, in preference order; ones whose
+    # library isn't installed are skipped
+    MONGODB_COMPRESSORS: str = "zstd,snappy,zlib"
+    MONGODB_ZLIB_COMPRESSION_LEVEL: int = 6
+
+    # Field-level compression of designated large fields (see
+    # BaseRepository.compressed_fields); smaller values stay plain
+    FIELD_COMPRESSION_CODEC: str = "zstd"  # zstd | zlib (zlib if zstd missing)
+    FIELD_COMPRESSION_MIN_BYTES: int = 512
+    FIELD_COMPRESSION_LEVEL: int = 3
+
+    # Large payloads (lesson bodies, translation code) live in a
+    # content-addressed blob store, referenced by hash from their documents
+    BLOB_STORE_BACKEND: str = "mongo"  # mongo | gridfs | local
+    BLOB_STORE_PATH: str = "./blobs"
+    # Payloads smaller than this stay inline
+    BLOB_INLINE_MAX_BYTES: int = 2048
 
     # GitHub OAuth
     GITHUB_CLIENT_ID: str
     GITHUB_CLIENT_SECRET: str
     GITHUB_REDIRECT_URI: str
 
+    # GitHub API client
+    GITHUB_HTTP2: bool = True
+    GITHUB_MAX_CONNECTIONS: int = 100
+    GITHUB_MAX_KEEPALIVE_CONNECTIONS: int = 20
+    GITHUB_TIMEOUT_SECONDS: float = 15.0
+    GITHUB_CONNECT_TIMEOUT_SECONDS: float = 5.0
+    GITHUB_MAX_RETRIES: int = 3
+    GITHUB_RATE_LIMIT_RESERVE: int = 100
+    GITHUB_MAX_RATE_LIMIT_WAIT_SECONDS: float = 60.0
+    GITHUB_PAGINATION_CONCURRENCY: int = 8
+    GITHUB_CACHE_BACKEND: str = "memory"  # memory | redis | none
+    GITHUB_CACHE_TTL_SECONDS: float = 24 * 60 * 60
+    GITHUB_CACHE_MAX_ENTRIES: int = 10000
+    # Repository tarballs: kept in memory up to this size, then spilled to disk
+    GITHUB_ARCHIVE_MEMORY_BYTES: int = 32 * 1024 * 1024
+    GITHUB_ARCHIVE_MAX_BYTES: int = 1024 * 1024 * 1024
+    GITHUB_ARCHIVE_MAX_FILE_BYTES: int = 1_000_000
+
     # Redis
     REDIS_URL: str = "redis://localhost:6379"
 
+    # OAuth state store
+    OAUTH_STATE_BACKEND: str = "memory"  # memory | redis
+    OAUTH_STATE_TTL_SECONDS: int = 600
+    OAUTH_STATE_MAX_ENTRIES: int = 10000
+
+    # Analysis workers
+    JOB_WORKER_CONCURRENCY: int = 4
+    JOB_LEASE_SECONDS: int = 60
+    JOB_POLL_INTERVAL_SECONDS: float = 1.0
+    JOB_RETRY_BACKOFF_SECONDS: float = 5.0
+    JOB_RETRY_BACKOFF_MAX_SECONDS: float = 300.0
+    JOB_PROGRESS_FLUSH_SECONDS: float = 1.0
+
+    # Repository analysis
+    REPOSITORY_ANALYSIS_CONCURRENCY: int = 8
+    REPOSITORY_ANALYSIS_MAX_FILE_BYTES: int = 1_000_000
+    # Changed files from which one tarball download beats per-blob requests
+    REPOSITORY_ARCHIVE_MIN_FILES: int = 20
+    # cached_files index larger than this moves to the repositoryFiles collection
+    REPOSITORY_INLINE_INDEX_MAX_BYTES: int = 1_000_000
+    # Worker processes for CPU-bound file analysis (None: one per core, 0: inline)
+    ANALYSIS_PROCESS_WORKERS: Optional[int] = None
+    ANALYSIS_BATCH_FILES: int = 64
+    ANALYSIS_FILE_TIMEOUT_SECONDS: float = 5.0
+
+    # Skill profiles: full rebuilds correcting drift in the incremental totals
+    SKILL_RECONCILE_INTERVAL_SECONDS: int = 24 * 60 * 60  # max profile staleness
+    SKILL_RECONCILE_EVERY_SECONDS: int = 600  # how often the job runs
+    SKILL_RECONCILE_BATCH_SIZE: int = 500
+
     # AI Services
     OPENAI_API_KEY: Optional[str] = None
     ANTHROPIC_API_KEY: Optional[str] = None
 
+    # Translation
+    TRANSLATION_PROVIDER: str = "openai"  # openai | fake
+    TRANSLATION_MODEL: str = "gpt-4o-mini"
+    TRANSLATION_MODEL_VERSION: str = "v1"
+    TRANSLATION_CACHE_BACKEND: str = "mongo"  # mongo | redis | none
+    TRANSLATION_CACHE_MEMORY_ENTRIES: int = 2000
+    TRANSLATION_CACHE_TTL_SECONDS: int = 30 * 24 * 60 * 60
+    BATCH_TRANSLATION_CONCURRENCY: int = 8
+    BATCH_TRANSLATION_FLUSH_SIZE: int = 25
+    BATCH_TRANSLATION_MAX_FILE_BYTES: int = 200_000
+
+    # Learning paths
+    CURRICULUM_PROVIDER: str = "openai"  # openai | fake
+    CURRICULUM_MODEL: str = "gpt-4o-mini"
+    CURRICULUM_MODEL_VERSION: str = "v1"
+    CURRICULUM_TEMPLATE_TTL_SECONDS: int = 90 * 24 * 60 * 60
+    # Lessons are skipped when the user already has all of their skills
+    LEARNING_SKIP_PROFICIENCY: float = 7.0
+    # Job priority when the curriculum template is already cached (cheap jobs)
+    LEARNING_PATH_CACHED_PRIORITY: int = 8
+    LEARNING_PATH_PRIORITY: int = 5
+
     # Frontend
     FRONTEND_URL: str = "http://localhost:3000"
 
@@ -33,6 +122,23 @@ class Settings(BaseSettings):
     JWT_SECRET_KEY: str
     JWT_ALGORITHM: str = "HS256"
     JWT_EXPIRATION_HOURS: int = 24 * 7  # 1 week
+    JWT_CACHE_MAX_ENTRIES: int = 10000
+
+    # Token revocation (logout)
+    TOKEN_REVOCATION_BACKEND: str = "memory"  # memory | redis
+    TOKEN_REVOCATION_BLOOM_CAPACITY: int = 100000
+    TOKEN_REVOCATION_BLOOM_ERROR_RATE: float = 0.001
+
+    # User cache (0 disables)
+    USER_CACHE_TTL_SECONDS: float = 5.0
+    USER_CACHE_MAX_ENTRIES: int = 10000
+
+    # Dashboard overview cache (TTL 0 disables)
+    DASHBOARD_CACHE_BACKEND: str = "memory"  # memory | redis
+    DASHBOARD_CACHE_TTL_SECONDS: float = 30.0
+    DASHBOARD_CACHE_MAX_ENTRIES: int = 10000
+    DASHBOARD_RECENT_TRANSLATIONS: int = 5
+    DASHBOARD_ACTIVE_LEARNING_PATHS: int = 5
 
     class Config:
         env_file = ".env"
@@ -0,0 +1,18 @@
+# backend/src/core/openai_client.py
+from .config import settings
+
+_client = None
+
+
+def get_openai_client():
+    """Shared AsyncOpenAI client (one connection pool per process)
+
+    Created on first use, so importing the providers without OPENAI_API_KEY
+    set doesn't fail.
+    """
+    global _client
+    if _client is None:
+        from openai import AsyncOpenAI
+
+        _client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
+    return _client
@@ -0,0 +1,45 @@
+# backend/src/core/process_pool.py
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Optional
+
+from .config import settings
+
+_pool: Optional[ProcessPoolExecutor] = None
+
+
+def get_process_pool() -> Optional[ProcessPoolExecutor]:
+    """Shared pool for CPU-bound analysis, or None when ANALYSIS_PROCESS_WORKERS=0"""
+    global _pool
+    if settings.ANALYSIS_PROCESS_WORKERS == 0:
+        return None
+    if _pool is None:
+        # spawn: children must not inherit the parent's event loop or sockets
+        _pool = ProcessPoolExecutor(
+            max_workers=settings.ANALYSIS_PROCESS_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _pool
+
+
+async def run_in_process(fn: Callable[..., Any], *args: Any) -> Any:
+    """Run a picklable function in the shared pool (inline when it is disabled)"""
+    pool = get_process_pool()
+    if pool is None:
+        return fn(*args)
+    try:
+        return await asyncio.get_running_loop().run_in_executor(pool, fn, *args)
+    except BrokenProcessPool:
+        # A worker died (OOM, segfault); start a fresh pool for the next call
+        close_process_pool()
+        raise
+
+
+def close_process_pool():
+    """Shut down the shared pool, dropping queued work"""
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
@@ -0,0 +1,22 @@
+# backend/src/core/redis.py
+from .config import settings
+
+_client = None
+
+
+def get_redis():
+    """Shared asyncio Redis client (one connection pool per process)"""
+    global _client
+    if _client is None:
+        import redis.asyncio as redis
+
+        _client = redis.from_url(settings.REDIS_URL)
+    return _client
+
+
+async def close_redis():
+    """Close the shared Redis client"""
+    global _client
+    if _client is not None:
+        await _client.close()
+        _client = None
@@ -0,0 +1,231 @@
+# backend/src/core/revocation.py
+import asyncio
+import hashlib
+import heapq
+import math
+import time
+from abc import ABC, abstractmethod
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .config import settings
+from .redis import get_redis
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over strings (no false negatives)"""
+
+    def __init__(self, capacity: int, error_rate: float):
+        self.capacity = capacity
+        self.size = max(8, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, item: str) -> Iterable[int]:
+        # Double hashing: k positions from two 64-bit halves of one digest
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hash_count))
+
+    def add(self, item: str):
+        for position in self._positions(item):
+            self.bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, item: str) -> bool:
+        return all(
+            self.bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(item)
+        )
+
+
+class RevocationStore(ABC):
+    """Authoritative set of revoked token IDs (`jti`), each kept until token expiry"""
+
+    @abstractmethod
+    async def revoke(self, jti: str, expires_at: float):
+        ...
+
+    @abstractmethod
+    async def is_revoked(self, jti: str) -> bool:
+        ...
+
+    @abstractmethod
+    async def active(self) -> List[str]:
+        """All currently revoked, unexpired token IDs"""
+
+
+class MemoryRevocationStore(RevocationStore):
+    """Single-process store; a min-heap on expiry evicts entries as tokens expire"""
+
+    def __init__(self):
+        self._revoked: Dict[str, float] = {}
+        self._expiries: List[Tuple[float, str]] = []
+
+    def _evict_expired(self):
+        now = time.time()
+        while self._expiries and self._expiries[0][0] <= now:
+            expires_at, jti = heapq.heappop(self._expiries)
+            if self._revoked.get(jti) == expires_at:
+                del self._revoked[jti]
+
+    async def revoke(self, jti: str, expires_at: float):
+        self._evict_expired()
+        self._revoked[jti] = expires_at
+        heapq.heappush(self._expiries, (expires_at, jti))
+
+    async def is_revoked(self, jti: str) -> bool:
+        expires_at = self._revoked.get(jti)
+        return expires_at is not None and expires_at > time.time()
+
+    async def active(self) -> List[str]:
+        self._evict_expired()
+        return list(self._revoked)
+
+
+class RedisRevocationStore(RevocationStore):
+    """Store shared across workers; keys expire with the token (EXAT)"""
+
+    prefix = "revoked:"
+    channel = "revoked_tokens"
+
+    def __init__(self):
+        self.redis = get_redis()
+
+    async def revoke(self, jti: str, expires_at: float):
+        await self.redis.set(self.prefix + jti, 1, exat=int(math.ceil(expires_at)))
+        await self.redis.publish(self.channel, jti)
+
+    async def is_revoked(self, jti: str) -> bool:
+        return bool(await self.redis.exists(self.prefix + jti))
+
+    async def active(self) -> List[str]:
+        return [
+            key.decode()[len(self.prefix) :]
+            async for key in self.redis.scan_iter(match=self.prefix + "*", count=1000)
+        ]
+
+
+class TokenRevocationList:
+    """Revocation checks with a local Bloom filter in front of the store
+
+    Every revoked `jti` is added to the filter, so a miss is a definite
+    "not revoked" and the common case never leaves the process. With the
+    Redis store, revocations from other workers arrive over pub/sub (see
+    `listen`) and `rebuild` reloads the filter from the store, which also
+    drops expired entries that would otherwise raise the false-positive rate.
+    Whenever the filter is not known to be complete (before `start`, or
+    while the pub/sub connection is down) every lookup goes to the store.
+    """
+
+    def __init__(
+        self,
+        store: RevocationStore,
+        capacity: int,
+        error_rate: float,
+        reconnect_delay: float = 1.0,
+    ):
+        self.store = store
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.reconnect_delay = reconnect_delay
+        self.bloom = BloomFilter(capacity, error_rate)
+        self._listener: Optional[asyncio.Task] = None
+        self._started = False
+        # IDs added while a rebuild is reading the store, replayed into the new
+        # filter so they can't be lost in the swap
+        self._rebuild_adds: Optional[List[str]] = None
+
+    def _add(self, jti: str):
+        self.bloom.add(jti)
+        if self._rebuild_adds is not None:
+            self._rebuild_adds.append(jti)
+
+    async def revoke(self, jti: str, expires_at: float):
+        self._add(jti)
+        await self.store.revoke(jti, expires_at)
+        if self.bloom.count > self.bloom.capacity:
+            await self.rebuild()
+
+    async def is_revoked(self, jti: str) -> bool:
+        if self._started and jti not in self.bloom:
+            return False
+        return await self.store.is_revoked(jti)
+
+    async def rebuild(self):
+        """Rebuild the filter from the store's unexpired revocations"""
+        self._rebuild_adds = adds = []
+        try:
+            active = await self.store.active()
+        finally:
+            self._rebuild_adds = None
+        bloom = BloomFilter(max(self.capacity, len(active) * 2), self.error_rate)
+        for jti in (*active, *adds):
+            bloom.add(jti)
+        self.bloom = bloom
+
+    async def start(self):
+        """Load existing revocations and follow other workers' revocations
+
+        With Redis, loading happens in `listen` once subscribed; lookups use
+        the store until then.
+        """
+        if isinstance(self.store, RedisRevocationStore):
+            if self._listener is None:
+                self._listener = asyncio.create_task(self.listen())
+            return
+        await self.rebuild()
+        self._started = True
+
+    async def stop(self):
+        """Stop following revocations; lookups go to the store again"""
+        self._started = False
+        if self._listener:
+            self._listener.cancel()
+            self._listener = None
+
+    async def listen(self):
+        """Follow other workers' revocations, reconnecting when the link drops
+
+        Each connection subscribes before reloading the filter, so a
+        revocation published during the reload is still delivered.
+        """
+        delay = self.reconnect_delay
+        while True:
+            pubsub = self.store.redis.pubsub()
+            try:
+                await pubsub.subscribe(RedisRevocationStore.channel)
+                await self.rebuild()
+                self._started = True
+                delay = self.reconnect_delay
+                async for message in pubsub.listen():
+                    if message["type"] == "message":
+                        self._add(message["data"].decode())
+            except Exception as e:
+                print(f"⚠️ Token revocation listener error: {e}")
+            finally:
+                # Revocations may be missed until resubscribed and reloaded
+                self._started = False
+                try:
+                    await pubsub.reset()
+                except Exception:
+                    pass
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 30.0)
+
+
+def create_revocation_list() -> TokenRevocationList:
+    """Build the revocation list selected by TOKEN_REVOCATION_BACKEND"""
+    if settings.TOKEN_REVOCATION_BACKEND == "redis":
+        store = RedisRevocationStore()
+    else:
+        store = MemoryRevocationStore()
+    return TokenRevocationList(
+        store,
+        settings.TOKEN_REVOCATION_BLOOM_CAPACITY,
+        settings.TOKEN_REVOCATION_BLOOM_ERROR_RATE,
+    )
+
+
+revocation_list = create_revocation_list()
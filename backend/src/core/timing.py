@@ -0,0 +1,23 @@
+# backend/src/core/timing.py
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator
+
+
+class StepTimer:
+    """Records wall-clock duration of named steps within a request"""
+
+    def __init__(self):
+        self.steps: Dict[str, float] = {}
+
+    @contextmanager
+    def step(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.steps[name] = (time.perf_counter() - start) * 1000
+
+    def server_timing(self) -> str:
+        """Format steps as a Server-Timing header value (durations in ms)"""
+        return ", ".join(f"{name};dur={ms:.1f}" for name, ms in self.steps.items())
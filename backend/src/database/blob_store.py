@@ -0,0 +1,191 @@
+# backend/src/database/blob_store.py
+import asyncio
+import hashlib
+import os
+import tempfile
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Dict, Iterable, Optional
+
+from bson import Binary
+from gridfs.errors import FileExists, NoFile
+from pymongo.errors import DuplicateKeyError
+
+from ..core.config import settings
+from .compression import field_codec
+from .connection import db
+
+
+def content_hash(data: bytes) -> str:
+    """Blob reference: SHA-256 hex digest of the content"""
+    return hashlib.sha256(data).hexdigest()
+
+
+class BlobNotFound(Exception):
+    """Raised when a referenced blob is missing from the store"""
+
+
+class BlobStore(ABC):
+    """Content-addressed store for large payloads kept out of hot documents
+
+    References are content hashes, so identical content (the same lesson
+    for many users, the same source file in many translations) is stored
+    once and writes are idempotent.
+    """
+
+    @abstractmethod
+    async def put(self, data: bytes) -> str:
+        """Store content (no-op if already present) and return its reference"""
+
+    @abstractmethod
+    async def get_many(self, refs: Iterable[str]) -> Dict[str, bytes]:
+        """{ref: content} for the refs found, in one round trip where possible"""
+
+    async def get(self, ref: str) -> bytes:
+        blobs = await self.get_many([ref])
+        if ref not in blobs:
+            raise BlobNotFound(ref)
+        return blobs[ref]
+
+
+class MongoBlobStore(BlobStore):
+    """Blobs as documents in a separate content collection (up to ~16 MB each)
+
+    Content is stored with field-level compression (source text shrinks
+    several times); the reference is the hash of the uncompressed bytes.
+    """
+
+    def __init__(self, collection_name: str = "blobs"):
+        self.collection_name = collection_name
+
+    @property
+    def collection(self):
+        return db.db[self.collection_name]
+
+    async def put(self, data: bytes) -> str:
+        ref = content_hash(data)
+        try:
+            await self.collection.update_one(
+                {"_id": ref},
+                {
+                    "$setOnInsert": {
+                        "data": field_codec.compress_value(Binary(data)),
+                        "size": len(data),
+                        "created_at": datetime.utcnow(),
+                    }
+                },
+                upsert=True,
+            )
+        except DuplicateKeyError:
+            # A concurrent put of the same content won the upsert
+            pass
+        return ref
+
+    async def get_many(self, refs: Iterable[str]) -> Dict[str, bytes]:
+        refs = list(set(refs))
+        if not refs:
+            return {}
+        return {
+            doc["_id"]: bytes(field_codec.decompress_value(doc["data"]))
+            async for doc in self.collection.find(
+                {"_id": {"$in": refs}}, {"data": 1}
+            )
+        }
+
+
+class GridFSBlobStore(BlobStore):
+    """Blobs in a GridFS bucket, for content beyond the document size limit"""
+
+    def __init__(self, bucket_name: str = "blobs"):
+        self.bucket_name = bucket_name
+        self._bucket = None
+
+    @property
+    def bucket(self):
+        if self._bucket is None:
+            from motor.motor_asyncio import AsyncIOMotorGridFSBucket
+
+            self._bucket = AsyncIOMotorGridFSBucket(
+                db.db, bucket_name=self.bucket_name
+            )
+        return self._bucket
+
+    async def put(self, data: bytes) -> str:
+        ref = content_hash(data)
+        files = db.db[f"{self.bucket_name}.files"]
+        if await files.find_one({"_id": ref}, {"_id": 1}) is None:
+            try:
+                await self.bucket.upload_from_stream_with_id(ref, ref, data)
+            except FileExists:
+                pass
+        return ref
+
+    async def _read(self, ref: str) -> Optional[bytes]:
+        try:
+            stream = await self.bucket.open_download_stream(ref)
+        except NoFile:
+            return None
+        return await stream.read()
+
+    async def get_many(self, refs: Iterable[str]) -> Dict[str, bytes]:
+        refs = list(set(refs))
+        contents = await asyncio.gather(*(self._read(ref) for ref in refs))
+        return {
+            ref: content for ref, content in zip(refs, contents) if content is not None
+        }
+
+
+class LocalBlobStore(BlobStore):
+    """Blobs as files under a directory (tests, single-host development)"""
+
+    def __init__(self, root: str):
+        self.root = root
+
+    def _path(self, ref: str) -> str:
+        return os.path.join(self.root, ref[:2], ref[2:])
+
+    def _write(self, ref: str, data: bytes):
+        path = self._path(ref)
+        if os.path.exists(path):
+            return
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Write then rename, so readers never see a partial blob
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path))
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+    def _read_many(self, refs: Iterable[str]) -> Dict[str, bytes]:
+        blobs = {}
+        for ref in set(refs):
+            try:
+                with open(self._path(ref), "rb") as f:
+                    blobs[ref] = f.read()
+            except FileNotFoundError:
+                pass
+        return blobs
+
+    async def put(self, data: bytes) -> str:
+        ref = content_hash(data)
+        await asyncio.to_thread(self._write, ref, data)
+        return ref
+
+    async def get_many(self, refs: Iterable[str]) -> Dict[str, bytes]:
+        return await asyncio.to_thread(self._read_many, list(refs))
+
+
+def create_blob_store() -> BlobStore:
+    """Build the store selected by BLOB_STORE_BACKEND"""
+    backend = settings.BLOB_STORE_BACKEND
+    if backend == "gridfs":
+        return GridFSBlobStore()
+    if backend == "local":
+        return LocalBlobStore(settings.BLOB_STORE_PATH)
+    return MongoBlobStore()
+
+
+blob_store = create_blob_store()
@@ -0,0 +1,136 @@
+# backend/src/database/compression.py
+import zlib
+from typing import Any, Dict, List, Sequence
+
+import bson
+from bson import Binary
+
+from ..core.config import settings
+
+# User-defined BSON binary subtype marking a compressed field value; the
+# payload is a one-byte codec tag followed by the compressed BSON {"v": value}
+COMPRESSED_SUBTYPE = 0x80
+_TAGS = {"zlib": b"z", "zstd": b"s"}
+
+# Wire compressor -> module it needs
+_WIRE_COMPRESSORS = {"zstd": "zstandard", "snappy": "snappy", "zlib": None}
+
+
+def _importable(module: str) -> bool:
+    try:
+        __import__(module)
+    except ImportError:
+        return False
+    return True
+
+
+def available_compressors(names: str) -> List[str]:
+    """The comma-separated wire compressors whose libraries are installed"""
+    available = []
+    for name in (n.strip().lower() for n in names.split(",")):
+        if name not in _WIRE_COMPRESSORS:
+            continue
+        module = _WIRE_COMPRESSORS[name]
+        if module is None or _importable(module):
+            available.append(name)
+    return available
+
+
+class FieldCodec:
+    """Compresses designated document fields above a size threshold
+
+    Values are stored as tagged binaries at their own path, so projections
+    that include or exclude the field keep working; values that don't
+    shrink, or are below `min_bytes` encoded, stay plain.
+    """
+
+    def __init__(self, codec: str, min_bytes: int, level: int):
+        if codec == "zstd" and not _importable("zstandard"):
+            codec = "zlib"
+        self.codec = codec
+        self.min_bytes = min_bytes
+        self.level = level
+
+    def _compress(self, raw: bytes) -> bytes:
+        if self.codec == "zstd":
+            import zstandard
+
+            return zstandard.ZstdCompressor(level=self.level).compress(raw)
+        return zlib.compress(raw, self.level)
+
+    @staticmethod
+    def _decompress(tag: bytes, data: bytes) -> bytes:
+        if tag == _TAGS["zstd"]:
+            import zstandard
+
+            return zstandard.ZstdDecompressor().decompress(data)
+        if tag == _TAGS["zlib"]:
+            return zlib.decompress(data)
+        raise Exception(f"Unknown field compression tag {tag!r}")
+
+    def compress_value(self, value: Any) -> Any:
+        if value is None or isinstance(value, (bool, int, float)):
+            return value
+        raw = bson.encode({"v": value})
+        if len(raw) < self.min_bytes:
+            return value
+        compressed = _TAGS[self.codec] + self._compress(raw)
+        if len(compressed) >= len(raw):
+            return value
+        return Binary(compressed, COMPRESSED_SUBTYPE)
+
+    def decompress_value(self, value: Any) -> Any:
+        if not isinstance(value, Binary) or value.subtype != COMPRESSED_SUBTYPE:
+            return value
+        raw = self._decompress(value[:1], value[1:])
+        return bson.decode(raw)["v"]
+
+    def compress_fields(
+        self, data: Dict[str, Any], paths: Sequence[str]
+    ) -> Dict[str, Any]:
+        """Copy of a document or $set dict with the given dotted paths compressed
+
+        A path may appear as a nested field ({"source": {"code": ...}}) or as
+        a dotted key ({"source.code": ...}); the caller's dict is not changed.
+        """
+        result = data
+        for path in paths:
+            parts = path.split(".")
+            for i in range(len(parts), 0, -1):
+                key = ".".join(parts[:i])
+                if key in result:
+                    if result is data:
+                        result = dict(data)
+                    result[key] = self._compress_in(result[key], parts[i:])
+                    break
+        return result
+
+    def _compress_in(self, value: Any, parts: List[str]) -> Any:
+        if not parts:
+            return self.compress_value(value)
+        if not isinstance(value, dict) or parts[0] not in value:
+            return value
+        return {**value, parts[0]: self._compress_in(value[parts[0]], parts[1:])}
+
+    def decompress_fields(self, document: Any, paths: Sequence[str]) -> Any:
+        """Decompress the given dotted paths of a read document in place"""
+        if not isinstance(document, dict):
+            return document
+        for path in paths:
+            *parents, leaf = path.split(".")
+            container = document
+            for part in parents:
+                container = container.get(part)
+                if not isinstance(container, dict):
+                    break
+            else:
+                if leaf in container:
+                    container[leaf] = self.decompress_value(container[leaf])
+        return document
+
+
+field_codec = FieldCodec(
+    settings.FIELD_COMPRESSION_CODEC,
+    settings.FIELD_COMPRESSION_MIN_BYTES,
+    settings.FIELD_COMPRESSION_LEVEL,
+)
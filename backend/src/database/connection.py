@@ -3,6 +3,8 @@ from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
 from typing import Optional
 import os
 from ..core.config import settings
+from ..core.revocation import revocation_list
+from .compression import available_compressors
 
 
 class Database:
@@ -15,16 +17,40 @@ db = Database()
 
 async def connect_db():
     """Create database connection"""
-    db.client = AsyncIOMotorClient(settings.MONGODB_URI)
+    options = {}
+    compressors = available_compressors(settings.MONGODB_COMPRESSORS)
+    if compressors:
+        # The server picks the first one it also supports
+        options["compressors"] = compressors
+        options["zlibCompressionLevel"] = settings.MONGODB_ZLIB_COMPRESSION_LEVEL
+    db.client = AsyncIOMotorClient(settings.MONGODB_URI, **options)
     db.db = db.client[settings.MONGODB_DB_NAME]
 
     # Test connection
     await db.client.admin.command("ping")
-    print(f"✅ Connected to MongoDB: {settings.MONGODB_DB_NAME}")
+    print(
+        f"✅ Connected to MongoDB: {settings.MONGODB_DB_NAME} "
+        f"(compressors: {', '.join(compressors) or 'none'})"
+    )
+
+    # Imported here: repositories depend on this module's `db`
+    from .indexes import ensure_indexes, verify_query_plans
+
+    if settings.MONGODB_ENSURE_INDEXES:
+        await ensure_indexes()
+        print("✅ MongoDB indexes ensured")
+
+    if settings.MONGODB_VERIFY_QUERY_PLANS:
+        await verify_query_plans()
+        print("✅ MongoDB query plans verified (no collection scans)")
+
+    # Token checks fall through to the store until the Bloom filter is loaded
+    await revocation_list.start()
 
 
 async def close_db():
     """Close database connection"""
+    await revocation_list.stop()
     if db.client:
         db.client.close()
         print("❌ Disconnected from MongoDB")
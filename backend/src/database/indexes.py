@@ -0,0 +1,150 @@
+# backend/src/database/indexes.py
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional
+from .repositories import all_repositories
+
+
+class QueryPlanError(Exception):
+    """Raised when a repository query resolves to a collection scan"""
+
+
+async def ensure_indexes() -> Dict[str, List[str]]:
+    """Create every repository's declared indexes (idempotent)"""
+    created = {}
+    for repo in all_repositories:
+        created[repo.collection_name] = await repo.ensure_indexes()
+    return created
+
+
+class RecordedCursor:
+    """Cursor stand-in that yields nothing but keeps the sort it was given"""
+
+    def __init__(self, query: Dict[str, Any]):
+        self.query = query
+
+    def sort(self, sort: List[tuple]) -> "RecordedCursor":
+        self.query["sort"] = sort
+        return self
+
+    def skip(self, skip: int) -> "RecordedCursor":
+        return self
+
+    def limit(self, limit: int) -> "RecordedCursor":
+        return self
+
+    async def to_list(self, length: Optional[int] = None) -> List[Any]:
+        return []
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        raise StopAsyncIteration
+
+
+class QueryRecorder:
+    """Collection stand-in that records the filter and sort of each query
+
+    Reads match nothing and writes change nothing, so repository methods can
+    be called without touching data.
+    """
+
+    def __init__(self):
+        self.queries: List[Dict[str, Any]] = []
+
+    def _record(self, filter: Optional[Dict[str, Any]], sort=None) -> Dict[str, Any]:
+        query = {"filter": filter or {}, "sort": sort}
+        self.queries.append(query)
+        return query
+
+    def _write_result(self) -> SimpleNamespace:
+        return SimpleNamespace(
+            acknowledged=True,
+            matched_count=0,
+            modified_count=0,
+            deleted_count=0,
+            upserted_id=None,
+        )
+
+    def find(self, filter=None, projection=None, **kwargs) -> RecordedCursor:
+        return RecordedCursor(self._record(filter, kwargs.get("sort")))
+
+    async def find_one(self, filter=None, projection=None, **kwargs):
+        self._record(filter, kwargs.get("sort"))
+        return None
+
+    async def find_one_and_update(self, filter, update, **kwargs):
+        self._record(filter, kwargs.get("sort"))
+        return None
+
+    async def update_one(self, filter, update, **kwargs):
+        self._record(filter)
+        return self._write_result()
+
+    async def update_many(self, filter, update, **kwargs):
+        self._record(filter)
+        return self._write_result()
+
+    async def delete_many(self, filter, **kwargs):
+        self._record(filter)
+        return self._write_result()
+
+    async def count_documents(self, filter, **kwargs) -> int:
+        self._record(filter)
+        return 0
+
+
+def _plan_stages(plan: Any) -> List[str]:
+    """Collect every stage name in an explain() plan tree"""
+    stages = []
+    if isinstance(plan, dict):
+        if "stage" in plan:
+            stages.append(plan["stage"])
+        for value in plan.values():
+            stages.extend(_plan_stages(value))
+    elif isinstance(plan, list):
+        for item in plan:
+            stages.extend(_plan_stages(item))
+    return stages
+
+
+async def record_plan_queries(repo) -> Dict[str, Dict[str, Any]]:
+    """Run a repository's plan checks and return the queries they issue by name
+
+    A check that sends several queries gets one entry per query, suffixed
+    with its position (`name#1`, `name#2`, ...).
+    """
+    queries = {}
+    for check in repo.plan_checks():
+        recorder = QueryRecorder()
+        await check["run"](repo.with_collection(recorder))
+        name = f"{repo.collection_name}.{check['name']}"
+        if not recorder.queries:
+            raise QueryPlanError(f"{name} issued no queries")
+        if len(recorder.queries) == 1:
+            queries[name] = recorder.queries[0]
+            continue
+        for i, query in enumerate(recorder.queries, 1):
+            queries[f"{name}#{i}"] = query
+    return queries
+
+
+async def verify_query_plans() -> Dict[str, List[str]]:
+    """Explain every repository query and fail if any winning plan is a COLLSCAN"""
+    plans = {}
+    failures = []
+    for repo in all_repositories:
+        for key, query in (await record_plan_queries(repo)).items():
+            cursor = repo.collection.find(query["filter"])
+            if query["sort"]:
+                cursor = cursor.sort(query["sort"])
+            explain = await cursor.explain()
+            stages = _plan_stages(explain["queryPlanner"]["winningPlan"])
+
+            plans[key] = stages
+            if "COLLSCAN" in stages:
+                failures.append(key)
+
+    if failures:
+        raise QueryPlanError(f"Collection scan in: {', '.join(failures)}")
+    return plans
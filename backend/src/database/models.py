@@ -1,14 +1,20 @@
 # backend/src/database/models.py
 from datetime import datetime
 from typing import List, Dict, Optional, Any
-from pydantic import BaseModel, Field, EmailStr
+from pydantic import BaseModel, ConfigDict, Field, EmailStr
+from pydantic_core import core_schema
 from bson import ObjectId
 
 
 class PyObjectId(ObjectId):
     @classmethod
-    def __get_validators__(cls):
-        yield cls.validate
+    def __get_pydantic_core_schema__(cls, source_type, handler):
+        return core_schema.no_info_plain_validator_function(
+            cls.validate,
+            serialization=core_schema.plain_serializer_function_ser_schema(
+                str, when_used="json"
+            ),
+        )
 
     @classmethod
     def validate(cls, v):
@@ -17,8 +23,8 @@ class PyObjectId(ObjectId):
         return ObjectId(v)
 
     @classmethod
-    def __modify_schema__(cls, field_schema):
-        field_schema.update(type="string")
+    def __get_pydantic_json_schema__(cls, schema, handler):
+        return {"type": "string"}
 
 
 class MongoModel(BaseModel):
@@ -26,28 +32,30 @@ class MongoModel(BaseModel):
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
 
-    class Config:
-        allow_population_by_field_name = True
-        arbitrary_types_allowed = True
-        json_encoders = {ObjectId: str}
-        schema_extra = {
+    model_config = ConfigDict(
+        populate_by_name=True,
+        arbitrary_types_allowed=True,
+        # Allows the `model_version` fields on cache and template documents
+        protected_namespaces=(),
+        json_schema_extra={
             "example": {
                 "_id": "507f1f77bcf86cd799439011",
                 "created_at": "2023-12-01T00:00:00",
                 "updated_at": "2023-12-01T00:00:00",
             }
-        }
+        },
+    )
 
 
 # User Model
 class User(MongoModel):
-    github_id: str = Field(..., unique=True)
+    github_id: str = Field(..., json_schema_extra={"unique": True})
     username: str
     email: EmailStr
     avatar_url: Optional[str] = None
 
     # Account details
-    plan: str = Field(default="free", regex="^(free|pro|enterprise)$")
+    plan: str = Field(default="free", pattern="^(free|pro|enterprise)$")
     github_access_token: Optional[str] = None
 
     # Related IDs
@@ -70,7 +78,7 @@ class Repository(MongoModel):
 
     # Analysis status
     status: str = Field(
-        default="pending", regex="^(pending|analyzing|completed|failed)$"
+        default="pending", pattern="^(pending|analyzing|completed|failed)$"
     )
     analyzed_at: Optional[datetime] = None
 
@@ -84,7 +92,22 @@ class Repository(MongoModel):
 
     # Cache
     last_commit_sha: Optional[str] = None
+    # Per-file analysis index from the last analyzed commit:
+    # {"storage": "inline", "files": [[path, blob_sha, result], ...]} or
+    # {"storage": "external", "count": n} with entries in `repositoryFiles`
     cached_files: Optional[Dict[str, Any]] = None
+    # Technologies last folded into the owner's SkillProfile:
+    # [{"technology", "category", "lines"}], None if never applied
+    skill_contribution: Optional[List[Dict[str, Any]]] = None
+
+
+class RepositoryFile(MongoModel):
+    """Out-of-document analysis index entry for large repositories"""
+
+    repository_id: PyObjectId
+    path: str
+    sha: str
+    result: Dict[str, Any] = Field(default_factory=dict)
 
 
 # Skill Profile Model
@@ -119,31 +142,40 @@ class SkillProfile(MongoModel):
         }
     )
 
+    # Bumped by every incremental update; guards derived-field writes
+    revision: int = 0
+    reconciled_at: Optional[datetime] = None
+
 
 # Translation Model
 class Translation(MongoModel):
     user_id: PyObjectId
 
-    # Source
+    # Source and target: large `code` is moved to the blob store and
+    # replaced by a `code_ref` content hash
     source: Dict[str, Any] = Field(
         ...,
-        example={
-            "framework": "nextjs",
-            "language": "javascript",
-            "code": "// source code here",
-            "packages": ["next", "react"],
-        },
+        examples=[
+            {
+                "framework": "nextjs",
+                "language": "javascript",
+                "code": "// source code here",
+                "packages": ["next", "react"],
+            }
+        ],
     )
 
     # Target
     target: Dict[str, Any] = Field(
         ...,
-        example={
-            "framework": "vite-react",
-            "language": "typescript",
-            "code": "// translated code here",
-            "packages": ["vite", "react", "react-router-dom"],
-        },
+        examples=[
+            {
+                "framework": "vite-react",
+                "language": "typescript",
+                "code": "// translated code here",
+                "packages": ["vite", "react", "react-router-dom"],
+            }
+        ],
     )
 
     # Metadata
@@ -157,11 +189,29 @@ class Translation(MongoModel):
         }
     )
 
+    # Batch origin (repository translation jobs)
+    repository_id: Optional[PyObjectId] = None
+    job_id: Optional[PyObjectId] = None
+
     # Analytics
     feedback: Optional[Dict[str, Any]] = None
     execution_time: Optional[float] = None
 
 
+class TranslationCacheEntry(MongoModel):
+    # Content hash of normalized source + frameworks + model version
+    key: str
+    source_framework: str
+    target_framework: str
+    model_version: str
+
+    target: Dict[str, Any]
+    metadata: Dict[str, Any] = Field(default_factory=dict)
+
+    hits: int = 0
+    last_hit_at: Optional[datetime] = None
+
+
 # Learning Path Model
 class Lesson(BaseModel):
     id: str
@@ -173,6 +223,11 @@ class Lesson(BaseModel):
     examples: List[Dict[str, Any]] = Field(default_factory=list)
     exercises: List[Dict[str, Any]] = Field(default_factory=list)
     estimated_time: int  # minutes
+    # Set when content/examples/exercises were moved to the blob store
+    body_ref: Optional[str] = None
+    # Technologies the lesson teaches; personalization skips lessons whose
+    # skills the user already has
+    skills: List[str] = Field(default_factory=list)
     completed: bool = False
     completed_at: Optional[datetime] = None
 
@@ -183,10 +238,10 @@ class LearningPath(MongoModel):
 
     # Learning configuration
     from_technology: Dict[str, Any] = Field(
-        ..., example={"technology": "nextjs", "current_proficiency": 7.5}
+        ..., examples=[{"technology": "nextjs", "current_proficiency": 7.5}]
     )
     to_technology: Dict[str, Any] = Field(
-        ..., example={"technology": "vite-react", "target_proficiency": 8.0}
+        ..., examples=[{"technology": "vite-react", "target_proficiency": 8.0}]
     )
 
     # Curriculum
@@ -196,7 +251,10 @@ class LearningPath(MongoModel):
 
     # Progress
     progress: float = Field(default=0.0, ge=0, le=100)
-    status: str = Field(default="active", regex="^(active|completed|paused|abandoned)$")
+    status: str = Field(
+        default="active",
+        pattern="^(generating|active|completed|paused|abandoned|failed)$",
+    )
     started_at: Optional[datetime] = None
     completed_at: Optional[datetime] = None
 
@@ -205,6 +263,30 @@ class LearningPath(MongoModel):
     time_commitment: Optional[str] = None
     deadline: Optional[datetime] = None
 
+    # Generation: the shared curriculum template it was personalized from
+    job_id: Optional[PyObjectId] = None
+    template_key: Optional[str] = None
+    personalization: Dict[str, Any] = Field(default_factory=dict)
+
+
+class CurriculumTemplate(MongoModel):
+    """Lesson skeleton shared by every path for the same technology pair"""
+
+    # Content hash of from/to technology, difficulty, learning style and model
+    key: str
+    from_technology: str
+    to_technology: str
+    difficulty: str
+    learning_style: Optional[str] = None
+    model_version: str
+
+    title: str
+    lessons: List[Lesson] = Field(default_factory=list)
+    estimated_hours: float = 0.0
+
+    hits: int = 0
+    last_hit_at: Optional[datetime] = None
+
 
 # Analysis Job Model
 class AnalysisJob(MongoModel):
@@ -212,11 +294,12 @@ class AnalysisJob(MongoModel):
     repository_id: Optional[PyObjectId] = None
 
     # Job info
-    type: str  # 'repository' | 'translation' | 'skill_assessment'
+    type: str  # 'repository' | 'translation' | 'skill_assessment' | 'learning_path'
     status: str = Field(
-        default="queued", regex="^(queued|processing|completed|failed)$"
+        default="queued", pattern="^(queued|processing|completed|failed)$"
     )
     priority: int = Field(default=5, ge=1, le=10)
+    params: Dict[str, Any] = Field(default_factory=dict)
 
     # Progress
     progress: Dict[str, Any] = Field(
@@ -240,6 +323,8 @@ class AnalysisJob(MongoModel):
     # Worker info
     worker_id: Optional[str] = None
     worker_host: Optional[str] = None
+    lease_expires_at: Optional[datetime] = None
+    available_at: Optional[datetime] = None  # earliest time a retry may be claimed
 
     # Error handling
     error: Optional[Dict[str, Any]] = None
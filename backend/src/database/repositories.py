@@ -1,29 +1,159 @@
 # backend/src/database/repositories.py
-from typing import List, Optional, Dict, Any
-from datetime import datetime
+from typing import AsyncIterator, List, Optional, Dict, Any, Tuple, Union
+from datetime import datetime, timedelta
+import asyncio
+import base64
+import copy
+import json
 from bson import ObjectId
 from motor.motor_asyncio import AsyncIOMotorCollection
+from pymongo import (
+    ASCENDING,
+    DESCENDING,
+    DeleteOne,
+    IndexModel,
+    InsertOne,
+    ReturnDocument,
+    UpdateOne,
+)
+from pymongo.errors import BulkWriteError, DuplicateKeyError, OperationFailure
+from ..core.cache import LRUCache
+from ..core.config import settings
+from .compression import field_codec
 from .connection import db
 from .models import (
     User,
     Repository,
+    RepositoryFile,
     SkillProfile,
     Translation,
+    TranslationCacheEntry,
     LearningPath,
+    CurriculumTemplate,
     AnalysisJob,
 )
 
+# A projection preset name (see BaseRepository.projections) or a raw projection
+Projection = Optional[Union[str, Dict[str, int]]]
+
+# Server error codes for an existing index with the same name or keys but
+# different options (e.g. a TTL changed in settings)
+INDEX_CONFLICT_CODES = {85, 86}
+
+# index_information() fields that aren't compared as options ("background" is
+# a no-op since MongoDB 4.2)
+INDEX_FIELDS = {"key", "name", "v", "ns", "background"}
+
 
 class BaseRepository:
     """Base repository with common CRUD operations"""
 
     model_class = None
     collection_name = None
+    indexes: List[IndexModel] = []
+    # Field(s) identifying a document for upsert_many
+    natural_key: Optional[Union[str, List[str]]] = None
+    # Named projection presets, e.g. "summary" for list views
+    projections: Dict[str, Dict[str, int]] = {}
+    # Large (dotted-path) fields compressed on create/update and decompressed
+    # on find; only writes and reads through the base methods are covered
+    compressed_fields: List[str] = []
+    # Set on copies made by with_collection
+    _collection: Optional[Any] = None
 
     @property
     def collection(self) -> AsyncIOMotorCollection:
+        if self._collection is not None:
+            return self._collection
         return db.db[self.collection_name]
 
+    def with_collection(self, collection: Any) -> "BaseRepository":
+        """Shallow copy of this repository that sends its queries to `collection`"""
+        repo = copy.copy(self)
+        repo._collection = collection
+        return repo
+
+    def compress(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Copy of a document or $set dict with `compressed_fields` compressed"""
+        if not self.compressed_fields:
+            return data
+        return field_codec.compress_fields(data, self.compressed_fields)
+
+    def decompress(
+        self, document: Optional[Dict[str, Any]]
+    ) -> Optional[Dict[str, Any]]:
+        """Decompress `compressed_fields` of a read document in place"""
+        if document is None or not self.compressed_fields:
+            return document
+        return field_codec.decompress_fields(document, self.compressed_fields)
+
+    async def ensure_indexes(self) -> List[str]:
+        """Create declared indexes (no-op for ones that already exist)
+
+        An existing index whose options no longer match its declaration is
+        updated in place when only its TTL changed, and rebuilt otherwise.
+        """
+        if not self.indexes:
+            return []
+        try:
+            return await self.collection.create_indexes(self.indexes)
+        except OperationFailure as e:
+            if e.code not in INDEX_CONFLICT_CODES:
+                raise
+        await self.sync_index_options()
+        return await self.collection.create_indexes(self.indexes)
+
+    async def sync_index_options(self) -> List[str]:
+        """Bring existing indexes in line with declared options; returns names
+
+        A changed `expireAfterSeconds` is applied with collMod; any other
+        difference drops the index so it can be recreated.
+        """
+        existing = await self.collection.index_information()
+        changed = []
+        for index in self.indexes:
+            declared = index.document
+            keys = list(declared["key"].items())
+            name = declared["name"]
+            if name not in existing:
+                # The same keys may already be indexed under another name
+                name = next(
+                    (n for n, info in existing.items() if list(info["key"]) == keys),
+                    None,
+                )
+                if name is None:
+                    continue
+            info = existing[name]
+            same_index = name == declared["name"] and list(info["key"]) == keys
+            options = {k: v for k, v in declared.items() if k not in INDEX_FIELDS}
+            current = {k: v for k, v in info.items() if k not in INDEX_FIELDS}
+            if same_index and options == current:
+                continue
+
+            ttl = options.pop("expireAfterSeconds", None)
+            current.pop("expireAfterSeconds", None)
+            if same_index and ttl is not None and options == current:
+                await self.collection.database.command(
+                    "collMod",
+                    self.collection_name,
+                    index={"name": name, "expireAfterSeconds": ttl},
+                )
+                print(f"⚠️ Updated TTL of {self.collection_name}.{name} to {ttl}s")
+            else:
+                await self.collection.drop_index(name)
+                print(f"⚠️ Dropped {self.collection_name}.{name} to rebuild it")
+            changed.append(name)
+        return changed
+
+    def plan_checks(self) -> List[Dict[str, Any]]:
+        """Representative calls of this repository's query methods
+
+        Each check is `{"name", "run"}`, where `run(repo)` calls query methods
+        on the repository it is given; verify_query_plans records the queries
+        they send and explains them, so the checks follow the methods.
+        """
+        return []
+
     async def create(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Create a new document"""
         if "created_at" not in data:
@@ -31,17 +161,41 @@ class BaseRepository:
         if "updated_at" not in data:
             data["updated_at"] = datetime.utcnow()
 
-        result = await self.collection.insert_one(data)
+        stored = self.compress(data)
+        result = await self.collection.insert_one(stored)
         data["_id"] = result.inserted_id
         return data
 
-    async def find_by_id(self, id: str) -> Optional[Dict[str, Any]]:
+    def resolve_projection(self, projection: Projection) -> Optional[Dict[str, int]]:
+        """Resolve a projection preset name or pass an explicit projection through"""
+        if projection is None or isinstance(projection, dict):
+            return projection
+        if projection not in self.projections:
+            raise ValueError(
+                f"Unknown projection '{projection}' for {self.collection_name}"
+            )
+        # Copy so drivers that annotate the projection can't alter the preset
+        return dict(self.projections[projection])
+
+    async def find_by_id(
+        self, id: str, projection: Projection = None
+    ) -> Optional[Dict[str, Any]]:
         """Find document by ID"""
-        return await self.collection.find_one({"_id": ObjectId(id)})
+        return self.decompress(
+            await self.collection.find_one(
+                {"_id": ObjectId(id)}, self.resolve_projection(projection)
+            )
+        )
 
-    async def find_one(self, filter: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    async def find_one(
+        self,
+        filter: Dict[str, Any],
+        projection: Projection = None,
+    ) -> Optional[Dict[str, Any]]:
         """Find one document matching filter"""
-        return await self.collection.find_one(filter)
+        return self.decompress(
+            await self.collection.find_one(filter, self.resolve_projection(projection))
+        )
 
     async def find_many(
         self,
@@ -49,17 +203,96 @@ class BaseRepository:
         skip: int = 0,
         limit: int = 100,
         sort: Optional[List[tuple]] = None,
+        projection: Projection = None,
     ) -> List[Dict[str, Any]]:
         """Find multiple documents"""
-        cursor = self.collection.find(filter).skip(skip).limit(limit)
+        cursor = (
+            self.collection.find(filter, self.resolve_projection(projection))
+            .skip(skip)
+            .limit(limit)
+        )
         if sort:
             cursor = cursor.sort(sort)
-        return await cursor.to_list(length=limit)
+        return [self.decompress(d) for d in await cursor.to_list(length=limit)]
+
+    # Keyset pagination order: newest first, _id breaks created_at ties
+    page_sort = [("created_at", DESCENDING), ("_id", DESCENDING)]
+
+    @staticmethod
+    def encode_cursor(document: Dict[str, Any]) -> str:
+        """Build an opaque continuation token from the last document of a page"""
+        raw = json.dumps(
+            {"c": document["created_at"].isoformat(), "i": str(document["_id"])}
+        )
+        return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+    @staticmethod
+    def decode_cursor(token: str) -> Dict[str, Any]:
+        """Turn a continuation token into a filter for the rows after it"""
+        try:
+            padded = token + "=" * (-len(token) % 4)
+            raw = json.loads(base64.urlsafe_b64decode(padded.encode()))
+            created_at = datetime.fromisoformat(raw["c"])
+            _id = ObjectId(raw["i"])
+        except Exception:
+            raise ValueError("Invalid pagination cursor")
+        return {
+            "$or": [
+                {"created_at": {"$lt": created_at}},
+                {"created_at": created_at, "_id": {"$lt": _id}},
+            ]
+        }
+
+    async def find_page(
+        self,
+        filter: Dict[str, Any] = {},
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        projection: Projection = None,
+    ) -> Dict[str, Any]:
+        """Find one keyset page ordered by (created_at, _id) descending"""
+        query = {"$and": [filter, self.decode_cursor(cursor)]} if cursor else filter
+        fields = self.resolve_projection(projection)
+        if fields and any(fields.values()):
+            # Inclusion projections must keep the keyset fields for the cursor
+            fields = {**fields, "created_at": 1}
+        documents = (
+            await self.collection.find(query, fields)
+            .sort(self.page_sort)
+            .limit(limit + 1)
+            .to_list(length=limit + 1)
+        )
+        has_more = len(documents) > limit
+        items = [self.decompress(document) for document in documents[:limit]]
+        return {
+            "items": items,
+            "next_cursor": self.encode_cursor(items[-1]) if has_more else None,
+        }
+
+    async def iter_many(
+        self,
+        filter: Dict[str, Any] = {},
+        batch_size: int = 500,
+        projection: Projection = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream every matching document in keyset-ordered batches"""
+        cursor = None
+        while True:
+            page = await self.find_page(
+                filter, limit=batch_size, cursor=cursor, projection=projection
+            )
+            for document in page["items"]:
+                yield document
+            cursor = page["next_cursor"]
+            if not cursor:
+                return
 
     async def update_by_id(self, id: str, data: Dict[str, Any]) -> bool:
         """Update document by ID"""
         data["updated_at"] = datetime.utcnow()
-        result = await self.collection.update_one({"_id": ObjectId(id)}, {"$set": data})
+        result = await self.collection.update_one(
+            {"_id": ObjectId(id)}, {"$set": self.compress(data)}
+        )
         return result.modified_count > 0
 
     async def delete_by_id(self, id: str) -> bool:
@@ -71,10 +304,184 @@ class BaseRepository:
         """Count documents matching filter"""
         return await self.collection.count_documents(filter)
 
+    async def bulk_write(
+        self, operations: List[Any], ordered: bool = False
+    ) -> Dict[str, Any]:
+        """Run a batch of write operations, reporting failures per item"""
+        if not operations:
+            return {
+                "inserted": 0,
+                "matched": 0,
+                "modified": 0,
+                "upserted_ids": {},
+                "errors": [],
+            }
+        try:
+            result = await self.collection.bulk_write(operations, ordered=ordered)
+            details = result.bulk_api_result
+        except BulkWriteError as e:
+            details = e.details
+        return {
+            "inserted": details.get("nInserted", 0),
+            "matched": details.get("nMatched", 0),
+            "modified": details.get("nModified", 0),
+            "upserted_ids": {
+                item["index"]: item["_id"] for item in details.get("upserted", [])
+            },
+            "errors": [
+                {
+                    "index": error["index"],
+                    "code": error.get("code"),
+                    "message": error.get("errmsg"),
+                }
+                for error in details.get("writeErrors", [])
+            ],
+        }
+
+    async def create_many(
+        self, documents: List[Dict[str, Any]], ordered: bool = False
+    ) -> Dict[str, Any]:
+        """Insert many documents in one round trip"""
+        now = datetime.utcnow()
+        for document in documents:
+            document.setdefault("_id", ObjectId())
+            document.setdefault("created_at", now)
+            document.setdefault("updated_at", now)
+
+        result = await self.bulk_write(
+            [InsertOne(self.compress(document)) for document in documents],
+            ordered=ordered,
+        )
+        failed = {error["index"] for error in result["errors"]}
+        result["documents"] = [
+            document for i, document in enumerate(documents) if i not in failed
+        ]
+        return result
+
+    async def upsert_many(
+        self,
+        documents: List[Dict[str, Any]],
+        key: Optional[Union[str, List[str]]] = None,
+    ) -> Dict[str, Any]:
+        """Insert or update many documents matched on a natural key"""
+        keys = key or self.natural_key
+        if not keys:
+            raise ValueError(f"No natural key for {self.collection_name} upserts")
+        if isinstance(keys, str):
+            keys = [keys]
+
+        now = datetime.utcnow()
+        operations = []
+        for document in documents:
+            data = {k: v for k, v in document.items() if k not in ("_id", "created_at")}
+            data["updated_at"] = now
+            data = self.compress(data)
+            operations.append(
+                UpdateOne(
+                    {k: document[k] for k in keys},
+                    {"$set": data, "$setOnInsert": {"created_at": now}},
+                    upsert=True,
+                )
+            )
+        return await self.bulk_write(operations)
+
 
 class UserRepository(BaseRepository):
     model_class = User
     collection_name = "users"
+    natural_key = "github_id"
+    indexes = [
+        IndexModel([("github_id", ASCENDING)], unique=True),
+        IndexModel([("username", ASCENDING)]),
+    ]
+    projections = {
+        "summary": {
+            "username": 1,
+            "email": 1,
+            "avatar_url": 1,
+            "plan": 1,
+            "created_at": 1,
+            "skill_profile_id": 1,
+        },
+    }
+
+    def __init__(self):
+        # Short-TTL, per-process cache; writes through this repository invalidate
+        # it locally and the TTL bounds staleness from other processes' writes
+        self.cache: Optional[LRUCache] = None
+        if settings.USER_CACHE_TTL_SECONDS > 0:
+            self.cache = LRUCache(
+                settings.USER_CACHE_MAX_ENTRIES, ttl=settings.USER_CACHE_TTL_SECONDS
+            )
+
+    def invalidate(self, id: Optional[str] = None):
+        """Drop a cached user, or every cached user when no ID is given"""
+        if self.cache is None:
+            return
+        if id is None:
+            self.cache.clear()
+        else:
+            self.cache.delete(str(id))
+
+    async def find_by_id_cached(
+        self, id: str, projection: Projection = None
+    ) -> Optional[Dict[str, Any]]:
+        """Find user by ID through the short-TTL user cache"""
+        if self.cache is None:
+            return await self.find_by_id(id, projection)
+
+        variant = (
+            projection
+            if projection is None or isinstance(projection, str)
+            else tuple(sorted(projection.items()))
+        )
+        variants = self.cache.get(id)
+        if variants is None:
+            variants = {}
+            self.cache.set(id, variants)
+        if variant not in variants:
+            variants[variant] = await self.find_by_id(id, projection)
+        user = variants[variant]
+        return dict(user) if user else None
+
+    # Writes invalidate again once complete: a read that raced the write may
+    # have re-cached the old document in the meantime
+    async def update_by_id(self, id: str, data: Dict[str, Any]) -> bool:
+        self.invalidate(id)
+        try:
+            return await super().update_by_id(id, data)
+        finally:
+            self.invalidate(id)
+
+    async def delete_by_id(self, id: str) -> bool:
+        self.invalidate(id)
+        try:
+            return await super().delete_by_id(id)
+        finally:
+            self.invalidate(id)
+
+    async def upsert_many(
+        self,
+        documents: List[Dict[str, Any]],
+        key: Optional[Union[str, List[str]]] = None,
+    ) -> Dict[str, Any]:
+        self.invalidate()
+        try:
+            return await super().upsert_many(documents, key)
+        finally:
+            self.invalidate()
+
+    def plan_checks(self) -> List[Dict[str, Any]]:
+        return [
+            {
+                "name": "find_by_github_id",
+                "run": lambda repo: repo.find_by_github_id("0"),
+            },
+            {
+                "name": "find_by_username",
+                "run": lambda repo: repo.find_by_username("octocat"),
+            },
+        ]
 
     async def find_by_github_id(self, github_id: str) -> Optional[Dict[str, Any]]:
         """Find user by GitHub ID"""
@@ -84,6 +491,37 @@ class UserRepository(BaseRepository):
         """Find user by username"""
         return await self.find_one({"username": username})
 
+    async def upsert_github_user(
+        self, github_id: str, data: Dict[str, Any]
+    ) -> Tuple[Dict[str, Any], bool]:
+        """Create or update a user by GitHub ID in one round trip
+
+        New users get a pre-allocated ``skill_profile_id``; returns the user
+        and whether it was just created. The profile itself is created by the
+        caller (see ``SkillProfileRepository.ensure_for_user``).
+        """
+        now = datetime.utcnow()
+        skill_profile_id = ObjectId()
+        user = await self.collection.find_one_and_update(
+            {"github_id": github_id},
+            {
+                "$set": {**data, "updated_at": now},
+                "$setOnInsert": {
+                    "github_id": github_id,
+                    "plan": "free",
+                    "skill_profile_id": skill_profile_id,
+                    "repository_ids": [],
+                    "learning_path_ids": [],
+                    "preferences": {},
+                    "created_at": now,
+                },
+            },
+            upsert=True,
+            return_document=ReturnDocument.AFTER,
+        )
+        self.invalidate(str(user["_id"]))
+        return user, user.get("skill_profile_id") == skill_profile_id
+
     async def update_last_login(self, user_id: str) -> bool:
         """Update user's last login time"""
         return await self.update_by_id(user_id, {"last_login": datetime.utcnow()})
@@ -92,28 +530,212 @@ class UserRepository(BaseRepository):
 class RepositoryRepository(BaseRepository):
     model_class = Repository
     collection_name = "repositories"
+    natural_key = "github_url"
+    projections = {"summary": {"cached_files": 0}}
+    compressed_fields = ["cached_files"]
+    indexes = [
+        IndexModel([("github_url", ASCENDING)], unique=True),
+        IndexModel(
+            [("user_id", ASCENDING), ("created_at", DESCENDING), ("_id", DESCENDING)]
+        ),
+        IndexModel(
+            [
+                ("user_id", ASCENDING),
+                ("status", ASCENDING),
+                ("created_at", DESCENDING),
+                ("_id", DESCENDING),
+            ]
+        ),
+    ]
 
-    async def find_by_user(
-        self, user_id: str, status: Optional[str] = None
-    ) -> List[Dict[str, Any]]:
-        """Find repositories by user ID"""
+    def plan_checks(self) -> List[Dict[str, Any]]:
+        user_id = str(ObjectId())
+        return [
+            {"name": "find_by_user", "run": lambda repo: repo.find_by_user(user_id)},
+            {
+                "name": "find_by_user(status)",
+                "run": lambda repo: repo.find_by_user(user_id, "completed"),
+            },
+            {
+                "name": "find_page_by_user",
+                "run": lambda repo: repo.find_page_by_user(user_id),
+            },
+            {
+                "name": "find_by_github_url",
+                "run": lambda repo: repo.find_by_github_url(
+                    "https://github.com/octocat/hello-world"
+                ),
+            },
+        ]
+
+    def _user_filter(self, user_id: str, status: Optional[str]) -> Dict[str, Any]:
         filter = {"user_id": ObjectId(user_id)}
         if status:
             filter["status"] = status
-        return await self.find_many(filter, sort=[("created_at", -1)])
+        return filter
+
+    async def find_by_user(
+        self,
+        user_id: str,
+        status: Optional[str] = None,
+        limit: int = 100,
+        projection: Projection = None,
+    ) -> List[Dict[str, Any]]:
+        """Find repositories by user ID"""
+        return await self.find_many(
+            self._user_filter(user_id, status),
+            limit=limit,
+            sort=self.page_sort,
+            projection=projection,
+        )
+
+    async def find_page_by_user(
+        self,
+        user_id: str,
+        status: Optional[str] = None,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        projection: Projection = None,
+    ) -> Dict[str, Any]:
+        """Find one keyset page of a user's repositories"""
+        return await self.find_page(
+            self._user_filter(user_id, status),
+            limit=limit,
+            cursor=cursor,
+            projection=projection,
+        )
+
+    def iter_by_user(
+        self,
+        user_id: str,
+        status: Optional[str] = None,
+        batch_size: int = 500,
+        projection: Projection = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream all of a user's repositories"""
+        return self.iter_many(
+            self._user_filter(user_id, status), batch_size, projection
+        )
 
     async def find_by_github_url(self, github_url: str) -> Optional[Dict[str, Any]]:
         """Find repository by GitHub URL"""
         return await self.find_one({"github_url": github_url})
 
+    async def count_by_status(self, user_id: str) -> Dict[str, int]:
+        """{status: repository count} for one user (an index-only $group)"""
+        counts = {}
+        async for row in self.collection.aggregate(
+            [
+                {"$match": {"user_id": ObjectId(user_id)}},
+                {"$group": {"_id": "$status", "count": {"$sum": 1}}},
+            ]
+        ):
+            counts[row["_id"]] = row["count"]
+        return counts
+
+
+class RepositoryFileRepository(BaseRepository):
+    model_class = RepositoryFile
+    collection_name = "repositoryFiles"
+    indexes = [
+        IndexModel([("repository_id", ASCENDING), ("path", ASCENDING)], unique=True)
+    ]
+
+    def plan_checks(self) -> List[Dict[str, Any]]:
+        return [
+            {"name": "load_index", "run": lambda repo: repo.load_index(ObjectId())}
+        ]
+
+    async def load_index(self, repository_id: ObjectId) -> Dict[str, tuple]:
+        """Map of path -> (blob sha, result) for a repository"""
+        cursor = self.collection.find(
+            {"repository_id": repository_id}, {"path": 1, "sha": 1, "result": 1}
+        )
+        return {
+            entry["path"]: (entry["sha"], entry.get("result", {}))
+            async for entry in cursor
+        }
+
+    async def apply_changes(
+        self,
+        repository_id: ObjectId,
+        changed: Dict[str, tuple],
+        removed: List[str],
+    ) -> Dict[str, Any]:
+        """Upsert changed entries and delete removed paths in one bulk write"""
+        now = datetime.utcnow()
+        operations = [
+            UpdateOne(
+                {"repository_id": repository_id, "path": path},
+                {
+                    "$set": {"sha": sha, "result": result, "updated_at": now},
+                    "$setOnInsert": {"created_at": now},
+                },
+                upsert=True,
+            )
+            for path, (sha, result) in changed.items()
+        ]
+        operations.extend(
+            DeleteOne({"repository_id": repository_id, "path": path})
+            for path in removed
+        )
+        return await self.bulk_write(operations)
+
+    async def delete_index(self, repository_id: ObjectId) -> int:
+        result = await self.collection.delete_many({"repository_id": repository_id})
+        return result.deleted_count
+
 
 class SkillProfileRepository(BaseRepository):
     model_class = SkillProfile
     collection_name = "skillProfiles"
+    indexes = [
+        IndexModel([("user_id", ASCENDING)], unique=True),
+        IndexModel([("reconciled_at", ASCENDING)]),
+    ]
 
-    async def find_by_user(self, user_id: str) -> Optional[Dict[str, Any]]:
+    def plan_checks(self) -> List[Dict[str, Any]]:
+        return [
+            {
+                "name": "find_by_user",
+                "run": lambda repo: repo.find_by_user(str(ObjectId())),
+            },
+            {
+                "name": "find_due_for_reconcile",
+                "run": lambda repo: repo.find_due_for_reconcile(
+                    datetime.utcnow(), 100
+                ),
+            },
+        ]
+
+    async def find_by_user(
+        self, user_id: str, projection: Projection = None
+    ) -> Optional[Dict[str, Any]]:
         """Find skill profile by user ID"""
-        return await self.find_one({"user_id": ObjectId(user_id)})
+        return await self.find_one({"user_id": ObjectId(user_id)}, projection)
+
+    async def ensure_for_user(self, profile_id: ObjectId, user_id: ObjectId) -> bool:
+        """Create an empty profile with this ID unless it exists; True if created"""
+        now = datetime.utcnow()
+        try:
+            result = await self.collection.update_one(
+                {"_id": profile_id},
+                {
+                    "$setOnInsert": {
+                        "user_id": user_id,
+                        "skills": [],
+                        "strengths": [],
+                        "learning_velocity": {},
+                        "created_at": now,
+                        "updated_at": now,
+                    }
+                },
+                upsert=True,
+            )
+        except DuplicateKeyError:
+            # The user already has a profile under another ID
+            return False
+        return result.upserted_id is not None
 
     async def update_skills(
         self, profile_id: str, skills: List[Dict[str, Any]]
@@ -121,63 +743,903 @@ class SkillProfileRepository(BaseRepository):
         """Update skills in profile"""
         return await self.update_by_id(profile_id, {"skills": skills})
 
+    async def add_missing_skills(
+        self, profile_id: ObjectId, skills: List[Dict[str, Any]]
+    ) -> bool:
+        """Push new skill entries, unless another writer added one of them first"""
+        result = await self.collection.update_one(
+            {
+                "_id": profile_id,
+                "skills.technology": {"$nin": [s["technology"] for s in skills]},
+            },
+            {"$push": {"skills": {"$each": skills}}},
+        )
+        return result.modified_count > 0
+
+    async def apply_skill_deltas(
+        self,
+        profile_id: ObjectId,
+        deltas: List[Dict[str, Any]],
+        repositories_delta: int,
+        now: datetime,
+    ) -> Optional[Dict[str, Any]]:
+        """Atomically $inc per-skill counters; returns the updated profile
+
+        Each delta is {technology, projects, lines}; the matching skills must
+        already exist (see `add_missing_skills`). Bumps `revision` so derived
+        fields computed from an older state can be detected and discarded.
+        """
+        inc: Dict[str, Any] = {
+            "revision": 1,
+            "metrics.total_repositories": repositories_delta,
+        }
+        last_used: Dict[str, Any] = {}
+        array_filters = []
+        for i, delta in enumerate(deltas):
+            skill = f"skills.$[s{i}]"
+            inc[f"{skill}.experience.project_count"] = delta["projects"]
+            inc[f"{skill}.experience.total_lines"] = delta["lines"]
+            if delta["projects"] >= 0:
+                last_used[f"{skill}.experience.last_used"] = now
+            array_filters.append({f"s{i}.technology": delta["technology"]})
+
+        update: Dict[str, Any] = {"$inc": inc, "$set": {"updated_at": now}}
+        if last_used:
+            update["$max"] = last_used
+        return await self.collection.find_one_and_update(
+            {"_id": profile_id},
+            update,
+            array_filters=array_filters or None,
+            return_document=ReturnDocument.AFTER,
+        )
+
+    async def prune_skills(self, profile_id: ObjectId, technologies: List[str]):
+        """Drop skills no repository contributes to any more"""
+        await self.collection.update_one(
+            {"_id": profile_id},
+            {
+                "$pull": {
+                    "skills": {
+                        "technology": {"$in": technologies},
+                        "experience.project_count": {"$lte": 0},
+                    }
+                }
+            },
+        )
+
+    async def set_derived(
+        self,
+        profile_id: ObjectId,
+        revision: int,
+        skills: List[Dict[str, Any]],
+        metrics: Dict[str, Any],
+        strengths: List[str],
+    ) -> bool:
+        """Write recomputed proficiency/confidence and profile-level metrics
+
+        Only applies if the profile is still at `revision`; on a concurrent
+        update the caller recomputes from the newer state.
+        `metrics.total_repositories` is left to `apply_skill_deltas`.
+        """
+        fields: Dict[str, Any] = {f"metrics.{k}": v for k, v in metrics.items()}
+        fields["strengths"] = strengths
+        array_filters = []
+        for i, skill in enumerate(skills):
+            fields[f"skills.$[d{i}].proficiency"] = skill["proficiency"]
+            fields[f"skills.$[d{i}].confidence"] = skill["confidence"]
+            array_filters.append({f"d{i}.technology": skill["technology"]})
+        result = await self.collection.update_one(
+            {"_id": profile_id, "revision": revision},
+            {"$set": fields},
+            array_filters=array_filters or None,
+        )
+        return result.matched_count > 0
+
+    def _due_filter(self, before: datetime) -> Dict[str, Any]:
+        return {
+            "$or": [{"reconciled_at": None}, {"reconciled_at": {"$lt": before}}]
+        }
+
+    async def find_due_for_reconcile(
+        self, before: datetime, limit: int
+    ) -> List[Dict[str, Any]]:
+        """Profiles last reconciled before `before` (never-reconciled first)"""
+        return await self.find_many(
+            self._due_filter(before),
+            limit=limit,
+            sort=[("reconciled_at", ASCENDING)],
+        )
+
+    async def replace_aggregates(
+        self,
+        profile_id: ObjectId,
+        revision: Optional[int],
+        skills: List[Dict[str, Any]],
+        metrics: Dict[str, Any],
+        strengths: List[str],
+        now: datetime,
+    ) -> bool:
+        """Overwrite skills and metrics from a full recomputation
+
+        Guarded by `revision` like `set_derived`, so a reconcile never
+        clobbers a delta applied while it was summing repositories.
+        """
+        result = await self.collection.update_one(
+            {"_id": profile_id, "revision": revision},
+            {
+                "$set": {
+                    "skills": skills,
+                    "metrics": metrics,
+                    "strengths": strengths,
+                    "reconciled_at": now,
+                    "updated_at": now,
+                },
+                "$inc": {"revision": 1},
+            },
+        )
+        return result.matched_count > 0
+
 
 class TranslationRepository(BaseRepository):
     model_class = Translation
     collection_name = "translations"
+    projections = {
+        "summary": {
+            "source.code": 0,
+            "source.code_ref": 0,
+            "target.code": 0,
+            "target.code_ref": 0,
+        }
+    }
+    compressed_fields = ["source.code", "target.code"]
+    indexes = [
+        IndexModel(
+            [("user_id", ASCENDING), ("created_at", DESCENDING), ("_id", DESCENDING)]
+        ),
+        IndexModel(
+            [
+                ("user_id", ASCENDING),
+                ("source.framework", ASCENDING),
+                ("target.framework", ASCENDING),
+                ("created_at", DESCENDING),
+                ("_id", DESCENDING),
+            ]
+        ),
+        IndexModel(
+            [("job_id", ASCENDING), ("created_at", DESCENDING), ("_id", DESCENDING)],
+            sparse=True,
+        ),
+    ]
 
-    async def find_by_user(
+    def plan_checks(self) -> List[Dict[str, Any]]:
+        user_id = str(ObjectId())
+        return [
+            {"name": "find_by_user", "run": lambda repo: repo.find_by_user(user_id)},
+            {
+                "name": "find_by_user(frameworks)",
+                "run": lambda repo: repo.find_by_user(user_id, "nextjs", "vite-react"),
+            },
+            {
+                "name": "find_page_by_user",
+                "run": lambda repo: repo.find_page_by_user(user_id),
+            },
+        ]
+
+    def _user_filter(
         self,
         user_id: str,
-        source_framework: Optional[str] = None,
-        target_framework: Optional[str] = None,
-    ) -> List[Dict[str, Any]]:
-        """Find translations by user with optional framework filters"""
+        source_framework: Optional[str],
+        target_framework: Optional[str],
+    ) -> Dict[str, Any]:
         filter = {"user_id": ObjectId(user_id)}
         if source_framework:
             filter["source.framework"] = source_framework
         if target_framework:
             filter["target.framework"] = target_framework
-        return await self.find_many(filter, sort=[("created_at", -1)])
+        return filter
+
+    async def find_by_user(
+        self,
+        user_id: str,
+        source_framework: Optional[str] = None,
+        target_framework: Optional[str] = None,
+        limit: int = 100,
+        projection: Projection = None,
+    ) -> List[Dict[str, Any]]:
+        """Find translations by user with optional framework filters"""
+        return await self.find_many(
+            self._user_filter(user_id, source_framework, target_framework),
+            limit=limit,
+            sort=self.page_sort,
+            projection=projection,
+        )
+
+    async def find_page_by_user(
+        self,
+        user_id: str,
+        source_framework: Optional[str] = None,
+        target_framework: Optional[str] = None,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        projection: Projection = None,
+    ) -> Dict[str, Any]:
+        """Find one keyset page of a user's translations"""
+        return await self.find_page(
+            self._user_filter(user_id, source_framework, target_framework),
+            limit=limit,
+            cursor=cursor,
+            projection=projection,
+        )
+
+    def iter_by_user(
+        self,
+        user_id: str,
+        source_framework: Optional[str] = None,
+        target_framework: Optional[str] = None,
+        batch_size: int = 500,
+        projection: Projection = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream all of a user's translations"""
+        return self.iter_many(
+            self._user_filter(user_id, source_framework, target_framework),
+            batch_size,
+            projection,
+        )
+
+    async def summarize_by_user(
+        self, user_id: str, recent: int = 5, top_targets: int = 5
+    ) -> Dict[str, Any]:
+        """Totals, most common target frameworks and the latest translations
+
+        One $facet pass over the user's translations; `recent` items use the
+        summary projection (no code).
+        """
+        rows = await self.collection.aggregate(
+            [
+                {"$match": {"user_id": ObjectId(user_id)}},
+                {
+                    "$facet": {
+                        "totals": [
+                            {
+                                "$group": {
+                                    "_id": None,
+                                    "count": {"$sum": 1},
+                                    "avg_execution_time": {
+                                        "$avg": "$execution_time"
+                                    },
+                                }
+                            }
+                        ],
+                        "targets": [
+                            {
+                                "$group": {
+                                    "_id": "$target.framework",
+                                    "count": {"$sum": 1},
+                                }
+                            },
+                            {"$sort": {"count": -1, "_id": 1}},
+                            {"$limit": top_targets},
+                        ],
+                        "recent": [
+                            {"$sort": dict(self.page_sort)},
+                            {"$limit": recent},
+                            {"$project": self.projections["summary"]},
+                        ],
+                    }
+                },
+            ]
+        ).to_list(1)
+        facets = rows[0] if rows else {}
+        totals = (facets.get("totals") or [{}])[0]
+        return {
+            "total": totals.get("count", 0),
+            "avg_execution_time": totals.get("avg_execution_time"),
+            "top_targets": [
+                {"framework": row["_id"], "count": row["count"]}
+                for row in facets.get("targets", [])
+            ],
+            "recent": facets.get("recent", []),
+        }
+
+
+class TranslationCacheRepository(BaseRepository):
+    model_class = TranslationCacheEntry
+    collection_name = "translationCache"
+    indexes = [
+        IndexModel([("key", ASCENDING)], unique=True),
+        IndexModel(
+            [("last_hit_at", ASCENDING)],
+            expireAfterSeconds=settings.TRANSLATION_CACHE_TTL_SECONDS,
+        ),
+    ]
+
+    def plan_checks(self) -> List[Dict[str, Any]]:
+        return [{"name": "find_by_key", "run": lambda repo: repo.find_by_key("0" * 64)}]
+
+    async def find_by_key(self, key: str) -> Optional[Dict[str, Any]]:
+        """Find a cached translation and record the hit"""
+        now = datetime.utcnow()
+        return await self.collection.find_one_and_update(
+            {"key": key},
+            {"$inc": {"hits": 1}, "$set": {"last_hit_at": now}},
+            projection={"target": 1, "metadata": 1},
+        )
+
+    async def store(self, key: str, entry: Dict[str, Any]) -> bool:
+        """Insert or refresh a cached translation"""
+        now = datetime.utcnow()
+        result = await self.collection.update_one(
+            {"key": key},
+            {
+                "$set": {**entry, "last_hit_at": now, "updated_at": now},
+                "$setOnInsert": {"key": key, "hits": 0, "created_at": now},
+            },
+            upsert=True,
+        )
+        return result.acknowledged
 
 
 class LearningPathRepository(BaseRepository):
     model_class = LearningPath
     collection_name = "learningPaths"
+    projections = {
+        "summary": {
+            "lessons.content": 0,
+            "lessons.examples": 0,
+            "lessons.exercises": 0,
+        },
+    }
+    indexes = [
+        IndexModel(
+            [
+                ("user_id", ASCENDING),
+                ("status", ASCENDING),
+                ("created_at", DESCENDING),
+                ("_id", DESCENDING),
+            ]
+        ),
+    ]
+
+    def plan_checks(self) -> List[Dict[str, Any]]:
+        return [
+            {
+                "name": "find_active_by_user",
+                "run": lambda repo: repo.find_active_by_user(str(ObjectId())),
+            }
+        ]
 
-    async def find_active_by_user(self, user_id: str) -> List[Dict[str, Any]]:
+    async def find_active_by_user(
+        self, user_id: str, limit: int = 100, projection: Projection = None
+    ) -> List[Dict[str, Any]]:
         """Find active learning paths for user"""
         return await self.find_many(
             {"user_id": ObjectId(user_id), "status": "active"},
-            sort=[("created_at", -1)],
+            limit=limit,
+            sort=self.page_sort,
+            projection=projection,
+        )
+
+    async def find_page_active_by_user(
+        self,
+        user_id: str,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        projection: Projection = None,
+    ) -> Dict[str, Any]:
+        """Find one keyset page of a user's active learning paths"""
+        return await self.find_page(
+            {"user_id": ObjectId(user_id), "status": "active"},
+            limit=limit,
+            cursor=cursor,
+            projection=projection,
         )
 
     async def update_progress(self, path_id: str, progress: float) -> bool:
-        """Update learning path progress"""
+        """Overwrite learning path progress (`set_lesson_completed` derives it)"""
         return await self.update_by_id(path_id, {"progress": progress})
 
+    async def set_lesson_completed(
+        self, path_id: str, user_id: str, lesson_id: str, completed: bool = True
+    ) -> Optional[Dict[str, Any]]:
+        """Mark one lesson (un)completed and recompute progress and status
+
+        A single pipeline update: the lessons array is rewritten server-side,
+        so concurrent completions can't overwrite each other and no lesson
+        content is transferred. Returns the path's new progress fields, or
+        None if the user has no such path/lesson.
+        """
+        if not ObjectId.is_valid(path_id):
+            return None
+        now = datetime.utcnow()
+        # Keep the first completion time when re-completing
+        lesson_fields = {
+            "completed": completed,
+            "completed_at": (
+                {"$ifNull": ["$$this.completed_at", now]} if completed else None
+            ),
+        }
+        lessons = {
+            "$map": {
+                "input": {"$ifNull": ["$lessons", []]},
+                "in": {
+                    "$cond": [
+                        {"$eq": ["$$this.id", lesson_id]},
+                        {"$mergeObjects": ["$$this", lesson_fields]},
+                        "$$this",
+                    ]
+                },
+            }
+        }
+        done = {
+            "$size": {"$filter": {"input": "$lessons", "cond": "$$this.completed"}}
+        }
+        progress = {
+            "$round": [
+                {"$multiply": [100, {"$divide": [done, {"$size": "$lessons"}]}]},
+                1,
+            ]
+        }
+        finished = {"$eq": ["$progress", 100]}
+        status = {
+            "$switch": {
+                "branches": [
+                    {
+                        "case": {
+                            "$and": [
+                                finished,
+                                {"$in": ["$status", ["active", "paused"]]},
+                            ]
+                        },
+                        "then": "completed",
+                    },
+                    {
+                        "case": {
+                            "$and": [
+                                {"$not": [finished]},
+                                {"$eq": ["$status", "completed"]},
+                            ]
+                        },
+                        "then": "active",
+                    },
+                ],
+                "default": "$status",
+            }
+        }
+        completed_at = {
+            "$cond": [
+                {"$eq": ["$status", "completed"]},
+                {"$ifNull": ["$completed_at", now]},
+                None,
+            ]
+        }
+        # Each stage sees the fields set by the previous one
+        return await self.collection.find_one_and_update(
+            {
+                "_id": ObjectId(path_id),
+                "user_id": ObjectId(user_id),
+                "lessons.id": lesson_id,
+            },
+            [
+                {"$set": {"lessons": lessons, "updated_at": now}},
+                {"$set": {"progress": progress}},
+                {"$set": {"status": status}},
+                {"$set": {"completed_at": completed_at}},
+            ],
+            projection={"progress": 1, "status": 1, "completed_at": 1},
+            return_document=ReturnDocument.AFTER,
+        )
+
+    async def summarize_active_by_user(
+        self, user_id: str, limit: int = 10
+    ) -> Dict[str, Any]:
+        """Active path count plus progress of the most recent ones
+
+        Lesson counts are computed server-side, so lesson bodies never leave
+        the database.
+        """
+        rows = await self.collection.aggregate(
+            [
+                {"$match": {"user_id": ObjectId(user_id), "status": "active"}},
+                {"$sort": dict(self.page_sort)},
+                {
+                    "$facet": {
+                        "count": [{"$count": "value"}],
+                        "paths": [
+                            {"$limit": limit},
+                            {
+                                "$project": {
+                                    "title": 1,
+                                    "from_technology": 1,
+                                    "to_technology": 1,
+                                    "difficulty": 1,
+                                    "progress": 1,
+                                    "estimated_hours": 1,
+                                    "lessons_total": {
+                                        "$size": {"$ifNull": ["$lessons", []]}
+                                    },
+                                    "lessons_completed": {
+                                        "$size": {
+                                            "$filter": {
+                                                "input": {
+                                                    "$ifNull": ["$lessons", []]
+                                                },
+                                                "cond": "$$this.completed",
+                                            }
+                                        }
+                                    },
+                                }
+                            },
+                        ],
+                    }
+                },
+            ]
+        ).to_list(1)
+        facets = rows[0] if rows else {}
+        count = (facets.get("count") or [{}])[0]
+        return {"total": count.get("value", 0), "paths": facets.get("paths", [])}
+
+
+class CurriculumTemplateRepository(BaseRepository):
+    model_class = CurriculumTemplate
+    collection_name = "curriculumTemplates"
+    indexes = [
+        IndexModel([("key", ASCENDING)], unique=True),
+        IndexModel(
+            [("last_hit_at", ASCENDING)],
+            expireAfterSeconds=settings.CURRICULUM_TEMPLATE_TTL_SECONDS,
+        ),
+    ]
+
+    def plan_checks(self) -> List[Dict[str, Any]]:
+        return [{"name": "find_by_key", "run": lambda repo: repo.find_by_key("0" * 64)}]
+
+    async def exists(self, key: str) -> bool:
+        """Whether a template is stored (without counting a hit)"""
+        return await self.find_one({"key": key}, projection={"_id": 1}) is not None
+
+    async def find_by_key(self, key: str) -> Optional[Dict[str, Any]]:
+        """Find a template and record the hit"""
+        now = datetime.utcnow()
+        return await self.collection.find_one_and_update(
+            {"key": key},
+            {"$inc": {"hits": 1}, "$set": {"last_hit_at": now}},
+            return_document=ReturnDocument.AFTER,
+        )
+
+    async def store(self, key: str, template: Dict[str, Any]) -> Dict[str, Any]:
+        """Insert a template unless one was stored first; returns the stored one
+
+        Concurrent generations of the same key all converge on the first.
+        """
+        now = datetime.utcnow()
+        return await self.collection.find_one_and_update(
+            {"key": key},
+            {
+                "$setOnInsert": {
+                    **template,
+                    "key": key,
+                    "hits": 0,
+                    "created_at": now,
+                    "updated_at": now,
+                },
+                "$set": {"last_hit_at": now},
+            },
+            upsert=True,
+            return_document=ReturnDocument.AFTER,
+        )
+
 
 class AnalysisJobRepository(BaseRepository):
     model_class = AnalysisJob
     collection_name = "analysisJobs"
 
+    claim_sort = [("priority", -1), ("created_at", 1)]
+    projections = {"summary": {"result": 0, "error.traceback": 0}}
+    indexes = [
+        IndexModel(
+            [("priority", DESCENDING), ("created_at", ASCENDING)],
+            partialFilterExpression={"status": "queued"},
+            name="queued_by_priority",
+        ),
+        IndexModel([("status", ASCENDING), ("lease_expires_at", ASCENDING)]),
+        IndexModel([("user_id", ASCENDING), ("created_at", DESCENDING)]),
+    ]
+
+    def __init__(self):
+        self.progress_buffer = ProgressBuffer(self)
+
+    def plan_checks(self) -> List[Dict[str, Any]]:
+        return [
+            {"name": "find_pending_jobs", "run": lambda repo: repo.find_pending_jobs()},
+            {
+                "name": "claim_next_job",
+                "run": lambda repo: repo.claim_next_job("plan-check", "localhost", 60),
+            },
+            {
+                "name": "reclaim_expired_leases",
+                "run": lambda repo: repo.reclaim_expired_leases(),
+            },
+        ]
+
+    def _claimable_filter(
+        self, now: datetime, job_types: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """Filter for queued jobs whose retry backoff has elapsed"""
+        filter = {
+            "status": "queued",
+            "$or": [{"available_at": None}, {"available_at": {"$lte": now}}],
+        }
+        if job_types:
+            filter["type"] = {"$in": job_types}
+        return filter
+
     async def find_pending_jobs(self, limit: int = 10) -> List[Dict[str, Any]]:
         """Find pending jobs ordered by priority"""
         return await self.find_many(
-            {"status": "queued"},
+            self._claimable_filter(datetime.utcnow()),
             limit=limit,
-            sort=[("priority", -1), ("created_at", 1)],
+            sort=self.claim_sort,
+        )
+
+    async def claim_next_job(
+        self,
+        worker_id: str,
+        worker_host: str,
+        lease_seconds: int,
+        job_types: Optional[List[str]] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Atomically claim the highest-priority, oldest queued job"""
+        now = datetime.utcnow()
+        return await self.collection.find_one_and_update(
+            self._claimable_filter(now, job_types),
+            {
+                "$set": {
+                    "status": "processing",
+                    "worker_id": worker_id,
+                    "worker_host": worker_host,
+                    "started_at": now,
+                    "lease_expires_at": now + timedelta(seconds=lease_seconds),
+                    "updated_at": now,
+                }
+            },
+            sort=self.claim_sort,
+            return_document=ReturnDocument.AFTER,
+        )
+
+    async def renew_lease(
+        self, job_id: str, worker_id: str, lease_seconds: int
+    ) -> bool:
+        """Extend the lease on a job still owned by the worker"""
+        now = datetime.utcnow()
+        result = await self.collection.update_one(
+            {"_id": ObjectId(job_id), "status": "processing", "worker_id": worker_id},
+            {
+                "$set": {
+                    "lease_expires_at": now + timedelta(seconds=lease_seconds),
+                    "updated_at": now,
+                }
+            },
+        )
+        return result.matched_count > 0
+
+    async def complete_job(
+        self, job_id: str, worker_id: str, result: Optional[Dict[str, Any]] = None
+    ) -> bool:
+        """Mark an owned job as completed"""
+        job = await self.collection.find_one(
+            {"_id": ObjectId(job_id)}, {"started_at": 1}
+        )
+        now = datetime.utcnow()
+        data = {
+            "status": "completed",
+            "result": result,
+            "completed_at": now,
+            "lease_expires_at": None,
+            "updated_at": now,
+        }
+        if job and job.get("started_at"):
+            data["duration"] = (now - job["started_at"]).total_seconds() * 1000
+        update = await self.collection.update_one(
+            {"_id": ObjectId(job_id), "status": "processing", "worker_id": worker_id},
+            {"$set": data},
+        )
+        return update.modified_count > 0
+
+    async def fail_job(
+        self,
+        job: Dict[str, Any],
+        worker_id: str,
+        error: Dict[str, Any],
+        backoff_seconds: float,
+    ) -> bool:
+        """Requeue an owned job with backoff, or fail it once retries run out"""
+        now = datetime.utcnow()
+        retries = job.get("retries", 0) + 1
+        if retries > job.get("max_retries", 3):
+            data = {"status": "failed", "completed_at": now}
+        else:
+            data = {
+                "status": "queued",
+                "available_at": now + timedelta(seconds=backoff_seconds),
+                "worker_id": None,
+                "worker_host": None,
+            }
+        data.update(
+            {
+                "error": error,
+                "retries": retries,
+                "lease_expires_at": None,
+                "updated_at": now,
+            }
         )
+        result = await self.collection.update_one(
+            {"_id": job["_id"], "status": "processing", "worker_id": worker_id},
+            {"$set": data},
+        )
+        return result.modified_count > 0
+
+    async def reclaim_expired_leases(self) -> int:
+        """Requeue or fail processing jobs whose lease has lapsed"""
+        now = datetime.utcnow()
+        expired = {"status": "processing", "lease_expires_at": {"$lt": now}}
+        error = {"message": "Worker lease expired", "at": now}
+
+        exhausted = await self.collection.update_many(
+            {**expired, "$expr": {"$gte": ["$retries", "$max_retries"]}},
+            {
+                "$set": {
+                    "status": "failed",
+                    "error": error,
+                    "completed_at": now,
+                    "lease_expires_at": None,
+                    "updated_at": now,
+                },
+            },
+        )
+        requeued = await self.collection.update_many(
+            expired,
+            {
+                "$set": {
+                    "status": "queued",
+                    "error": error,
+                    "worker_id": None,
+                    "worker_host": None,
+                    "lease_expires_at": None,
+                    "available_at": now,
+                    "updated_at": now,
+                },
+                "$inc": {"retries": 1},
+            },
+        )
+        return exhausted.modified_count + requeued.modified_count
+
+    async def schedule_periodic(self, job_type: str, available_at: datetime) -> bool:
+        """Queue the next run of a system job unless one is already queued"""
+        now = datetime.utcnow()
+        result = await self.collection.update_one(
+            {"type": job_type, "status": "queued"},
+            {
+                "$setOnInsert": {
+                    # System jobs aren't owned by a user
+                    "user_id": None,
+                    "repository_id": None,
+                    "priority": 1,
+                    "params": {},
+                    "progress": {
+                        "percentage": 0,
+                        "current_step": "queued",
+                        "current_file": "",
+                        "steps": [],
+                        "metrics": {},
+                    },
+                    "retries": 0,
+                    "max_retries": 3,
+                    "available_at": available_at,
+                    "created_at": now,
+                    "updated_at": now,
+                }
+            },
+            upsert=True,
+        )
+        return result.upserted_id is not None
 
     async def update_progress(self, job_id: str, progress: Dict[str, Any]) -> bool:
         """Update job progress"""
         return await self.update_by_id(job_id, {"progress": progress})
 
+    def queue_progress(self, job_id: str, progress: Dict[str, Any]):
+        """Buffer a partial progress update to be written on the next flush"""
+        self.progress_buffer.add(job_id, progress)
+
+
+class ProgressBuffer:
+    """Coalesces frequent job progress updates into one bulk write per interval"""
+
+    def __init__(
+        self,
+        repo: "AnalysisJobRepository",
+        flush_interval: float = settings.JOB_PROGRESS_FLUSH_SECONDS,
+    ):
+        self.repo = repo
+        self.flush_interval = flush_interval
+        self._pending: Dict[str, Dict[str, Any]] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    def add(self, job_id: str, progress: Dict[str, Any]):
+        """Merge progress fields for a job; later values win"""
+        self._pending.setdefault(job_id, {}).update(progress)
+
+    async def flush(self) -> Dict[str, Any]:
+        """Write all pending progress as a single unordered bulk operation
+
+        If the write fails the updates are queued again (newer ones added
+        meanwhile win) for the next flush.
+        """
+        pending, self._pending = self._pending, {}
+        now = datetime.utcnow()
+        operations = [
+            UpdateOne(
+                {"_id": ObjectId(job_id)},
+                {
+                    "$set": {
+                        **{f"progress.{k}": v for k, v in progress.items()},
+                        "updated_at": now,
+                    }
+                },
+            )
+            for job_id, progress in pending.items()
+        ]
+        try:
+            return await self.repo.bulk_write(operations)
+        except Exception:
+            for job_id, progress in pending.items():
+                self._pending[job_id] = {**progress, **self._pending.get(job_id, {})}
+            raise
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await self.flush()
+            except Exception as e:
+                print(f"⚠️ Progress flush error: {e}")
+
+    def start(self):
+        """Start the periodic flush task"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """Stop the periodic flush task and write anything still pending"""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+
 
 # Initialize repositories
 user_repo = UserRepository()
 repository_repo = RepositoryRepository()
+repository_file_repo = RepositoryFileRepository()
 skill_profile_repo = SkillProfileRepository()
 translation_repo = TranslationRepository()
+translation_cache_repo = TranslationCacheRepository()
 learning_path_repo = LearningPathRepository()
+curriculum_template_repo = CurriculumTemplateRepository()
 analysis_job_repo = AnalysisJobRepository()
+
+all_repositories: List[BaseRepository] = [
+    user_repo,
+    repository_repo,
+    repository_file_repo,
+    skill_profile_repo,
+    translation_repo,
+    translation_cache_repo,
+    learning_path_repo,
+    curriculum_template_repo,
+    analysis_job_repo,
+]
@@ -0,0 +1,257 @@
+# backend/src/services/batch_translation.py
+import asyncio
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..core.config import settings
+from ..database.repositories import (
+    analysis_job_repo,
+    repository_repo,
+    translation_repo,
+    user_repo,
+)
+from .content_refs import content_refs
+from .dashboard import dashboard_service
+from .github_service import github_service
+from .translation_service import TranslationService, translation_service
+
+DEFAULT_EXTENSIONS = [".js", ".jsx", ".ts", ".tsx"]
+
+
+async def create_batch_translation_job(
+    user_id: Any,
+    repository: Dict[str, Any],
+    source: Dict[str, Any],
+    target: Dict[str, Any],
+    extensions: Optional[List[str]] = None,
+    priority: int = 5,
+) -> Dict[str, Any]:
+    """Queue a whole-repository translation as an analysis job"""
+    return await analysis_job_repo.create(
+        {
+            "user_id": user_id,
+            "repository_id": repository["_id"],
+            "type": "translation",
+            "status": "queued",
+            "priority": priority,
+            "params": {
+                "source": source,
+                "target": target,
+                "extensions": extensions or DEFAULT_EXTENSIONS,
+            },
+            "progress": {
+                "percentage": 0,
+                "current_step": "queued",
+                "current_file": "",
+                "steps": [],
+                "metrics": {},
+            },
+            "retries": 0,
+            "max_retries": 3,
+        }
+    )
+
+
+class BatchTranslationRun:
+    """Translates a repository's matching files with a bounded worker pool
+
+    File contents are streamed from the repository tarball into a bounded
+    queue, so at most a few files are held in memory ahead of the workers.
+    Results are written to `translations` in bulk every `flush_size` files;
+    files already stored for this job (from an earlier, interrupted attempt)
+    are skipped so retries pick up where they left off.
+    """
+
+    def __init__(
+        self,
+        job: Dict[str, Any],
+        service: TranslationService = translation_service,
+        concurrency: int = settings.BATCH_TRANSLATION_CONCURRENCY,
+        flush_size: int = settings.BATCH_TRANSLATION_FLUSH_SIZE,
+        max_file_bytes: int = settings.BATCH_TRANSLATION_MAX_FILE_BYTES,
+    ):
+        self.job = job
+        self.job_id = str(job["_id"])
+        self.service = service
+        self.concurrency = concurrency
+        self.flush_size = flush_size
+        self.max_file_bytes = max_file_bytes
+        self.params = job["params"]
+        self._buffer: List[Dict[str, Any]] = []
+        self.total = 0
+        self.processed = 0
+        self.cached = 0
+        self.failed: List[Dict[str, str]] = []
+
+    @property
+    def extensions(self) -> Tuple[str, ...]:
+        return tuple(self.params.get("extensions") or DEFAULT_EXTENSIONS)
+
+    async def _list_files(self, access_token: str, repository, commit_sha: str):
+        owner, name = repository["full_name"].split("/", 1)
+        extensions = self.extensions
+        tree = await github_service.get_repository_tree(
+            access_token, owner, name, commit_sha
+        )
+        done = {
+            translation["source"]["path"]
+            async for translation in translation_repo.iter_many(
+                {"job_id": self.job["_id"]}, projection={"source.path": 1}
+            )
+        }
+        return [
+            entry
+            for entry in tree
+            if entry["path"].endswith(extensions)
+            and entry.get("size", 0) <= self.max_file_bytes
+            and entry["path"] not in done
+        ], len(done)
+
+    async def _flush(self):
+        batch, self._buffer = self._buffer, []
+        if batch:
+            result = await translation_repo.create_many(batch)
+            for error in result["errors"]:
+                path = batch[error["index"]]["source"]["path"]
+                self.failed.append({"path": path, "error": error["message"]})
+            await dashboard_service.invalidate(self.job["user_id"])
+
+    def _report(self, current_file: str, step: str = "translating"):
+        percentage = round(self.processed / self.total * 100) if self.total else 100
+        analysis_job_repo.queue_progress(
+            self.job_id,
+            {
+                "current_step": step,
+                "current_file": current_file,
+                "percentage": percentage,
+                "metrics": {
+                    "total_files": self.total,
+                    "processed_files": self.processed,
+                    "cached_files": self.cached,
+                    "failed_files": len(self.failed),
+                },
+            },
+        )
+
+    async def _produce(
+        self,
+        queue: asyncio.Queue,
+        access_token: str,
+        repository,
+        commit_sha: str,
+        files: List[Dict[str, Any]],
+        workers: int,
+    ):
+        """Feed (entry, content) pairs from the tarball, then one None per worker
+
+        Files the archive doesn't contain are queued without content and
+        fetched as blobs by the workers.
+        """
+        owner, name = repository["full_name"].split("/", 1)
+        wanted = {entry["path"]: entry for entry in files}
+        try:
+            if wanted:
+                async for path, _, content in github_service.iter_repository_archive(
+                    access_token,
+                    owner,
+                    name,
+                    commit_sha,
+                    extensions=self.extensions,
+                    max_file_bytes=self.max_file_bytes,
+                ):
+                    entry = wanted.pop(path, None)
+                    if entry is not None:
+                        await queue.put((entry, content))
+            for entry in wanted.values():
+                await queue.put((entry, None))
+        finally:
+            for _ in range(workers):
+                await queue.put(None)
+
+    async def _translate_file(
+        self, access_token: str, repository, entry, content: Optional[bytes]
+    ):
+        if content is None:
+            owner, name = repository["full_name"].split("/", 1)
+            content = await github_service.get_blob_content(
+                access_token, owner, name, entry["sha"]
+            )
+        source = {
+            **self.params["source"],
+            "path": entry["path"],
+            "code": content.decode("utf-8"),
+        }
+        result = await self.service.translate(source, self.params["target"])
+        self.cached += result["cached"]
+        stored_source, stored_target = await asyncio.gather(
+            content_refs.offload_code(source),
+            content_refs.offload_code({**result["target"], "path": entry["path"]}),
+        )
+        self._buffer.append(
+            {
+                "user_id": self.job["user_id"],
+                "repository_id": self.job["repository_id"],
+                "job_id": self.job["_id"],
+                "source": stored_source,
+                "target": stored_target,
+                "metadata": {**result["metadata"], "cached": result["cached"]},
+                "execution_time": result["execution_time"],
+            }
+        )
+        if len(self._buffer) >= self.flush_size:
+            await self._flush()
+
+    async def _worker(self, queue: asyncio.Queue, access_token: str, repository):
+        while True:
+            item = await queue.get()
+            if item is None:
+                return
+            entry, content = item
+            try:
+                await self._translate_file(access_token, repository, entry, content)
+            except Exception as e:
+                self.failed.append({"path": entry["path"], "error": str(e)})
+            self.processed += 1
+            self._report(entry["path"])
+
+    async def run(self) -> Dict[str, Any]:
+        started = datetime.utcnow()
+        repository = await repository_repo.find_by_id(
+            str(self.job["repository_id"]), projection={"full_name": 1, "branch": 1}
+        )
+        user = await user_repo.find_by_id(
+            str(self.job["user_id"]), projection={"github_access_token": 1}
+        )
+        if not repository or not user or not user.get("github_access_token"):
+            raise Exception("Repository or GitHub credentials not found")
+        access_token = user["github_access_token"]
+        owner, name = repository["full_name"].split("/", 1)
+        commit_sha = await github_service.get_commit_sha(
+            access_token, owner, name, repository.get("branch", "main")
+        )
+
+        files, already_done = await self._list_files(
+            access_token, repository, commit_sha
+        )
+        self.total = len(files)
+        workers = min(self.concurrency, self.total) or 1
+        queue: asyncio.Queue = asyncio.Queue(maxsize=workers * 2)
+        await asyncio.gather(
+            self._produce(queue, access_token, repository, commit_sha, files, workers),
+            *(self._worker(queue, access_token, repository) for _ in range(workers)),
+        )
+        await self._flush()
+        self._report("", step="completed")
+
+        return {
+            "total_files": self.total + already_done,
+            "translated_files": self.total - len(self.failed) + already_done,
+            "cached_files": self.cached,
+            "failed_files": self.failed,
+            "elapsed_seconds": (datetime.utcnow() - started).total_seconds(),
+        }
+
+
+async def run_batch_translation(job: Dict[str, Any]) -> Dict[str, Any]:
+    """Job handler for `translation` analysis jobs"""
+    return await BatchTranslationRun(job).run()
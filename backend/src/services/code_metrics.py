@@ -0,0 +1,271 @@
+# backend/src/services/code_metrics.py
+import hashlib
+import heapq
+import math
+import re
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from .file_analysis import AnalyzerResults, FileAnalyzer, file_language
+
+# language -> (line comment marker, block comment delimiters)
+_C_COMMENTS = ("//", ("/*", "*/"))
+_COMMENT_SYNTAX = {
+    "Python": ("#", None),
+    "Ruby": ("#", None),
+    "Shell": ("#", None),
+    "SQL": ("--", ("/*", "*/")),
+    "CSS": (None, ("/*", "*/")),
+    "HTML": (None, ("<!--", "-->")),
+}
+
+_DECISIONS = {
+    "c": re.compile(r"\b(?:if|for|foreach|while|case|catch)\b|&&|\|\|"),
+    "Python": re.compile(r"\b(?:if|elif|for|while|except|case|and|or)\b"),
+    "Ruby": re.compile(
+        r"\b(?:if|elsif|unless|for|while|until|when|rescue|and|or)\b|&&|\|\|"
+    ),
+    "Shell": re.compile(r"\b(?:if|elif|for|while|case)\b|&&|\|\|"),
+}
+# Markup and query languages have no meaningful cyclomatic complexity
+_NO_COMPLEXITY_LANGUAGES = {"CSS", "SCSS", "HTML", "SQL"}
+
+# Duplication: 4-line windows of significant lines, sampled by hash value so
+# every copy of the same code keeps the same windows
+SHINGLE_LINES = 4
+SHINGLE_MIN_CHARS = 8
+SHINGLE_SAMPLE_MODULUS = 4
+MAX_SHINGLES_PER_FILE = 64
+
+COMPLEXITY_BUCKETS: Sequence[int] = (1, 5, 10, 20, 50, 100)
+TOP_FILES = 10
+
+
+class StreamingHistogram:
+    """Counts per fixed upper-bound bucket, plus total and max"""
+
+    def __init__(self, bounds: Sequence[int]):
+        self.bounds = list(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.total = 0
+        self.max = 0
+
+    def add(self, value: int):
+        index = next(
+            (i for i, bound in enumerate(self.bounds) if value <= bound),
+            len(self.bounds),
+        )
+        self.counts[index] += 1
+        self.count += 1
+        self.total += value
+        self.max = max(self.max, value)
+
+    def quantile(self, q: float) -> Optional[int]:
+        """Upper bound of the bucket holding the q-th value (max for the last)"""
+        if not self.count:
+            return None
+        seen = 0
+        for bound, count in zip(self.bounds, self.counts):
+            seen += count
+            if seen >= q * self.count:
+                return min(bound, self.max)
+        return self.max
+
+    def to_dict(self) -> Dict[str, Any]:
+        bounds: List[Optional[int]] = [*self.bounds, None]
+        return {
+            "total": self.total,
+            "max": self.max,
+            "mean": round(self.total / self.count, 2) if self.count else 0.0,
+            "p50": self.quantile(0.5),
+            "p90": self.quantile(0.9),
+            "histogram": [
+                {"le": bound, "files": count}
+                for bound, count in zip(bounds, self.counts)
+            ],
+        }
+
+
+class TopK:
+    """The k largest items seen, kept in a min-heap"""
+
+    def __init__(self, k: int):
+        self.k = k
+        self._heap: List[Tuple[Any, str, Dict[str, Any]]] = []
+
+    def add(self, score: Any, key: str, item: Dict[str, Any]):
+        entry = (score, key, item)
+        if len(self._heap) < self.k:
+            heapq.heappush(self._heap, entry)
+        elif entry[:2] > self._heap[0][:2]:
+            heapq.heapreplace(self._heap, entry)
+
+    def items(self) -> List[Dict[str, Any]]:
+        return [item for *_, item in sorted(self._heap, reverse=True)]
+
+
+class HyperLogLog:
+    """Distinct count of 56-bit hashes in 2**precision one-byte registers"""
+
+    HASH_BITS = 56
+
+    def __init__(self, precision: int = 12):
+        self.precision = precision
+        self.size = 1 << precision
+        self.registers = bytearray(self.size)
+
+    def add(self, value: int):
+        index = value >> (self.HASH_BITS - self.precision)
+        rest = value & ((1 << (self.HASH_BITS - self.precision)) - 1)
+        rank = self.HASH_BITS - self.precision - rest.bit_length() + 1
+        if rank > self.registers[index]:
+            self.registers[index] = rank
+
+    def count(self) -> float:
+        alpha = 0.7213 / (1 + 1.079 / self.size)
+        estimate = alpha * self.size**2 / sum(2.0**-r for r in self.registers)
+        zeros = self.registers.count(0)
+        if estimate <= 2.5 * self.size and zeros:
+            # Linear counting is more accurate for small cardinalities
+            return self.size * math.log(self.size / zeros)
+        return estimate
+
+
+def _shingle_hash(lines: List[str]) -> int:
+    digest = hashlib.blake2b("\n".join(lines).encode(), digest_size=7).digest()
+    return int.from_bytes(digest, "big")
+
+
+def _classify_lines(language: str, text: str) -> Tuple[int, int, int, List[str]]:
+    """(code, comment, blank) line counts and the code lines themselves"""
+    line_comment, block = _COMMENT_SYNTAX.get(language, _C_COMMENTS)
+    code, comment, blank = 0, 0, 0
+    code_lines = []
+    in_block = False
+    for raw in text.splitlines():
+        line = raw.strip()
+        if in_block:
+            comment += 1
+            in_block = block[1] not in line
+        elif not line:
+            blank += 1
+        elif line_comment and line.startswith(line_comment):
+            comment += 1
+        elif block and line.startswith(block[0]):
+            comment += 1
+            in_block = block[1] not in line[len(block[0]) :]
+        else:
+            code += 1
+            code_lines.append(line)
+    return code, comment, blank, code_lines
+
+
+def _shingles(code_lines: List[str]) -> List[int]:
+    significant = [
+        " ".join(line.split())
+        for line in code_lines
+        if len(line) >= SHINGLE_MIN_CHARS
+    ]
+    sampled = []
+    for i in range(len(significant) - SHINGLE_LINES + 1):
+        value = _shingle_hash(significant[i : i + SHINGLE_LINES])
+        if value % SHINGLE_SAMPLE_MODULUS == 0:
+            sampled.append(value)
+            if len(sampled) >= MAX_SHINGLES_PER_FILE:
+                break
+    return sampled
+
+
+class MetricsAnalyzer(FileAnalyzer):
+    """Line counts, cyclomatic complexity, size and duplication
+
+    Per-file results stay small (a few counters and at most
+    MAX_SHINGLES_PER_FILE sampled hashes). Aggregation uses fixed-size
+    structures (streaming histogram, top-k heaps, HyperLogLog), so its memory
+    doesn't grow with the number of files.
+    """
+
+    name = "metrics"
+
+    def analyze(self, path: str, content: bytes) -> Optional[Dict[str, Any]]:
+        language = file_language(path)
+        if language is None:
+            return None
+        text = content.decode("utf-8", errors="ignore")
+        code, comment, blank, code_lines = _classify_lines(language, text)
+        result: Dict[str, Any] = {
+            "language": language,
+            "bytes": len(content),
+            "code": code,
+            "comment": comment,
+            "blank": blank,
+            "shingles": _shingles(code_lines),
+        }
+        if language not in _NO_COMPLEXITY_LANGUAGES:
+            decisions = _DECISIONS.get(language, _DECISIONS["c"])
+            result["complexity"] = 1 + sum(
+                len(decisions.findall(line)) for line in code_lines
+            )
+        return result
+
+    def aggregate(self, results: AnalyzerResults) -> Dict[str, Any]:
+        languages: Dict[str, Dict[str, Any]] = {}
+        totals = {"files": 0, "bytes": 0, "code": 0, "comment": 0, "blank": 0}
+        complexity = StreamingHistogram(COMPLEXITY_BUCKETS)
+        largest = TopK(TOP_FILES)
+        most_complex = TopK(TOP_FILES)
+        distinct_windows = HyperLogLog()
+        windows = 0
+
+        for path, result in results:
+            language = languages.setdefault(
+                result["language"],
+                {
+                    "name": result["language"],
+                    "files": 0,
+                    "code": 0,
+                    "comment": 0,
+                    "blank": 0,
+                },
+            )
+            language["files"] += 1
+            totals["files"] += 1
+            totals["bytes"] += result["bytes"]
+            for key in ("code", "comment", "blank"):
+                language[key] += result[key]
+                totals[key] += result[key]
+
+            largest.add(
+                result["bytes"],
+                path,
+                {"path": path, "bytes": result["bytes"], "code": result["code"]},
+            )
+            if "complexity" in result:
+                complexity.add(result["complexity"])
+                most_complex.add(
+                    result["complexity"],
+                    path,
+                    {"path": path, "complexity": result["complexity"]},
+                )
+            for value in result["shingles"]:
+                distinct_windows.add(value)
+                windows += 1
+
+        # Share of sampled windows that repeat one seen elsewhere
+        distinct = min(distinct_windows.count(), windows)
+        duplication = (windows - distinct) / windows if windows else 0.0
+        return {
+            "metrics": {
+                **totals,
+                "languages": sorted(
+                    languages.values(), key=lambda entry: entry["code"], reverse=True
+                ),
+                "complexity": complexity.to_dict(),
+                "largest_files": largest.items(),
+                "most_complex_files": most_complex.items(),
+                "duplication": {
+                    "ratio": round(duplication, 4),
+                    "sampled_windows": windows,
+                },
+            }
+        }
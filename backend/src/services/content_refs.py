@@ -0,0 +1,89 @@
+# backend/src/services/content_refs.py
+import asyncio
+import json
+from typing import Any, Dict, List
+
+from ..core.config import settings
+from ..database.blob_store import BlobNotFound, BlobStore, blob_store
+
+# Lesson fields moved to the blob store together, as one JSON `body_ref`
+LESSON_BODY_FIELDS = ("content", "examples", "exercises")
+EMPTY_LESSON_BODY = {"content": "", "examples": [], "exercises": []}
+
+
+class ContentRefs:
+    """Moves large document fields to the blob store and loads them back
+
+    Offloaded fields are replaced by a `*_ref` content hash; list queries
+    and progress updates then never touch the payload, and detail views
+    load it with one `get_many` per document.
+    """
+
+    def __init__(
+        self,
+        store: BlobStore = blob_store,
+        inline_max_bytes: int = settings.BLOB_INLINE_MAX_BYTES,
+    ):
+        self.store = store
+        self.inline_max_bytes = inline_max_bytes
+
+    async def offload_lesson(self, lesson: Dict[str, Any]) -> Dict[str, Any]:
+        if lesson.get("body_ref"):
+            return lesson
+        body = {field: lesson.get(field) for field in LESSON_BODY_FIELDS}
+        raw = json.dumps(body, sort_keys=True, default=str).encode()
+        if len(raw) < self.inline_max_bytes:
+            return lesson
+        return {**lesson, **EMPTY_LESSON_BODY, "body_ref": await self.store.put(raw)}
+
+    async def offload_lessons(
+        self, lessons: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Lessons with large bodies replaced by `body_ref`"""
+        return list(await asyncio.gather(*map(self.offload_lesson, lessons)))
+
+    async def load_lessons(self, lessons: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Lessons with offloaded bodies filled back in"""
+        refs = [lesson["body_ref"] for lesson in lessons if lesson.get("body_ref")]
+        blobs = await self.store.get_many(refs)
+        loaded = []
+        for lesson in lessons:
+            ref = lesson.get("body_ref")
+            if ref:
+                if ref not in blobs:
+                    raise BlobNotFound(ref)
+                lesson = {**lesson, **json.loads(blobs[ref])}
+            loaded.append(lesson)
+        return loaded
+
+    async def offload_code(self, spec: Dict[str, Any]) -> Dict[str, Any]:
+        """A translation source/target with large `code` replaced by `code_ref`"""
+        code = spec.get("code")
+        if not code:
+            return spec
+        raw = code.encode("utf-8")
+        if len(raw) < self.inline_max_bytes:
+            return spec
+        fields = {k: v for k, v in spec.items() if k != "code"}
+        return {**fields, "code_ref": await self.store.put(raw)}
+
+    async def load_translation(self, translation: Dict[str, Any]) -> Dict[str, Any]:
+        """A translation with offloaded source/target code filled back in"""
+        specs = {
+            side: translation[side]
+            for side in ("source", "target")
+            if (translation.get(side) or {}).get("code_ref")
+        }
+        if not specs:
+            return translation
+        blobs = await self.store.get_many(spec["code_ref"] for spec in specs.values())
+        loaded = dict(translation)
+        for side, spec in specs.items():
+            if spec["code_ref"] not in blobs:
+                raise BlobNotFound(spec["code_ref"])
+            fields = {k: v for k, v in spec.items() if k != "code_ref"}
+            loaded[side] = {**fields, "code": blobs[spec["code_ref"]].decode("utf-8")}
+        return loaded
+
+
+content_refs = ContentRefs()
@@ -0,0 +1,184 @@
+# backend/src/services/dashboard.py
+import asyncio
+import json
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Any, Dict, Optional, Tuple
+
+from ..core.cache import LRUCache
+from ..core.config import settings
+from ..core.redis import get_redis
+from ..database.repositories import (
+    learning_path_repo,
+    repository_repo,
+    skill_profile_repo,
+    translation_repo,
+)
+
+# (cached overview or None, generation to store a fresh one under)
+CacheLookup = Tuple[Optional[Dict[str, Any]], int]
+
+
+class DashboardCache(ABC):
+    """Per-user overview cache with generation-based invalidation
+
+    `invalidate` bumps the user's generation, so an overview computed before
+    a write can't be stored over it afterwards.
+    """
+
+    @abstractmethod
+    async def get(self, user_id: str) -> CacheLookup:
+        ...
+
+    @abstractmethod
+    async def set(self, user_id: str, generation: int, overview: Dict[str, Any]):
+        ...
+
+    @abstractmethod
+    async def invalidate(self, user_id: str):
+        ...
+
+
+class MemoryDashboardCache(DashboardCache):
+    """In-process cache; other processes' writes are bounded by the TTL"""
+
+    def __init__(self, max_entries: int, ttl: float):
+        self.entries = LRUCache(max_entries, ttl=ttl)
+        self.generations = LRUCache(max_entries)
+
+    async def get(self, user_id: str) -> CacheLookup:
+        generation = self.generations.get(user_id, 0)
+        entry = self.entries.get(user_id)
+        if entry is not None and entry[0] == generation:
+            return entry[1], generation
+        return None, generation
+
+    async def set(self, user_id: str, generation: int, overview: Dict[str, Any]):
+        if self.generations.get(user_id, 0) == generation:
+            self.entries.set(user_id, (generation, overview))
+
+    async def invalidate(self, user_id: str):
+        self.entries.delete(user_id)
+        self.generations.set(user_id, self.generations.get(user_id, 0) + 1)
+
+
+class RedisDashboardCache(DashboardCache):
+    """Redis-backed cache, invalidated across API and worker processes"""
+
+    def __init__(self, ttl: float):
+        self.redis = get_redis()
+        self.ttl = max(1, int(ttl))
+
+    async def get(self, user_id: str) -> CacheLookup:
+        raw, generation = await self.redis.mget(
+            f"dashboard:{user_id}", f"dashboard:gen:{user_id}"
+        )
+        generation = int(generation or 0)
+        entry = json.loads(raw) if raw else None
+        if entry is not None and entry["generation"] == generation:
+            return entry["overview"], generation
+        return None, generation
+
+    async def set(self, user_id: str, generation: int, overview: Dict[str, Any]):
+        await self.redis.set(
+            f"dashboard:{user_id}",
+            json.dumps({"generation": generation, "overview": overview}, default=str),
+            ex=self.ttl,
+        )
+
+    async def invalidate(self, user_id: str):
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.incr(f"dashboard:gen:{user_id}")
+            # Outlives any entry stored under the previous generation
+            pipe.expire(f"dashboard:gen:{user_id}", self.ttl * 2)
+            pipe.delete(f"dashboard:{user_id}")
+            await pipe.execute()
+
+
+def create_dashboard_cache() -> Optional[DashboardCache]:
+    """Build the cache selected by DASHBOARD_CACHE_BACKEND (None if TTL is 0)"""
+    if settings.DASHBOARD_CACHE_TTL_SECONDS <= 0:
+        return None
+    if settings.DASHBOARD_CACHE_BACKEND == "redis":
+        return RedisDashboardCache(settings.DASHBOARD_CACHE_TTL_SECONDS)
+    return MemoryDashboardCache(
+        settings.DASHBOARD_CACHE_MAX_ENTRIES, settings.DASHBOARD_CACHE_TTL_SECONDS
+    )
+
+
+class DashboardService:
+    """Per-user dashboard overview in one round of concurrent aggregations
+
+    Each section is a single aggregation on its own collection (they can't
+    share one pipeline), gathered concurrently; the result is cached per
+    user until a write invalidates it or the TTL passes.
+    """
+
+    def __init__(self, cache: Optional[DashboardCache] = None):
+        self.cache = cache
+
+    async def _compute(self, user_id: str) -> Dict[str, Any]:
+        by_status, translations, learning_paths, profile = await asyncio.gather(
+            repository_repo.count_by_status(user_id),
+            translation_repo.summarize_by_user(
+                user_id, recent=settings.DASHBOARD_RECENT_TRANSLATIONS
+            ),
+            learning_path_repo.summarize_active_by_user(
+                user_id, limit=settings.DASHBOARD_ACTIVE_LEARNING_PATHS
+            ),
+            skill_profile_repo.find_by_user(
+                user_id,
+                projection={"metrics": 1, "strengths": 1, "updated_at": 1},
+            ),
+        )
+        return {
+            "repositories": {
+                "total": sum(by_status.values()),
+                "by_status": by_status,
+            },
+            "translations": {
+                **translations,
+                "recent": [
+                    {
+                        "id": str(item["_id"]),
+                        "source": item["source"],
+                        "target": item["target"],
+                        "metadata": item.get("metadata", {}),
+                        "execution_time": item.get("execution_time"),
+                        "created_at": item.get("created_at"),
+                    }
+                    for item in translations["recent"]
+                ],
+            },
+            "learning_paths": {
+                "active": learning_paths["total"],
+                "paths": [
+                    {"id": str(path.pop("_id")), **path}
+                    for path in learning_paths["paths"]
+                ],
+            },
+            "skills": {
+                "metrics": (profile or {}).get("metrics", {}),
+                "strengths": (profile or {}).get("strengths", []),
+                "updated_at": (profile or {}).get("updated_at"),
+            },
+            "generated_at": datetime.utcnow(),
+        }
+
+    async def get_overview(self, user_id: str) -> Dict[str, Any]:
+        """The user's dashboard overview, from cache when fresh"""
+        if self.cache is None:
+            return await self._compute(user_id)
+        overview, generation = await self.cache.get(user_id)
+        if overview is None:
+            overview = await self._compute(user_id)
+            await self.cache.set(user_id, generation, overview)
+        return overview
+
+    async def invalidate(self, user_id: Any):
+        """Drop a user's cached overview (call after writes it summarizes)"""
+        if self.cache is not None:
+            await self.cache.invalidate(str(user_id))
+
+
+dashboard_service = DashboardService(create_dashboard_cache())
@@ -0,0 +1,156 @@
+# backend/src/services/file_analysis.py
+# Kept free of database and network imports: `analyze_files` runs in the
+# worker processes of the shared analysis pool
+import os
+import signal
+import threading
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+EXTENSION_LANGUAGES = {
+    ".py": "Python",
+    ".js": "JavaScript",
+    ".jsx": "JavaScript",
+    ".mjs": "JavaScript",
+    ".cjs": "JavaScript",
+    ".ts": "TypeScript",
+    ".tsx": "TypeScript",
+    ".vue": "Vue",
+    ".svelte": "Svelte",
+    ".go": "Go",
+    ".rs": "Rust",
+    ".java": "Java",
+    ".kt": "Kotlin",
+    ".rb": "Ruby",
+    ".php": "PHP",
+    ".cs": "C#",
+    ".c": "C",
+    ".h": "C",
+    ".cpp": "C++",
+    ".hpp": "C++",
+    ".swift": "Swift",
+    ".scala": "Scala",
+    ".css": "CSS",
+    ".scss": "SCSS",
+    ".html": "HTML",
+    ".sql": "SQL",
+    ".sh": "Shell",
+}
+
+
+# (path, result) pairs for one analyzer, streamed from the file index
+AnalyzerResults = Iterable[Tuple[str, Dict[str, Any]]]
+
+
+def file_language(path: str) -> Optional[str]:
+    return EXTENSION_LANGUAGES.get(os.path.splitext(path)[1].lower())
+
+
+class AnalysisTimeout(Exception):
+    """Raised inside an analyzer that ran past its per-file time limit"""
+
+
+class FileAnalyzer(ABC):
+    """One analysis pass: a per-file result plus a repository-level aggregate
+
+    Instances are pickled to the analysis pool, so keep them stateless.
+    """
+
+    name: str = ""
+
+    @abstractmethod
+    def analyze(self, path: str, content: bytes) -> Optional[Dict[str, Any]]:
+        """Per-file result (kept small: it is stored in the file index)"""
+
+    @abstractmethod
+    def aggregate(self, results: AnalyzerResults) -> Dict[str, Any]:
+        """Repository field updates ($set paths) from all per-file results
+
+        `results` is a single pass over the index; keep aggregation state
+        bounded rather than collecting per-file data.
+        """
+
+
+class LanguageAnalyzer(FileAnalyzer):
+    """Files and lines per language"""
+
+    name = "languages"
+
+    def analyze(self, path: str, content: bytes) -> Optional[Dict[str, Any]]:
+        language = file_language(path)
+        if language is None:
+            return None
+        return {"language": language, "lines": content.count(b"\n") + 1}
+
+    def aggregate(self, results: AnalyzerResults) -> Dict[str, Any]:
+        totals: Dict[str, Dict[str, Any]] = {}
+        for _, result in results:
+            language = result["language"]
+            entry = totals.setdefault(
+                language, {"name": language, "files": 0, "lines": 0}
+            )
+            entry["files"] += 1
+            entry["lines"] += result["lines"]
+        languages = sorted(totals.values(), key=lambda e: e["lines"], reverse=True)
+        return {"technologies.languages": languages}
+
+
+def analyze_file(
+    analyzers: Sequence[FileAnalyzer], path: str, content: bytes
+) -> Dict[str, Any]:
+    """{analyzer name: result} for one file"""
+    results = {}
+    for analyzer in analyzers:
+        result = analyzer.analyze(path, content)
+        if result is not None:
+            results[analyzer.name] = result
+    return results
+
+
+@contextmanager
+def time_limit(seconds: Optional[float]) -> Iterator[None]:
+    """Raise AnalysisTimeout in the block after `seconds` (main thread only)
+
+    Uses SIGALRM, so it applies in pool workers and inline on Unix; elsewhere
+    the block runs unbounded.
+    """
+    if (
+        not seconds
+        or not hasattr(signal, "setitimer")
+        or threading.current_thread() is not threading.main_thread()
+    ):
+        yield
+        return
+
+    def expire(signum, frame):
+        raise AnalysisTimeout()
+
+    previous = signal.signal(signal.SIGALRM, expire)
+    signal.setitimer(signal.ITIMER_REAL, seconds)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+
+
+def analyze_files(
+    analyzers: Sequence[FileAnalyzer],
+    files: List[Tuple[str, bytes]],
+    timeout: Optional[float] = None,
+) -> List[Dict[str, Any]]:
+    """Analyze a batch of (path, content) pairs; one pool task per batch
+
+    A file whose analyzers exceed `timeout` seconds gets `{"timed_out": True}`
+    instead of results, so one pathological file can't stall the batch.
+    """
+    results = []
+    for path, content in files:
+        try:
+            with time_limit(timeout):
+                result = analyze_file(analyzers, path, content)
+        except AnalysisTimeout:
+            result = {"timed_out": True}
+        results.append(result)
+    return results
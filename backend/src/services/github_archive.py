@@ -0,0 +1,56 @@
+# backend/src/services/github_archive.py
+import tarfile
+from typing import IO, Iterable, Optional, Sequence, Tuple
+
+# (path relative to the repository root, size in bytes, content)
+ArchiveFile = Tuple[str, int, bytes]
+
+
+class ArchiveTooLarge(Exception):
+    """Raised when a repository archive exceeds GITHUB_ARCHIVE_MAX_BYTES"""
+
+
+class TarballReader:
+    """Reads matching files from a gzipped GitHub tarball one member at a time
+
+    The archive is read in stream mode, so only the current member's content
+    is ever held in memory. GitHub prefixes every path with a top-level
+    `<owner>-<repo>-<sha>/` directory; it is stripped from yielded paths.
+    """
+
+    def __init__(
+        self,
+        fileobj: IO[bytes],
+        extensions: Optional[Sequence[str]] = None,
+        max_file_bytes: Optional[int] = None,
+        exclude_dirs: Iterable[str] = (),
+    ):
+        self.tar = tarfile.open(fileobj=fileobj, mode="r|gz")
+        self.extensions = tuple(extensions) if extensions else None
+        self.max_file_bytes = max_file_bytes
+        self.exclude_dirs = set(exclude_dirs)
+
+    def _wanted(self, member: tarfile.TarInfo, path: str) -> bool:
+        if not member.isfile() or not path:
+            return False
+        if self.max_file_bytes is not None and member.size > self.max_file_bytes:
+            return False
+        if self.extensions and not path.endswith(self.extensions):
+            return False
+        return not self.exclude_dirs.intersection(path.split("/")[:-1])
+
+    def next_file(self) -> Optional[ArchiveFile]:
+        """The next matching file, or None once the archive is exhausted"""
+        while True:
+            member = self.tar.next()
+            if member is None:
+                return None
+            # Stream mode still records every member; drop them as we go
+            self.tar.members = []
+            path = member.name.split("/", 1)[1] if "/" in member.name else ""
+            if self._wanted(member, path):
+                extracted = self.tar.extractfile(member)
+                return path, member.size, extracted.read() if extracted else b""
+
+    def close(self):
+        self.tar.close()
@@ -0,0 +1,88 @@
+# backend/src/services/github_cache.py
+import hashlib
+import json
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from ..core.config import settings
+from ..core.redis import get_redis
+
+
+def cache_key(token_key: str, url: str, params: Optional[Dict[str, Any]]) -> str:
+    """Cache key for a GitHub GET request"""
+    raw = json.dumps([token_key, url, sorted((params or {}).items())], default=str)
+    return "gh:" + hashlib.sha256(raw.encode()).hexdigest()
+
+
+class ResponseCache(ABC):
+    """Stores GitHub response bodies alongside their ETag/Last-Modified validators"""
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        ...
+
+    @abstractmethod
+    async def set(self, key: str, entry: Dict[str, Any]):
+        ...
+
+    async def close(self):
+        pass
+
+
+class MemoryResponseCache(ResponseCache):
+    """In-process LRU cache with TTL
+
+    Entries are kept serialized, as in Redis, so callers that modify a
+    returned body never change what later hits see.
+    """
+
+    def __init__(self, max_entries: int, ttl: float):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        item = self._entries.get(key)
+        if item is None:
+            return None
+        expires_at, entry = item
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return json.loads(entry)
+
+    async def set(self, key: str, entry: Dict[str, Any]):
+        self._entries[key] = (time.monotonic() + self.ttl, json.dumps(entry))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+class RedisResponseCache(ResponseCache):
+    """Redis-backed cache shared across workers; Redis handles TTL and eviction"""
+
+    def __init__(self, ttl: float):
+        self.redis = get_redis()
+        self.ttl = int(ttl)
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        raw = await self.redis.get(key)
+        return json.loads(raw) if raw else None
+
+    async def set(self, key: str, entry: Dict[str, Any]):
+        await self.redis.set(key, json.dumps(entry), ex=self.ttl)
+
+
+def create_response_cache() -> Optional[ResponseCache]:
+    """Build the response cache selected by GITHUB_CACHE_BACKEND"""
+    backend = settings.GITHUB_CACHE_BACKEND
+    if backend == "memory":
+        return MemoryResponseCache(
+            settings.GITHUB_CACHE_MAX_ENTRIES, settings.GITHUB_CACHE_TTL_SECONDS
+        )
+    if backend == "redis":
+        return RedisResponseCache(settings.GITHUB_CACHE_TTL_SECONDS)
+    return None
@@ -0,0 +1,95 @@
+# backend/src/services/github_rate_limit.py
+import asyncio
+import hashlib
+import time
+from typing import Dict, Optional
+
+import httpx
+
+
+def token_key(access_token: Optional[str]) -> str:
+    """Stable, non-reversible key for a token (never store raw tokens)"""
+    if not access_token:
+        return "anonymous"
+    return hashlib.sha256(access_token.encode()).hexdigest()[:32]
+
+
+class RateLimitBudget:
+    """Last known GitHub rate-limit state for one token"""
+
+    __slots__ = ("limit", "remaining", "reset_at")
+
+    def __init__(self):
+        self.limit: Optional[int] = None
+        self.remaining: Optional[int] = None
+        self.reset_at: float = 0.0
+
+
+class RateLimitTracker:
+    """Tracks X-RateLimit-* headers per token and throttles before quota runs out"""
+
+    def __init__(self, reserve: int, max_wait: float, max_budgets: int = 10000):
+        self.reserve = reserve
+        self.max_wait = max_wait
+        self.max_budgets = max_budgets
+        self._budgets: Dict[str, RateLimitBudget] = {}
+
+    def budget(self, key: str) -> RateLimitBudget:
+        budget = self._budgets.get(key)
+        if budget is None:
+            if len(self._budgets) >= self.max_budgets:
+                self._evict_expired()
+            budget = self._budgets[key] = RateLimitBudget()
+        return budget
+
+    def _evict_expired(self):
+        now = time.time()
+        for key in [k for k, b in self._budgets.items() if b.reset_at <= now]:
+            del self._budgets[key]
+        if len(self._budgets) >= self.max_budgets:
+            self._budgets.clear()
+
+    def delay_for(self, key: str) -> float:
+        """Seconds to wait before the next request on this token"""
+        budget = self._budgets.get(key)
+        if budget is None or budget.remaining is None:
+            return 0.0
+
+        window = budget.reset_at - time.time()
+        if window <= 0 or budget.remaining > self.reserve:
+            return 0.0
+        if budget.remaining <= 0:
+            return min(window, self.max_wait)
+        # Inside the reserve: spread what's left evenly over the rest of the window
+        return min(window / budget.remaining, self.max_wait)
+
+    async def acquire(self, key: str):
+        """Sleep if the token's budget is close to exhausted"""
+        delay = self.delay_for(key)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def record(self, key: str, response: httpx.Response):
+        """Update the budget from a response's rate-limit headers"""
+        headers = response.headers
+        if "x-ratelimit-remaining" not in headers:
+            return
+        budget = self.budget(key)
+        try:
+            budget.remaining = int(headers["x-ratelimit-remaining"])
+            budget.limit = int(headers.get("x-ratelimit-limit", budget.limit or 0))
+            budget.reset_at = float(headers.get("x-ratelimit-reset", 0))
+        except ValueError:
+            pass
+
+    def retry_after(self, key: str, response: httpx.Response) -> Optional[float]:
+        """Server-mandated wait for a throttled response, if any"""
+        retry_after = response.headers.get("retry-after")
+        if retry_after:
+            try:
+                return min(float(retry_after), self.max_wait)
+            except ValueError:
+                pass
+        if response.headers.get("x-ratelimit-remaining") == "0":
+            return min(max(self.budget(key).reset_at - time.time(), 0), self.max_wait)
+        return None
@@ -1,17 +1,200 @@
 # backend/src/services/github_service.py
+import asyncio
+import random
+import re
+import tempfile
 import httpx
-from typing import Dict, Any, Optional, List
-from urllib.parse import urlencode
+from typing import AsyncIterator, Dict, Any, Iterable, Optional, List, Sequence, Tuple
+from urllib.parse import parse_qs, urlencode, urlparse
 from ..core.config import settings
+from .github_archive import ArchiveFile, ArchiveTooLarge, TarballReader
+from .github_cache import ResponseCache, cache_key, create_response_cache
+from .github_rate_limit import RateLimitTracker, token_key
+
+API_HEADERS = {
+    "Accept": "application/vnd.github.v3+json",
+    "X-GitHub-Api-Version": "2022-11-28",
+}
+
+RETRY_STATUS_CODES = {403, 429, 500, 502, 503, 504}
+
+# Safe to resend; a retried POST (e.g. the one-time OAuth code) may already
+# have been applied
+IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+
+LAST_PAGE_LINK = re.compile(r'<([^>]+)>;\s*rel="last"')
+
+
+def last_page_from_link(link: Optional[str]) -> int:
+    """Page number of the rel="last" entry in a GitHub Link header"""
+    match = LAST_PAGE_LINK.search(link or "")
+    if not match:
+        return 1
+    page = parse_qs(urlparse(match.group(1)).query).get("page", ["1"])[0]
+    return int(page)
+
+
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
 
 
 class GitHubService:
     """Service for GitHub OAuth and API interactions"""
 
-    def __init__(self):
-        self.client = httpx.AsyncClient()
+    def __init__(
+        self,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        cache: Optional[ResponseCache] = None,
+    ):
+        self.client = httpx.AsyncClient(
+            http2=settings.GITHUB_HTTP2 and transport is None and _http2_available(),
+            limits=httpx.Limits(
+                max_connections=settings.GITHUB_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.GITHUB_MAX_KEEPALIVE_CONNECTIONS,
+            ),
+            timeout=httpx.Timeout(
+                settings.GITHUB_TIMEOUT_SECONDS,
+                connect=settings.GITHUB_CONNECT_TIMEOUT_SECONDS,
+            ),
+            transport=transport,
+        )
         self.oauth_base_url = "https://github.com/login/oauth"
         self.api_base_url = "https://api.github.com"
+        self.rate_limits = RateLimitTracker(
+            reserve=settings.GITHUB_RATE_LIMIT_RESERVE,
+            max_wait=settings.GITHUB_MAX_RATE_LIMIT_WAIT_SECONDS,
+        )
+        self.max_retries = settings.GITHUB_MAX_RETRIES
+        self.cache = cache if cache is not None else create_response_cache()
+
+    def _headers(self, access_token: str) -> Dict[str, str]:
+        """API headers for a token"""
+        return {**API_HEADERS, "Authorization": f"Bearer {access_token}"}
+
+    def _backoff(self, attempt: int) -> float:
+        """Full-jitter exponential backoff"""
+        return random.uniform(0, min(30.0, 0.5 * 2**attempt))
+
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        access_token: Optional[str] = None,
+        stream: bool = False,
+        **kwargs,
+    ) -> httpx.Response:
+        """Send a request with rate-limit throttling and retries
+
+        With ``stream`` the body is left unread (and redirects are followed);
+        the caller must close the returned response. Only idempotent methods
+        are retried.
+        """
+        key = token_key(access_token)
+        max_retries = self.max_retries if method.upper() in IDEMPOTENT_METHODS else 0
+        if access_token:
+            headers = kwargs.get("headers", {})
+            kwargs["headers"] = {**self._headers(access_token), **headers}
+
+        attempt = 0
+        while True:
+            await self.rate_limits.acquire(key)
+            try:
+                if stream:
+                    response = await self.client.send(
+                        self.client.build_request(method, url, **kwargs),
+                        stream=True,
+                        follow_redirects=True,
+                    )
+                else:
+                    response = await self.client.request(method, url, **kwargs)
+            except httpx.TransportError:
+                if attempt >= max_retries:
+                    raise
+                await asyncio.sleep(self._backoff(attempt))
+                attempt += 1
+                continue
+
+            self.rate_limits.record(key, response)
+            retryable = response.status_code in RETRY_STATUS_CODES
+            if not retryable or attempt >= max_retries:
+                return response
+
+            delay = self.rate_limits.retry_after(key, response)
+            if delay is None:
+                if response.status_code == 403:
+                    # Plain permission errors are not throttling; don't retry them
+                    return response
+                delay = self._backoff(attempt)
+            if stream:
+                await response.aclose()
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def _fetch_json(
+        self,
+        url: str,
+        access_token: str,
+        error: str,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[Any, Optional[str]]:
+        """GET a JSON resource and its Link header, revalidating cached copies"""
+        if self.cache is None:
+            response = await self._request("GET", url, access_token, params=params)
+            if response.status_code != 200:
+                raise Exception(f"{error}: {response.text}")
+            return response.json(), response.headers.get("link")
+
+        key = cache_key(token_key(access_token), url, params)
+        cached = await self.cache.get(key)
+        headers = {}
+        if cached:
+            if cached.get("etag"):
+                headers["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                headers["If-Modified-Since"] = cached["last_modified"]
+
+        response = await self._request(
+            "GET", url, access_token, params=params, headers=headers
+        )
+
+        # 304s don't count against the rate limit; serve the stored body
+        if response.status_code == 304 and cached:
+            await self.cache.set(key, cached)
+            return cached["body"], cached.get("link")
+
+        if response.status_code != 200:
+            raise Exception(f"{error}: {response.text}")
+
+        body = response.json()
+        link = response.headers.get("link")
+        etag = response.headers.get("etag")
+        last_modified = response.headers.get("last-modified")
+        if etag or last_modified:
+            await self.cache.set(
+                key,
+                {
+                    "etag": etag,
+                    "last_modified": last_modified,
+                    "link": link,
+                    "body": body,
+                },
+            )
+        return body, link
+
+    async def _get_json(
+        self,
+        url: str,
+        access_token: str,
+        error: str,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Any:
+        """GET a JSON resource, revalidating cached copies with ETag/Last-Modified"""
+        body, _ = await self._fetch_json(url, access_token, error, params)
+        return body
 
     def get_oauth_url(self, state: str) -> str:
         """Generate GitHub OAuth URL"""
@@ -34,8 +217,8 @@ class GitHubService:
 
         headers = {"Accept": "application/json"}
 
-        response = await self.client.post(
-            f"{self.oauth_base_url}/access_token", data=data, headers=headers
+        response = await self._request(
+            "POST", f"{self.oauth_base_url}/access_token", data=data, headers=headers
         )
 
         if response.status_code != 200:
@@ -45,34 +228,18 @@ class GitHubService:
 
     async def get_user_info(self, access_token: str) -> Dict[str, Any]:
         """Get user information from GitHub"""
-        headers = {
-            "Authorization": f"Bearer {access_token}",
-            "Accept": "application/vnd.github.v3+json",
-        }
-
-        response = await self.client.get(f"{self.api_base_url}/user", headers=headers)
-
-        if response.status_code != 200:
-            raise Exception(f"Failed to get user info: {response.text}")
-
-        return response.json()
+        return await self._get_json(
+            f"{self.api_base_url}/user", access_token, "Failed to get user info"
+        )
 
     async def get_user_emails(self, access_token: str) -> List[Dict[str, Any]]:
         """Get user emails from GitHub"""
-        headers = {
-            "Authorization": f"Bearer {access_token}",
-            "Accept": "application/vnd.github.v3+json",
-        }
-
-        response = await self.client.get(
-            f"{self.api_base_url}/user/emails", headers=headers
+        return await self._get_json(
+            f"{self.api_base_url}/user/emails",
+            access_token,
+            "Failed to get user emails",
         )
 
-        if response.status_code != 200:
-            raise Exception(f"Failed to get user emails: {response.text}")
-
-        return response.json()
-
     async def get_user_repositories(
         self,
         access_token: str,
@@ -81,61 +248,204 @@ class GitHubService:
         sort: str = "updated",
     ) -> List[Dict[str, Any]]:
         """Get user repositories from GitHub"""
-        headers = {
-            "Authorization": f"Bearer {access_token}",
-            "Accept": "application/vnd.github.v3+json",
-        }
-
         params = {"per_page": per_page, "page": page, "sort": sort, "direction": "desc"}
 
-        response = await self.client.get(
-            f"{self.api_base_url}/user/repos", headers=headers, params=params
+        return await self._get_json(
+            f"{self.api_base_url}/user/repos",
+            access_token,
+            "Failed to get repositories",
+            params=params,
         )
 
-        if response.status_code != 200:
-            raise Exception(f"Failed to get repositories: {response.text}")
-
-        return response.json()
+    async def iter_user_repositories(
+        self,
+        access_token: str,
+        sort: str = "updated",
+        with_languages: bool = False,
+        concurrency: int = settings.GITHUB_PAGINATION_CONCURRENCY,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream all of a user's repositories, fetching pages concurrently
+
+        The first page's Link header gives the page count; the remaining pages
+        (and, with ``with_languages``, each repository's language breakdown)
+        are fetched under one shared concurrency bound. Repositories are
+        yielded page by page as each page completes, not in sort order.
+        """
+        url = f"{self.api_base_url}/user/repos"
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def languages(repository: Dict[str, Any]) -> Dict[str, Any]:
+            async with semaphore:
+                owner, name = repository["full_name"].split("/", 1)
+                languages = await self.get_repository_languages(
+                    access_token, owner, name
+                )
+            # A copy: the page body may be shared with the response cache
+            return {**repository, "languages": languages}
+
+        async def fetch_page(page: int) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+            params = {"per_page": 100, "page": page, "sort": sort, "direction": "desc"}
+            async with semaphore:
+                repositories, link = await self._fetch_json(
+                    url, access_token, "Failed to get repositories", params=params
+                )
+            if with_languages:
+                repositories = list(
+                    await asyncio.gather(*(languages(r) for r in repositories))
+                )
+            return repositories, link
+
+        first_page, link = await fetch_page(1)
+        for repository in first_page:
+            yield repository
+
+        tasks = [
+            asyncio.create_task(fetch_page(page))
+            for page in range(2, last_page_from_link(link) + 1)
+        ]
+        try:
+            for next_page in asyncio.as_completed(tasks):
+                repositories, _ = await next_page
+                for repository in repositories:
+                    yield repository
+        finally:
+            for task in tasks:
+                task.cancel()
 
     async def get_repository_info(
         self, access_token: str, owner: str, repo: str
     ) -> Dict[str, Any]:
         """Get specific repository information"""
-        headers = {
-            "Authorization": f"Bearer {access_token}",
-            "Accept": "application/vnd.github.v3+json",
-        }
-
-        response = await self.client.get(
-            f"{self.api_base_url}/repos/{owner}/{repo}", headers=headers
+        return await self._get_json(
+            f"{self.api_base_url}/repos/{owner}/{repo}",
+            access_token,
+            "Failed to get repository info",
         )
 
-        if response.status_code != 200:
-            raise Exception(f"Failed to get repository info: {response.text}")
-
-        return response.json()
-
     async def get_repository_languages(
         self, access_token: str, owner: str, repo: str
     ) -> Dict[str, int]:
         """Get repository languages"""
-        headers = {
-            "Authorization": f"Bearer {access_token}",
-            "Accept": "application/vnd.github.v3+json",
-        }
+        return await self._get_json(
+            f"{self.api_base_url}/repos/{owner}/{repo}/languages",
+            access_token,
+            "Failed to get repository languages",
+        )
 
-        response = await self.client.get(
-            f"{self.api_base_url}/repos/{owner}/{repo}/languages", headers=headers
+    async def get_commit_sha(
+        self, access_token: str, owner: str, repo: str, ref: str
+    ) -> str:
+        """Resolve a branch, tag or SHA to its commit SHA"""
+        commit = await self._get_json(
+            f"{self.api_base_url}/repos/{owner}/{repo}/commits/{ref}",
+            access_token,
+            "Failed to get commit",
+        )
+        return commit["sha"]
+
+    async def get_repository_tree(
+        self, access_token: str, owner: str, repo: str, ref: str
+    ) -> List[Dict[str, Any]]:
+        """Get every blob in a repository tree (path, sha, size) in one call"""
+        tree = await self._get_json(
+            f"{self.api_base_url}/repos/{owner}/{repo}/git/trees/{ref}",
+            access_token,
+            "Failed to get repository tree",
+            params={"recursive": "1"},
+        )
+        return [entry for entry in tree.get("tree", []) if entry["type"] == "blob"]
+
+    async def get_blob_content(
+        self, access_token: str, owner: str, repo: str, sha: str
+    ) -> bytes:
+        """Get raw blob content"""
+        response = await self._request(
+            "GET",
+            f"{self.api_base_url}/repos/{owner}/{repo}/git/blobs/{sha}",
+            access_token,
+            headers={"Accept": "application/vnd.github.raw"},
         )
 
         if response.status_code != 200:
-            raise Exception(f"Failed to get repository languages: {response.text}")
+            raise Exception(f"Failed to get blob: {response.text}")
 
-        return response.json()
+        return response.content
+
+    async def _download_archive(
+        self, access_token: str, owner: str, repo: str, ref: str
+    ) -> tempfile.SpooledTemporaryFile:
+        """Download a tarball, in memory up to GITHUB_ARCHIVE_MEMORY_BYTES
+
+        Larger archives spill to a temporary file on disk; anything over
+        GITHUB_ARCHIVE_MAX_BYTES is aborted mid-download.
+        """
+        archive = tempfile.SpooledTemporaryFile(
+            max_size=settings.GITHUB_ARCHIVE_MEMORY_BYTES
+        )
+        try:
+            response = await self._request(
+                "GET",
+                f"{self.api_base_url}/repos/{owner}/{repo}/tarball/{ref}",
+                access_token,
+                stream=True,
+            )
+            try:
+                if response.status_code != 200:
+                    await response.aread()
+                    raise Exception(f"Failed to download archive: {response.text}")
+                async for chunk in response.aiter_bytes():
+                    archive.write(chunk)
+                    if archive.tell() > settings.GITHUB_ARCHIVE_MAX_BYTES:
+                        raise ArchiveTooLarge(
+                            f"Archive for {owner}/{repo} exceeds "
+                            f"{settings.GITHUB_ARCHIVE_MAX_BYTES} bytes"
+                        )
+            finally:
+                await response.aclose()
+        except BaseException:
+            archive.close()
+            raise
+        archive.seek(0)
+        return archive
+
+    async def iter_repository_archive(
+        self,
+        access_token: str,
+        owner: str,
+        repo: str,
+        ref: str,
+        extensions: Optional[Sequence[str]] = None,
+        max_file_bytes: Optional[int] = settings.GITHUB_ARCHIVE_MAX_FILE_BYTES,
+        exclude_dirs: Iterable[str] = (),
+    ) -> AsyncIterator[ArchiveFile]:
+        """Stream a repository's files from its tarball as (path, size, content)
+
+        One API call replaces a contents/blob request per file. Files are read
+        lazily, one at a time, off the event loop; those over
+        ``max_file_bytes``, not ending in one of ``extensions`` or under one
+        of ``exclude_dirs`` are skipped without being read.
+        """
+        archive = await self._download_archive(access_token, owner, repo, ref)
+        reader = None
+        try:
+            reader = await asyncio.to_thread(
+                TarballReader, archive, extensions, max_file_bytes, exclude_dirs
+            )
+            while True:
+                item = await asyncio.to_thread(reader.next_file)
+                if item is None:
+                    return
+                yield item
+        finally:
+            if reader is not None:
+                reader.close()
+            archive.close()
 
     async def close(self):
         """Close HTTP client"""
         await self.client.aclose()
+        if self.cache:
+            await self.cache.close()
 
 
 # Create singleton instance
@@ -0,0 +1,392 @@
+# backend/src/services/learning_path_service.py
+import hashlib
+import json
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from ..core.config import settings
+from ..core.openai_client import get_openai_client
+from ..core.single_flight import SingleFlight
+from ..database.repositories import (
+    analysis_job_repo,
+    curriculum_template_repo,
+    learning_path_repo,
+    skill_profile_repo,
+)
+from .content_refs import content_refs
+from .dashboard import dashboard_service
+
+LESSON_COUNTS = {"beginner": 8, "intermediate": 6, "advanced": 4}
+
+SYSTEM_PROMPT = (
+    "You design programming curricula. Reply with a JSON object "
+    '{"title": str, "lessons": [{"title": str, "description": str, '
+    '"objectives": [str], "content": str (markdown), "examples": '
+    '[{"title": str, "code": str}], "exercises": [{"prompt": str}], '
+    '"estimated_time": int (minutes), "skills": [str]}]}. '
+    '"skills" lists the technologies each lesson teaches.'
+)
+
+
+def curriculum_key(
+    from_technology: str,
+    to_technology: str,
+    difficulty: str,
+    learning_style: Optional[str],
+    model_version: str,
+) -> str:
+    """Content hash identifying a shared curriculum template"""
+    raw = json.dumps(
+        [
+            from_technology.strip().lower(),
+            to_technology.strip().lower(),
+            difficulty,
+            learning_style or "",
+            model_version,
+        ]
+    )
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+
+def normalize_lessons(lessons: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Lessons in `Lesson` shape with stable ids and 1-based order"""
+    return [
+        {
+            **({"body_ref": lesson["body_ref"]} if lesson.get("body_ref") else {}),
+            "id": f"lesson-{order}",
+            "order": order,
+            "title": lesson.get("title") or f"Lesson {order}",
+            "description": lesson.get("description", ""),
+            "objectives": list(lesson.get("objectives", [])),
+            "content": lesson.get("content", ""),
+            "examples": list(lesson.get("examples", [])),
+            "exercises": list(lesson.get("exercises", [])),
+            "estimated_time": int(lesson.get("estimated_time") or 30),
+            "skills": list(lesson.get("skills", [])),
+            "completed": False,
+            "completed_at": None,
+        }
+        for order, lesson in enumerate(lessons, start=1)
+    ]
+
+
+class CurriculumProvider(ABC):
+    """Generates a curriculum skeleton for a technology pair"""
+
+    model_version = settings.CURRICULUM_MODEL_VERSION
+
+    @abstractmethod
+    async def generate(
+        self,
+        from_technology: str,
+        to_technology: str,
+        difficulty: str,
+        learning_style: Optional[str],
+    ) -> Dict[str, Any]:
+        """{"title": ..., "lessons": [...]}"""
+
+
+class FakeCurriculumProvider(CurriculumProvider):
+    """Deterministic local stand-in (tests, dev)"""
+
+    # Kept apart from real model output in the template cache
+    model_version = "fake"
+
+    async def generate(
+        self,
+        from_technology: str,
+        to_technology: str,
+        difficulty: str,
+        learning_style: Optional[str],
+    ) -> Dict[str, Any]:
+        count = LESSON_COUNTS.get(difficulty, LESSON_COUNTS["intermediate"])
+        lessons = [
+            {
+                "title": f"From {from_technology} to {to_technology}",
+                "description": f"How {from_technology} concepts map onto "
+                f"{to_technology}",
+                "objectives": [f"Relate {from_technology} idioms to {to_technology}"],
+                "content": f"# {from_technology} → {to_technology}\n",
+                "estimated_time": 30,
+                "skills": [from_technology, to_technology],
+            }
+        ]
+        for part in range(1, count):
+            lessons.append(
+                {
+                    "title": f"{to_technology} essentials, part {part}",
+                    "description": f"Core {to_technology} topic {part}",
+                    "objectives": [f"Apply {to_technology} topic {part}"],
+                    "content": f"# {to_technology} topic {part}\n",
+                    "exercises": (
+                        [{"prompt": f"Build a small {to_technology} feature"}]
+                        if learning_style == "hands-on"
+                        else []
+                    ),
+                    "estimated_time": 45,
+                    "skills": [to_technology],
+                }
+            )
+        return {"title": f"{from_technology} to {to_technology}", "lessons": lessons}
+
+
+class OpenAICurriculumProvider(CurriculumProvider):
+    """Generates curricula with the OpenAI chat completions JSON mode"""
+
+    def __init__(self, model: str = settings.CURRICULUM_MODEL):
+        self.model = model
+        self.model_version = f"openai:{model}:{settings.CURRICULUM_MODEL_VERSION}"
+
+    @property
+    def client(self):
+        return get_openai_client()
+
+    async def generate(
+        self,
+        from_technology: str,
+        to_technology: str,
+        difficulty: str,
+        learning_style: Optional[str],
+    ) -> Dict[str, Any]:
+        prompt = (
+            f"Create a {difficulty} curriculum for a developer who knows "
+            f"{from_technology} and wants to learn {to_technology}."
+        )
+        if learning_style:
+            prompt += f" Preferred learning style: {learning_style}."
+        response = await self.client.chat.completions.create(
+            model=self.model,
+            messages=[
+                {"role": "system", "content": SYSTEM_PROMPT},
+                {"role": "user", "content": prompt},
+            ],
+            response_format={"type": "json_object"},
+        )
+        curriculum = json.loads(response.choices[0].message.content or "{}")
+        if not curriculum.get("lessons"):
+            raise Exception("Curriculum generation returned no lessons")
+        return curriculum
+
+
+def create_curriculum_provider() -> CurriculumProvider:
+    """Build the provider selected by CURRICULUM_PROVIDER"""
+    provider = settings.CURRICULUM_PROVIDER
+    if provider == "openai":
+        return OpenAICurriculumProvider()
+    if provider == "fake":
+        return FakeCurriculumProvider()
+    # A typo must not silently cache fake curricula as shared templates
+    raise ValueError(f"Unknown CURRICULUM_PROVIDER: {provider!r}")
+
+
+def personalize(
+    template: Dict[str, Any],
+    skills: Dict[str, float],
+    skip_proficiency: float = settings.LEARNING_SKIP_PROFICIENCY,
+) -> Dict[str, Any]:
+    """Fit a shared template to one user's skill profile
+
+    Lessons whose skills the user already has at `skip_proficiency` or above
+    are dropped (unless that would drop them all). Returns {lessons,
+    estimated_hours, skipped} for the learning path.
+    """
+    known = {
+        name.lower() for name, score in skills.items() if score >= skip_proficiency
+    }
+    kept, skipped = [], []
+    for lesson in template["lessons"]:
+        lesson_skills = {skill.lower() for skill in lesson.get("skills", [])}
+        if lesson_skills and lesson_skills <= known:
+            skipped.append(lesson["title"])
+        else:
+            kept.append(lesson)
+    if not kept:
+        kept, skipped = template["lessons"], []
+
+    lessons = normalize_lessons(kept)
+    minutes = sum(lesson["estimated_time"] for lesson in lessons)
+    return {
+        "lessons": lessons,
+        "estimated_hours": round(minutes / 60, 1),
+        "skipped": skipped,
+    }
+
+
+class LearningPathService:
+    """Builds learning paths from shared, cached curriculum templates
+
+    The expensive part (model generation) runs once per (from, to,
+    difficulty, learning style); each user's path is that template with
+    lessons they already know removed.
+    """
+
+    def __init__(self, provider: Optional[CurriculumProvider] = None):
+        self.provider = provider or create_curriculum_provider()
+        self._templates: SingleFlight[Dict[str, Any]] = SingleFlight()
+
+    def template_key(self, path: Dict[str, Any]) -> str:
+        return curriculum_key(
+            path["from_technology"]["technology"],
+            path["to_technology"]["technology"],
+            path["difficulty"],
+            path.get("learning_style"),
+            self.provider.model_version,
+        )
+
+    async def _generate_template(
+        self, key: str, path: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        curriculum = await self.provider.generate(
+            path["from_technology"]["technology"],
+            path["to_technology"]["technology"],
+            path["difficulty"],
+            path.get("learning_style"),
+        )
+        # Bodies go to the blob store once, shared by every personalized path
+        lessons = await content_refs.offload_lessons(
+            normalize_lessons(curriculum["lessons"])
+        )
+        return await curriculum_template_repo.store(
+            key,
+            {
+                "from_technology": path["from_technology"]["technology"],
+                "to_technology": path["to_technology"]["technology"],
+                "difficulty": path["difficulty"],
+                "learning_style": path.get("learning_style"),
+                "model_version": self.provider.model_version,
+                "title": curriculum.get("title")
+                or f"{path['from_technology']['technology']} to "
+                f"{path['to_technology']['technology']}",
+                "lessons": lessons,
+                "estimated_hours": round(
+                    sum(lesson["estimated_time"] for lesson in lessons) / 60, 1
+                ),
+            },
+        )
+
+    async def get_template(self, path: Dict[str, Any]) -> Dict[str, Any]:
+        """The shared template for a path, generated once for concurrent callers"""
+        key = self.template_key(path)
+        template = await curriculum_template_repo.find_by_key(key)
+        if template is not None:
+            return template
+
+        template, _ = await self._templates.run(
+            key, lambda: self._generate_template(key, path)
+        )
+        return template
+
+    async def create_path(
+        self, user_id: Any, request: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Store a `generating` learning path and queue its generation job
+
+        Paths whose template is already cached get a higher job priority:
+        they only need personalizing, which takes milliseconds.
+        """
+        path = await learning_path_repo.create(
+            {
+                "user_id": user_id,
+                "title": request.get("title")
+                or f"{request['from_technology']['technology']} to "
+                f"{request['to_technology']['technology']}",
+                "from_technology": request["from_technology"],
+                "to_technology": request["to_technology"],
+                "lessons": [],
+                "estimated_hours": 0.0,
+                "difficulty": request["difficulty"],
+                "progress": 0.0,
+                "status": "generating",
+                "learning_style": request.get("learning_style"),
+                "time_commitment": request.get("time_commitment"),
+                "deadline": request.get("deadline"),
+            }
+        )
+        cached = await curriculum_template_repo.exists(self.template_key(path))
+        job = await analysis_job_repo.create(
+            {
+                "user_id": user_id,
+                "type": "learning_path",
+                "status": "queued",
+                "priority": (
+                    settings.LEARNING_PATH_CACHED_PRIORITY
+                    if cached
+                    else settings.LEARNING_PATH_PRIORITY
+                ),
+                "params": {"learning_path_id": str(path["_id"])},
+                "progress": {
+                    "percentage": 0,
+                    "current_step": "queued",
+                    "current_file": "",
+                    "steps": [],
+                    "metrics": {},
+                },
+                "retries": 0,
+                "max_retries": 3,
+            }
+        )
+        await learning_path_repo.update_by_id(str(path["_id"]), {"job_id": job["_id"]})
+        await dashboard_service.invalidate(user_id)
+        return {**path, "job_id": job["_id"]}
+
+    async def generate(self, job: Dict[str, Any]) -> Dict[str, Any]:
+        path_id = job["params"]["learning_path_id"]
+        path = await learning_path_repo.find_by_id(path_id)
+        if not path:
+            raise Exception("Learning path not found")
+        if path["status"] != "generating" and path.get("lessons"):
+            # Already generated by an earlier attempt
+            return {"learning_path_id": path_id, "unchanged": True}
+
+        try:
+            profile = await skill_profile_repo.find_by_user(
+                str(path["user_id"]),
+                projection={"skills.technology": 1, "skills.proficiency": 1},
+            )
+            skills = {
+                skill["technology"]: skill.get("proficiency", 0.0)
+                for skill in (profile or {}).get("skills", [])
+            }
+            template = await self.get_template(path)
+            personalized = personalize(template, skills)
+            current_proficiency = skills.get(
+                path["from_technology"]["technology"],
+                path["from_technology"].get("current_proficiency"),
+            )
+            await learning_path_repo.update_by_id(
+                path_id,
+                {
+                    "lessons": personalized["lessons"],
+                    "estimated_hours": personalized["estimated_hours"],
+                    "status": "active",
+                    "started_at": datetime.utcnow(),
+                    "template_key": template["key"],
+                    "from_technology.current_proficiency": current_proficiency,
+                    "personalization": {
+                        "skipped_lessons": personalized["skipped"],
+                        "template_lessons": len(template["lessons"]),
+                    },
+                },
+            )
+        except Exception:
+            await learning_path_repo.update_by_id(path_id, {"status": "failed"})
+            raise
+        finally:
+            await dashboard_service.invalidate(path["user_id"])
+
+        return {
+            "learning_path_id": path_id,
+            "template_key": template["key"],
+            "template_hits": template.get("hits", 0),
+            "lessons": len(personalized["lessons"]),
+            "skipped_lessons": len(personalized["skipped"]),
+        }
+
+
+learning_path_service = LearningPathService()
+
+
+async def run_learning_path_generation(job: Dict[str, Any]) -> Dict[str, Any]:
+    """Job handler for `learning_path` analysis jobs"""
+    return await learning_path_service.generate(job)
@@ -0,0 +1,80 @@
+# backend/src/services/oauth_state_store.py
+import json
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from ..core.config import settings
+from ..core.redis import get_redis
+
+
+class OAuthStateStore(ABC):
+    """One-time OAuth `state` values with expiry"""
+
+    @abstractmethod
+    async def put(self, state: str, data: Dict[str, Any]):
+        ...
+
+    @abstractmethod
+    async def pop(self, state: str) -> Optional[Dict[str, Any]]:
+        """Return and remove the state's data, or None if unknown or expired"""
+
+
+class MemoryOAuthStateStore(OAuthStateStore):
+    """Single-process store with TTL expiry and an LRU size cap"""
+
+    def __init__(self, ttl: float, max_entries: int):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._states: "OrderedDict[str, tuple]" = OrderedDict()
+
+    def _purge_expired(self, now: float):
+        # Entries are in insertion order, so expired ones are at the front
+        while self._states:
+            state, (expires_at, _) = next(iter(self._states.items()))
+            if expires_at > now:
+                break
+            del self._states[state]
+
+    async def put(self, state: str, data: Dict[str, Any]):
+        now = time.monotonic()
+        self._purge_expired(now)
+        self._states[state] = (now + self.ttl, data)
+        while len(self._states) > self.max_entries:
+            self._states.popitem(last=False)
+
+    async def pop(self, state: str) -> Optional[Dict[str, Any]]:
+        item = self._states.pop(state, None)
+        if item is None or item[0] <= time.monotonic():
+            return None
+        return item[1]
+
+
+class RedisOAuthStateStore(OAuthStateStore):
+    """Store shared by all workers; GETDEL makes consumption atomic"""
+
+    prefix = "oauth_state:"
+
+    def __init__(self, ttl: float):
+        self.redis = get_redis()
+        self.ttl = int(ttl)
+
+    async def put(self, state: str, data: Dict[str, Any]):
+        await self.redis.set(self.prefix + state, json.dumps(data), ex=self.ttl)
+
+    async def pop(self, state: str) -> Optional[Dict[str, Any]]:
+        raw = await self.redis.getdel(self.prefix + state)
+        return json.loads(raw) if raw else None
+
+
+def create_oauth_state_store() -> OAuthStateStore:
+    """Build the state store selected by OAUTH_STATE_BACKEND"""
+    if settings.OAUTH_STATE_BACKEND == "redis":
+        return RedisOAuthStateStore(settings.OAUTH_STATE_TTL_SECONDS)
+    return MemoryOAuthStateStore(
+        settings.OAUTH_STATE_TTL_SECONDS, settings.OAUTH_STATE_MAX_ENTRIES
+    )
+
+
+oauth_state_store = create_oauth_state_store()
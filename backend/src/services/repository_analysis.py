@@ -0,0 +1,320 @@
+# backend/src/services/repository_analysis.py
+import asyncio
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import bson
+
+from ..core.config import settings
+from ..core.process_pool import run_in_process
+from ..database.repositories import (
+    analysis_job_repo,
+    repository_file_repo,
+    repository_repo,
+    user_repo,
+)
+from .code_metrics import MetricsAnalyzer
+from .file_analysis import FileAnalyzer, LanguageAnalyzer, analyze_files
+from .dashboard import dashboard_service
+from .github_service import github_service
+from .skill_aggregation import skill_aggregator
+from .technology_detection import TechnologyAnalyzer
+
+# Bump when per-file results change shape so stale indexes are rebuilt
+ANALYSIS_VERSION = 3
+
+IGNORED_DIRECTORIES = {
+    ".git",
+    "node_modules",
+    "dist",
+    "build",
+    "vendor",
+    "__pycache__",
+    ".next",
+    "coverage",
+}
+
+# path -> (blob sha, {analyzer name: result})
+FileIndex = Dict[str, Tuple[str, Dict[str, Any]]]
+
+default_analyzers: List[FileAnalyzer] = [
+    LanguageAnalyzer(),
+    TechnologyAnalyzer(),
+    MetricsAnalyzer(),
+]
+
+
+def is_analyzable(entry: Dict[str, Any], max_bytes: int) -> bool:
+    directories = entry["path"].split("/")[:-1]
+    return entry.get("size", 0) <= max_bytes and not IGNORED_DIRECTORIES.intersection(
+        directories
+    )
+
+
+async def load_file_index(repository: Dict[str, Any]) -> FileIndex:
+    """Previous per-file results, or empty if missing or from an older version"""
+    cached = repository.get("cached_files") or {}
+    if cached.get("version") != ANALYSIS_VERSION:
+        return {}
+    if cached.get("storage") == "external":
+        return await repository_file_repo.load_index(repository["_id"])
+    return {path: (sha, result) for path, sha, result in cached.get("files", [])}
+
+
+async def save_file_index(
+    repository: Dict[str, Any], previous: FileIndex, index: FileIndex
+) -> Dict[str, Any]:
+    """Persist the index inline, or in `repositoryFiles` once it gets large
+
+    Returns the `cached_files` value to store on the repository. External
+    indexes are updated incrementally: only changed and removed paths are
+    written. An external index from another ANALYSIS_VERSION (loaded as
+    empty) is cleared first, so rows for since-deleted paths don't linger.
+    """
+    cached = repository.get("cached_files") or {}
+    was_external = cached.get("storage") == "external"
+    files = [[path, sha, result] for path, (sha, result) in index.items()]
+    inline_size = len(bson.encode({"files": files}))
+    if inline_size <= settings.REPOSITORY_INLINE_INDEX_MAX_BYTES:
+        if was_external:
+            await repository_file_repo.delete_index(repository["_id"])
+        return {"version": ANALYSIS_VERSION, "storage": "inline", "files": files}
+
+    base = previous if was_external else {}
+    if was_external and cached.get("version") != ANALYSIS_VERSION:
+        await repository_file_repo.delete_index(repository["_id"])
+        base = {}
+    changed = {path: item for path, item in index.items() if base.get(path) != item}
+    removed = [path for path in base if path not in index]
+    await repository_file_repo.apply_changes(repository["_id"], changed, removed)
+    return {"version": ANALYSIS_VERSION, "storage": "external", "count": len(index)}
+
+
+class RepositoryAnalysis:
+    """Incremental analysis of a repository at its branch head
+
+    Unchanged blobs (same path and SHA as the last analyzed commit) reuse
+    their stored per-file results; only new or modified files are fetched
+    and analyzed.
+    """
+
+    def __init__(
+        self,
+        job: Dict[str, Any],
+        analyzers: Optional[List[FileAnalyzer]] = None,
+        concurrency: int = settings.REPOSITORY_ANALYSIS_CONCURRENCY,
+        max_file_bytes: int = settings.REPOSITORY_ANALYSIS_MAX_FILE_BYTES,
+        archive_min_files: int = settings.REPOSITORY_ARCHIVE_MIN_FILES,
+        batch_files: int = settings.ANALYSIS_BATCH_FILES,
+        file_timeout: float = settings.ANALYSIS_FILE_TIMEOUT_SECONDS,
+    ):
+        self.job = job
+        self.job_id = str(job["_id"])
+        self.analyzers = analyzers or default_analyzers
+        self.concurrency = concurrency
+        self.max_file_bytes = max_file_bytes
+        self.archive_min_files = archive_min_files
+        self.batch_files = batch_files
+        self.file_timeout = file_timeout
+
+    def _report(self, step: str, percentage: int, metrics: Dict[str, Any]):
+        analysis_job_repo.queue_progress(
+            self.job_id,
+            {"current_step": step, "percentage": percentage, "metrics": metrics},
+        )
+
+    async def _analyze_changed(
+        self,
+        access_token: str,
+        owner: str,
+        name: str,
+        commit_sha: str,
+        entries: List[Dict[str, Any]],
+    ) -> FileIndex:
+        """Fetch and analyze changed files
+
+        Many changes are read from one tarball download; a handful (and any
+        file missing from the archive) are fetched blob by blob. Files are
+        analyzed in batches on the process pool while fetching continues;
+        the number of batches in flight is bounded so downloaded content
+        can't pile up ahead of the analyzers.
+        """
+        analyzed: FileIndex = {}
+        batch: List[Tuple[Dict[str, Any], bytes]] = []
+        tasks: Set[asyncio.Task] = set()
+        in_flight = asyncio.Semaphore(self.concurrency)
+
+        async def run_batch(files: List[Tuple[Dict[str, Any], bytes]]):
+            try:
+                results = await run_in_process(
+                    analyze_files,
+                    self.analyzers,
+                    [(entry["path"], content) for entry, content in files],
+                    self.file_timeout,
+                )
+            finally:
+                in_flight.release()
+            for (entry, _), result in zip(files, results):
+                analyzed[entry["path"]] = (entry["sha"], result)
+            self._report(
+                "analyzing",
+                10 + round(len(analyzed) / len(entries) * 80),
+                {"changed_files": len(entries), "analyzed_files": len(analyzed)},
+            )
+
+        async def submit():
+            nonlocal batch
+            files, batch = batch, []
+            if files:
+                await in_flight.acquire()
+                tasks.add(asyncio.create_task(run_batch(files)))
+
+        async def record(entry: Dict[str, Any], content: bytes):
+            batch.append((entry, content))
+            if len(batch) >= self.batch_files:
+                await submit()
+
+        if len(entries) >= self.archive_min_files:
+            wanted = {entry["path"]: entry for entry in entries}
+            async for path, _, content in github_service.iter_repository_archive(
+                access_token,
+                owner,
+                name,
+                commit_sha,
+                max_file_bytes=self.max_file_bytes,
+                exclude_dirs=IGNORED_DIRECTORIES,
+            ):
+                entry = wanted.pop(path, None)
+                if entry is not None:
+                    await record(entry, content)
+            entries_left = list(wanted.values())
+        else:
+            entries_left = entries
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def fetch(entry: Dict[str, Any]):
+            async with semaphore:
+                content = await github_service.get_blob_content(
+                    access_token, owner, name, entry["sha"]
+                )
+            await record(entry, content)
+
+        try:
+            await asyncio.gather(*(fetch(entry) for entry in entries_left))
+            await submit()
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+        return analyzed
+
+    def aggregate(self, index: FileIndex) -> Dict[str, Any]:
+        updates = {}
+        for analyzer in self.analyzers:
+            results = (
+                (path, result[analyzer.name])
+                for path, (_, result) in index.items()
+                if analyzer.name in result
+            )
+            updates.update(analyzer.aggregate(results))
+        return updates
+
+    async def run(self) -> Dict[str, Any]:
+        repository_id = str(self.job["repository_id"])
+        repository = await repository_repo.find_by_id(repository_id)
+        user = await user_repo.find_by_id(
+            str(self.job["user_id"]), projection={"github_access_token": 1}
+        )
+        if not repository or not user or not user.get("github_access_token"):
+            raise Exception("Repository or GitHub credentials not found")
+        access_token = user["github_access_token"]
+        owner, name = repository["full_name"].split("/", 1)
+
+        try:
+            commit_sha = await github_service.get_commit_sha(
+                access_token, owner, name, repository.get("branch", "main")
+            )
+            previous = await load_file_index(repository)
+            if (
+                commit_sha == repository.get("last_commit_sha")
+                and repository.get("status") == "completed"
+                and previous
+            ):
+                # Finishes a skill update interrupted after the last analysis
+                await skill_aggregator.apply_repository(
+                    repository, repository.get("technologies") or {}
+                )
+                return {"commit_sha": commit_sha, "unchanged": True}
+
+            await repository_repo.update_by_id(repository_id, {"status": "analyzing"})
+            await dashboard_service.invalidate(repository["user_id"])
+            self._report("listing files", 5, {})
+            tree = [
+                entry
+                for entry in await github_service.get_repository_tree(
+                    access_token, owner, name, commit_sha
+                )
+                if is_analyzable(entry, self.max_file_bytes)
+            ]
+
+            index: FileIndex = {}
+            changed = []
+            for entry in tree:
+                cached = previous.get(entry["path"])
+                # Timed-out files are retried rather than reused
+                if (
+                    cached
+                    and cached[0] == entry["sha"]
+                    and not cached[1].get("timed_out")
+                ):
+                    index[entry["path"]] = cached
+                else:
+                    changed.append(entry)
+            index.update(
+                await self._analyze_changed(
+                    access_token, owner, name, commit_sha, changed
+                )
+            )
+
+            self._report("aggregating", 95, {"changed_files": len(changed)})
+            updates = self.aggregate(index)
+            updates.update(
+                {
+                    "status": "completed",
+                    "analyzed_at": datetime.utcnow(),
+                    "last_commit_sha": commit_sha,
+                    "cached_files": await save_file_index(repository, previous, index),
+                }
+            )
+            await repository_repo.update_by_id(repository_id, updates)
+        except Exception:
+            await repository_repo.update_by_id(repository_id, {"status": "failed"})
+            await dashboard_service.invalidate(repository["user_id"])
+            raise
+
+        await dashboard_service.invalidate(repository["user_id"])
+        await skill_aggregator.apply_repository(
+            repository,
+            {
+                "languages": updates.get("technologies.languages", []),
+                "frameworks": updates.get("technologies.frameworks", []),
+            },
+        )
+
+        return {
+            "commit_sha": commit_sha,
+            "previous_commit_sha": repository.get("last_commit_sha"),
+            "total_files": len(index),
+            "changed_files": len(changed),
+            "reused_files": len(index) - len(changed),
+            "removed_files": len(set(previous) - set(index)),
+            "timed_out_files": sum(
+                1 for _, result in index.values() if result.get("timed_out")
+            ),
+        }
+
+
+async def run_repository_analysis(job: Dict[str, Any]) -> Dict[str, Any]:
+    """Job handler for `repository` analysis jobs"""
+    return await RepositoryAnalysis(job).run()
@@ -0,0 +1,323 @@
+# backend/src/services/skill_aggregation.py
+import math
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Tuple
+
+from ..core.config import settings
+from ..database.repositories import repository_repo, skill_profile_repo
+from .dashboard import dashboard_service
+
+# Framework signature categories that map to a Skill category other than
+# "framework"
+SKILL_CATEGORIES = {
+    "testing": "tool",
+    "build": "tool",
+    "styling": "library",
+    "database": "library",
+    "data": "library",
+    "ml": "library",
+}
+
+MAX_ATTEMPTS = 5
+STRENGTHS = 5
+
+
+def repository_contribution(technologies: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """What one analyzed repository adds to its owner's skills"""
+    contribution: Dict[str, Dict[str, Any]] = {}
+    for language in technologies.get("languages", []):
+        contribution[language["name"]] = {
+            "technology": language["name"],
+            "category": "language",
+            "lines": language.get("lines", 0),
+        }
+    for framework in technologies.get("frameworks", []):
+        contribution.setdefault(
+            framework["name"],
+            {
+                "technology": framework["name"],
+                "category": SKILL_CATEGORIES.get(framework["category"], "framework"),
+                "lines": 0,
+            },
+        )
+    return sorted(contribution.values(), key=lambda c: c["technology"])
+
+
+def contribution_deltas(
+    old: List[Dict[str, Any]], new: List[Dict[str, Any]]
+) -> List[Dict[str, Any]]:
+    """Per-technology {projects, lines} changes between two contributions"""
+    before = {c["technology"]: c for c in old}
+    after = {c["technology"]: c for c in new}
+    deltas = []
+    for technology in sorted(before.keys() | after.keys()):
+        previous, current = before.get(technology), after.get(technology)
+        projects = (current is not None) - (previous is not None)
+        lines = (current or {}).get("lines", 0) - (previous or {}).get("lines", 0)
+        if projects or lines:
+            deltas.append(
+                {
+                    "technology": technology,
+                    "category": (current or previous)["category"],
+                    "projects": projects,
+                    "lines": lines,
+                }
+            )
+    return deltas
+
+
+def proficiency(experience: Dict[str, Any]) -> float:
+    """0-10: grows with the log of lines written and of projects using it"""
+    lines = max(experience.get("total_lines", 0), 0)
+    projects = max(experience.get("project_count", 0), 0)
+    score = 1.5 * math.log10(1 + lines) + math.log2(1 + projects)
+    return round(min(10.0, score), 2)
+
+
+def confidence(experience: Dict[str, Any]) -> float:
+    """0-1: each additional project halves the remaining uncertainty"""
+    projects = max(experience.get("project_count", 0), 0)
+    return round(1 - 0.5**projects, 3)
+
+
+def with_scores(skill: Dict[str, Any]) -> Dict[str, Any]:
+    experience = skill["experience"]
+    return {
+        **skill,
+        "proficiency": proficiency(experience),
+        "confidence": confidence(experience),
+    }
+
+
+def derived_metrics(skills: List[Dict[str, Any]]) -> Tuple[Dict[str, Any], List[str]]:
+    """Profile metrics (minus total_repositories) and strengths from skills
+
+    Cost is linear in the number of skills, not repositories.
+    """
+    active = [s for s in skills if s["experience"].get("project_count", 0) > 0]
+    by_category: Dict[str, float] = defaultdict(float)
+    for skill in active:
+        by_category[skill["category"]] += skill["proficiency"]
+    metrics = {
+        "total_technologies": len(active),
+        "avg_proficiency": (
+            round(sum(s["proficiency"] for s in active) / len(active), 2)
+            if active
+            else 0.0
+        ),
+        "strongest_category": (
+            max(by_category, key=by_category.get) if by_category else None
+        ),
+    }
+    ranked = sorted(active, key=lambda s: (-s["proficiency"], s["technology"]))
+    return metrics, [s["technology"] for s in ranked[:STRENGTHS]]
+
+
+def new_skill(delta: Dict[str, Any], now: datetime) -> Dict[str, Any]:
+    return {
+        "technology": delta["technology"],
+        "category": delta["category"],
+        "proficiency": 0.0,
+        "experience": {
+            "first_seen": now,
+            "last_used": now,
+            "project_count": 0,
+            "total_lines": 0,
+        },
+        "confidence": 0.0,
+    }
+
+
+class SkillAggregator:
+    """Keeps SkillProfiles in step with analyzed repositories
+
+    Each analysis applies only the difference between the repository's
+    previous and new contribution, via $inc on the affected skills;
+    `reconcile` rebuilds a profile from every repository to correct drift
+    (e.g. a crash between the profile and repository writes).
+    """
+
+    async def _apply(
+        self, user_id: Any, deltas: List[Dict[str, Any]], repositories_delta: int
+    ):
+        if not deltas and not repositories_delta:
+            return
+        profile = await skill_profile_repo.find_by_user(
+            str(user_id), projection={"skills.technology": 1}
+        )
+        if not profile:
+            return
+        now = datetime.utcnow()
+
+        # New technologies need an entry before $inc can target it
+        for _ in range(MAX_ATTEMPTS):
+            existing = {s["technology"] for s in profile.get("skills", [])}
+            missing = [
+                new_skill(delta, now)
+                for delta in deltas
+                if delta["technology"] not in existing and delta["projects"] > 0
+            ]
+            if not missing or await skill_profile_repo.add_missing_skills(
+                profile["_id"], missing
+            ):
+                break
+            profile = await skill_profile_repo.find_by_id(
+                str(profile["_id"]), projection={"skills.technology": 1}
+            )
+
+        updated = await skill_profile_repo.apply_skill_deltas(
+            profile["_id"], deltas, repositories_delta, now
+        )
+        touched = {delta["technology"] for delta in deltas}
+        emptied = [
+            s["technology"]
+            for s in updated["skills"]
+            if s["technology"] in touched and s["experience"]["project_count"] <= 0
+        ]
+        if emptied:
+            await skill_profile_repo.prune_skills(profile["_id"], emptied)
+
+        for _ in range(MAX_ATTEMPTS):
+            skills = [with_scores(s) for s in updated["skills"]]
+            metrics, strengths = derived_metrics(skills)
+            rescored = [
+                s
+                for s in skills
+                if s["technology"] in touched and s["technology"] not in emptied
+            ]
+            if await skill_profile_repo.set_derived(
+                profile["_id"], updated["revision"], rescored, metrics, strengths
+            ):
+                break
+            updated = await skill_profile_repo.find_by_id(str(profile["_id"]))
+        await dashboard_service.invalidate(user_id)
+
+    async def apply_repository(
+        self, repository: Dict[str, Any], technologies: Dict[str, Any]
+    ) -> List[Dict[str, Any]]:
+        """Fold a (re-)analyzed repository's technologies into its owner's skills
+
+        `repository` is the document as it was before this analysis; its
+        `skill_contribution` is what was applied last time. Re-applying the
+        same technologies is a no-op.
+        """
+        previous = repository.get("skill_contribution")
+        contribution = repository_contribution(technologies)
+        if contribution == previous:
+            return contribution
+        await self._apply(
+            repository["user_id"],
+            contribution_deltas(previous or [], contribution),
+            1 if previous is None else 0,
+        )
+        await repository_repo.update_by_id(
+            str(repository["_id"]), {"skill_contribution": contribution}
+        )
+        return contribution
+
+    async def remove_repository(self, repository: Dict[str, Any]):
+        """Withdraw a repository's contribution (call before deleting it)"""
+        previous = repository.get("skill_contribution")
+        if previous is None:
+            return
+        await self._apply(
+            repository["user_id"], contribution_deltas(previous, []), -1
+        )
+        await repository_repo.update_by_id(
+            str(repository["_id"]), {"skill_contribution": None}
+        )
+
+    async def reconcile(self, profile: Dict[str, Any]) -> bool:
+        """Rebuild a profile from all of its user's repositories
+
+        Returns True if the stored aggregates had drifted.
+        """
+        for _ in range(MAX_ATTEMPTS):
+            totals: Dict[str, Dict[str, Any]] = {}
+            repositories = 0
+            async for repository in repository_repo.iter_by_user(
+                str(profile["user_id"]), projection={"skill_contribution": 1}
+            ):
+                if repository.get("skill_contribution") is None:
+                    continue
+                repositories += 1
+                for item in repository["skill_contribution"]:
+                    total = totals.setdefault(
+                        item["technology"],
+                        {"category": item["category"], "projects": 0, "lines": 0},
+                    )
+                    total["projects"] += 1
+                    total["lines"] += item["lines"]
+
+            now = datetime.utcnow()
+            existing = {s["technology"]: s for s in profile.get("skills", [])}
+            skills = []
+            for technology, total in sorted(totals.items()):
+                experience = existing.get(technology, {}).get("experience", {})
+                skills.append(
+                    with_scores(
+                        {
+                            "technology": technology,
+                            "category": total["category"],
+                            "experience": {
+                                "first_seen": experience.get("first_seen", now),
+                                "last_used": experience.get("last_used", now),
+                                "project_count": total["projects"],
+                                "total_lines": total["lines"],
+                            },
+                        }
+                    )
+                )
+            metrics, strengths = derived_metrics(skills)
+            metrics["total_repositories"] = repositories
+
+            drifted = self._counters(profile) != (repositories, totals)
+            if await skill_profile_repo.replace_aggregates(
+                profile["_id"],
+                profile.get("revision"),
+                skills,
+                metrics,
+                strengths,
+                now,
+            ):
+                if drifted:
+                    await dashboard_service.invalidate(profile["user_id"])
+                return drifted
+            profile = await skill_profile_repo.find_by_id(str(profile["_id"]))
+        return False
+
+    @staticmethod
+    def _counters(profile: Dict[str, Any]) -> Tuple[int, Dict[str, Dict[str, Any]]]:
+        return (
+            (profile.get("metrics") or {}).get("total_repositories", 0),
+            {
+                s["technology"]: {
+                    "category": s["category"],
+                    "projects": s["experience"]["project_count"],
+                    "lines": s["experience"]["total_lines"],
+                }
+                for s in profile.get("skills", [])
+            },
+        )
+
+
+skill_aggregator = SkillAggregator()
+
+
+async def run_skill_reconcile(job: Dict[str, Any]) -> Dict[str, Any]:
+    """Job handler for periodic `skill_reconcile` jobs
+
+    Rebuilds the profiles least recently reconciled, up to
+    SKILL_RECONCILE_BATCH_SIZE per run.
+    """
+    before = datetime.utcnow() - timedelta(
+        seconds=settings.SKILL_RECONCILE_INTERVAL_SECONDS
+    )
+    profiles = await skill_profile_repo.find_due_for_reconcile(
+        before, settings.SKILL_RECONCILE_BATCH_SIZE
+    )
+    drifted = 0
+    for profile in profiles:
+        drifted += await skill_aggregator.reconcile(profile)
+    return {"reconciled_profiles": len(profiles), "drifted_profiles": drifted}
@@ -0,0 +1,436 @@
+# backend/src/services/technology_detection.py
+import json
+import re
+import sys
+import tomllib
+from collections import Counter
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Pattern, Tuple
+
+from .file_analysis import AnalyzerResults, FileAnalyzer, file_language
+
+# [ecosystem, name, version spec or None]
+Package = List[Optional[str]]
+
+# Ecosystem that a language's import statements resolve against
+LANGUAGE_ECOSYSTEMS = {
+    "Python": "pypi",
+    "JavaScript": "npm",
+    "TypeScript": "npm",
+    "Vue": "npm",
+    "Svelte": "npm",
+    "Go": "go",
+    "Rust": "crates",
+    "Ruby": "rubygems",
+    "Java": "maven",
+    "Kotlin": "maven",
+    "Scala": "maven",
+    "PHP": "packagist",
+}
+
+# framework -> (category, {ecosystem: package or import names})
+# A name matches itself and its submodules ("next" matches "next/router");
+# a trailing "*" matches any name with that prefix.
+FRAMEWORK_SIGNATURES: Dict[str, Tuple[str, Dict[str, List[str]]]] = {
+    "React": ("frontend", {"npm": ["react"]}),
+    "Next.js": ("frontend", {"npm": ["next"]}),
+    "Vue": ("frontend", {"npm": ["vue"]}),
+    "Nuxt": ("frontend", {"npm": ["nuxt"]}),
+    "Angular": ("frontend", {"npm": ["@angular/core"]}),
+    "Svelte": ("frontend", {"npm": ["svelte"]}),
+    "SvelteKit": ("frontend", {"npm": ["@sveltejs/kit"]}),
+    "Remix": ("frontend", {"npm": ["@remix-run/react"]}),
+    "Astro": ("frontend", {"npm": ["astro"]}),
+    "Gatsby": ("frontend", {"npm": ["gatsby"]}),
+    "React Native": ("mobile", {"npm": ["react-native"]}),
+    "Electron": ("desktop", {"npm": ["electron"]}),
+    "Express": ("backend", {"npm": ["express"]}),
+    "NestJS": ("backend", {"npm": ["@nestjs/core"]}),
+    "Fastify": ("backend", {"npm": ["fastify"]}),
+    "Vite": ("build", {"npm": ["vite"]}),
+    "Webpack": ("build", {"npm": ["webpack"]}),
+    "Tailwind CSS": ("styling", {"npm": ["tailwindcss"]}),
+    "Jest": ("testing", {"npm": ["jest"]}),
+    "Vitest": ("testing", {"npm": ["vitest"]}),
+    "Django": ("backend", {"pypi": ["django"]}),
+    "Flask": ("backend", {"pypi": ["flask"]}),
+    "FastAPI": ("backend", {"pypi": ["fastapi"]}),
+    "SQLAlchemy": ("database", {"pypi": ["sqlalchemy"]}),
+    "Celery": ("backend", {"pypi": ["celery"]}),
+    "PyTorch": ("ml", {"pypi": ["torch"]}),
+    "TensorFlow": ("ml", {"pypi": ["tensorflow"]}),
+    "pandas": ("data", {"pypi": ["pandas"]}),
+    "pytest": ("testing", {"pypi": ["pytest"]}),
+    "Gin": ("backend", {"go": ["github.com/gin-gonic/gin"]}),
+    "Echo": ("backend", {"go": ["github.com/labstack/echo*"]}),
+    "Fiber": ("backend", {"go": ["github.com/gofiber/fiber*"]}),
+    "Actix Web": ("backend", {"crates": ["actix-web", "actix_web"]}),
+    "Axum": ("backend", {"crates": ["axum"]}),
+    "Rocket": ("backend", {"crates": ["rocket"]}),
+    "Tokio": ("runtime", {"crates": ["tokio"]}),
+    "Ruby on Rails": ("backend", {"rubygems": ["rails"]}),
+    "Sinatra": ("backend", {"rubygems": ["sinatra"]}),
+    "Spring Boot": ("backend", {"maven": ["org.springframework.boot*"]}),
+    "Laravel": ("backend", {"packagist": ["laravel/framework", "Illuminate*"]}),
+    "Symfony": ("backend", {"packagist": ["symfony/*", "Symfony*"]}),
+}
+
+
+def _compile_signatures() -> Dict[str, Tuple[Pattern[str], List[str]]]:
+    """One alternation per ecosystem; the matching group indexes the framework"""
+    alternatives: Dict[str, List[str]] = {}
+    frameworks: Dict[str, List[str]] = {}
+    for framework, (_, ecosystems) in FRAMEWORK_SIGNATURES.items():
+        for ecosystem, names in ecosystems.items():
+            for name in names:
+                if name.endswith("*"):
+                    pattern = re.escape(name[:-1])
+                else:
+                    pattern = re.escape(name) + r"(?:$|[/.:\\])"
+                alternatives.setdefault(ecosystem, []).append(f"({pattern})")
+                frameworks.setdefault(ecosystem, []).append(framework)
+    return {
+        ecosystem: (
+            re.compile("|".join(patterns), re.IGNORECASE),
+            frameworks[ecosystem],
+        )
+        for ecosystem, patterns in alternatives.items()
+    }
+
+
+_SIGNATURES = _compile_signatures()
+
+
+@lru_cache(maxsize=65536)
+def match_framework(ecosystem: str, name: str) -> Optional[str]:
+    """Framework a package or import name belongs to, if any"""
+    signatures = _SIGNATURES.get(ecosystem)
+    if signatures is None:
+        return None
+    pattern, frameworks = signatures
+    match = pattern.match(name)
+    return frameworks[match.lastindex - 1] if match else None
+
+
+# Imports
+
+_PYTHON_IMPORT = re.compile(
+    r"^[ \t]*(?:from[ \t]+([A-Za-z_][\w.]*)[ \t]+import|import[ \t]+([A-Za-z_][\w.]*))",
+    re.MULTILINE,
+)
+_JS_IMPORT = re.compile(
+    r"""(?:\bfrom\s*|\bimport\s*\(?\s*|\brequire\s*\(\s*)['"]([^'"\n]+)['"]"""
+)
+_GO_IMPORT = re.compile(r'\bimport\s+(?:[\w.]+\s+)?"([^"\n]+)"')
+_GO_IMPORT_BLOCK = re.compile(r"\bimport\s*\((.*?)\)", re.DOTALL)
+_GO_IMPORT_LINE = re.compile(r'"([^"\n]+)"')
+_RUST_IMPORT = re.compile(
+    r"^[ \t]*(?:pub(?:\([\w ]+\))?[ \t]+)?(?:use|extern[ \t]+crate)[ \t]+(\w+)",
+    re.MULTILINE,
+)
+_JVM_IMPORT = re.compile(r"^[ \t]*import[ \t]+(?:static[ \t]+)?([\w.]+)", re.MULTILINE)
+_RUBY_IMPORT = re.compile(r"""^[ \t]*require[ \t(]+['"]([^'"\n]+)['"]""", re.MULTILINE)
+_PHP_IMPORT = re.compile(r"^[ \t]*use[ \t]+\\?([\w\\]+)", re.MULTILINE)
+
+_RUST_LOCAL = {"crate", "self", "super", "std", "core", "alloc"}
+_JVM_PLATFORM = ("java.", "javax.", "kotlin.", "scala.")
+MAX_IMPORTS_PER_FILE = 100
+
+
+def _npm_module(specifier: str) -> Optional[str]:
+    if specifier.startswith((".", "/", "~", "@/", "node:")):
+        return None
+    parts = specifier.split("/")
+    return "/".join(parts[:2]) if specifier.startswith("@") else parts[0]
+
+
+def _go_imports(text: str) -> List[str]:
+    imports = _GO_IMPORT.findall(text)
+    for block in _GO_IMPORT_BLOCK.findall(text):
+        imports.extend(_GO_IMPORT_LINE.findall(block))
+    # Standard library paths have no domain
+    return [path for path in imports if "." in path.split("/")[0]]
+
+
+def extract_imports(language: str, text: str) -> List[str]:
+    """Top-level third-party modules imported by a source file"""
+    if language == "Python":
+        modules = [
+            (m[0] or m[1]).split(".")[0].lower() for m in _PYTHON_IMPORT.findall(text)
+        ]
+        modules = [m for m in modules if m not in sys.stdlib_module_names]
+    elif language in ("JavaScript", "TypeScript", "Vue", "Svelte"):
+        modules = [_npm_module(m) for m in _JS_IMPORT.findall(text)]
+    elif language == "Go":
+        modules = _go_imports(text)
+    elif language == "Rust":
+        modules = [m for m in _RUST_IMPORT.findall(text) if m not in _RUST_LOCAL]
+    elif language in ("Java", "Kotlin", "Scala"):
+        modules = [
+            ".".join(m.split(".")[:4])
+            for m in _JVM_IMPORT.findall(text)
+            if not m.startswith(_JVM_PLATFORM)
+        ]
+    elif language == "Ruby":
+        modules = [m.split("/")[0] for m in _RUBY_IMPORT.findall(text)]
+    elif language == "PHP":
+        modules = ["\\".join(m.split("\\")[:2]) for m in _PHP_IMPORT.findall(text)]
+    else:
+        return []
+    return sorted({m for m in modules if m})[:MAX_IMPORTS_PER_FILE]
+
+
+# Manifests
+
+_REQUIREMENT = re.compile(
+    r"^\s*([A-Za-z0-9][A-Za-z0-9._-]*)\s*(?:\[[^\]]*\])?\s*([^;#]*)"
+)
+_GO_REQUIRE = re.compile(r"^\s*(?:require\s+)?([^\s()]+\.[^\s()]+)\s+(v[^\s]+)")
+_GEM = re.compile(
+    r"""^[ \t]*gem[ \t]+['"]([^'"]+)['"](?:[ \t]*,[ \t]*['"]([^'"]+)['"])?""",
+    re.MULTILINE,
+)
+_POM_DEPENDENCY = re.compile(r"<dependency>(.*?)</dependency>", re.DOTALL)
+_POM_FIELD = re.compile(r"<(groupId|artifactId|version)>\s*([^<\s]+)\s*</\1>")
+_GRADLE_DEPENDENCY = re.compile(
+    r"\b(?:implementation|api|compile|compileOnly|runtimeOnly|testImplementation"
+    r"|kapt|annotationProcessor)\s*\(?\s*"
+    r"""['"]([\w.\-]+):([\w.\-]+)(?::([^'"]+))?['"]"""
+)
+
+
+def _pypi_name(name: str) -> str:
+    return re.sub(r"[-_.]+", "-", name).lower()
+
+
+def _requirement(spec: str) -> Optional[Package]:
+    match = _REQUIREMENT.match(spec)
+    if not match:
+        return None
+    return ["pypi", _pypi_name(match.group(1)), match.group(2).strip() or None]
+
+
+def _version(value: Any) -> Optional[str]:
+    if isinstance(value, dict):
+        value = value.get("version")
+    return value if isinstance(value, str) else None
+
+
+def parse_package_json(text: str) -> List[Package]:
+    manifest = json.loads(text)
+    packages = []
+    for section in (
+        "dependencies",
+        "devDependencies",
+        "peerDependencies",
+        "optionalDependencies",
+    ):
+        for name, version in (manifest.get(section) or {}).items():
+            packages.append(["npm", name, _version(version)])
+    return packages
+
+
+def parse_requirements(text: str) -> List[Package]:
+    packages = []
+    for line in text.splitlines():
+        line = line.strip()
+        if not line or line.startswith(("#", "-")):
+            continue
+        package = _requirement(line)
+        if package:
+            packages.append(package)
+    return packages
+
+
+def parse_pyproject(text: str) -> List[Package]:
+    manifest = tomllib.loads(text)
+    project = manifest.get("project", {})
+    specs = list(project.get("dependencies", []))
+    for extra in project.get("optional-dependencies", {}).values():
+        specs.extend(extra)
+    packages = [p for p in map(_requirement, specs) if p]
+
+    poetry = manifest.get("tool", {}).get("poetry", {})
+    sections = [poetry.get("dependencies", {}), poetry.get("dev-dependencies", {})]
+    sections.extend(
+        group.get("dependencies", {}) for group in poetry.get("group", {}).values()
+    )
+    for section in sections:
+        for name, version in section.items():
+            if name.lower() != "python":
+                packages.append(["pypi", _pypi_name(name), _version(version)])
+    return packages
+
+
+def parse_pipfile(text: str) -> List[Package]:
+    manifest = tomllib.loads(text)
+    return [
+        ["pypi", _pypi_name(name), _version(version)]
+        for section in ("packages", "dev-packages")
+        for name, version in manifest.get(section, {}).items()
+    ]
+
+
+def parse_go_mod(text: str) -> List[Package]:
+    packages = []
+    in_require = False
+    for line in text.splitlines():
+        stripped = line.split("//")[0].strip()
+        if stripped.startswith("require ("):
+            in_require = True
+            continue
+        if in_require and stripped == ")":
+            in_require = False
+            continue
+        if in_require or stripped.startswith("require "):
+            match = _GO_REQUIRE.match(stripped)
+            if match:
+                packages.append(["go", match.group(1), match.group(2)])
+    return packages
+
+
+def parse_cargo_toml(text: str) -> List[Package]:
+    manifest = tomllib.loads(text)
+    sections = [
+        manifest.get(section, {})
+        for section in ("dependencies", "dev-dependencies", "build-dependencies")
+    ]
+    sections.append(manifest.get("workspace", {}).get("dependencies", {}))
+    return [
+        ["crates", name, _version(version)]
+        for section in sections
+        for name, version in section.items()
+    ]
+
+
+def parse_gemfile(text: str) -> List[Package]:
+    return [["rubygems", name, version or None] for name, version in _GEM.findall(text)]
+
+
+def parse_composer_json(text: str) -> List[Package]:
+    manifest = json.loads(text)
+    return [
+        ["packagist", name, _version(version)]
+        for section in ("require", "require-dev")
+        for name, version in (manifest.get(section) or {}).items()
+        if name != "php" and not name.startswith("ext-")
+    ]
+
+
+def parse_pom_xml(text: str) -> List[Package]:
+    packages = []
+    for block in _POM_DEPENDENCY.findall(text):
+        fields = dict(_POM_FIELD.findall(block))
+        if "groupId" in fields and "artifactId" in fields:
+            name = f"{fields['groupId']}:{fields['artifactId']}"
+            packages.append(["maven", name, fields.get("version")])
+    return packages
+
+
+def parse_gradle(text: str) -> List[Package]:
+    return [
+        ["maven", f"{group}:{artifact}", version or None]
+        for group, artifact, version in _GRADLE_DEPENDENCY.findall(text)
+    ]
+
+
+MANIFEST_PARSERS: Dict[str, Callable[[str], List[Package]]] = {
+    "package.json": parse_package_json,
+    "requirements.txt": parse_requirements,
+    "pyproject.toml": parse_pyproject,
+    "pipfile": parse_pipfile,
+    "go.mod": parse_go_mod,
+    "cargo.toml": parse_cargo_toml,
+    "gemfile": parse_gemfile,
+    "composer.json": parse_composer_json,
+    "pom.xml": parse_pom_xml,
+    "build.gradle": parse_gradle,
+    "build.gradle.kts": parse_gradle,
+}
+_REQUIREMENTS_FILE = re.compile(r"^requirements[\w.-]*\.(?:txt|in)$")
+
+
+def manifest_parser(path: str) -> Optional[Callable[[str], List[Package]]]:
+    filename = path.rsplit("/", 1)[-1].lower()
+    if _REQUIREMENTS_FILE.match(filename):
+        return parse_requirements
+    return MANIFEST_PARSERS.get(filename)
+
+
+class TechnologyAnalyzer(FileAnalyzer):
+    """Declared packages from manifests and imported modules from source files
+
+    Aggregates into `technologies.packages` and `technologies.frameworks`;
+    frameworks are matched against FRAMEWORK_SIGNATURES and ranked by the
+    number of files importing them.
+    """
+
+    name = "technologies"
+
+    def analyze(self, path: str, content: bytes) -> Optional[Dict[str, Any]]:
+        text = content.decode("utf-8", errors="ignore")
+        parser = manifest_parser(path)
+        if parser is not None:
+            try:
+                packages = parser(text)
+            except (ValueError, AttributeError, TypeError):
+                # Malformed manifest (bad JSON/TOML or unexpected shapes)
+                return None
+            return {"packages": packages} if packages else None
+
+        language = file_language(path)
+        ecosystem = LANGUAGE_ECOSYSTEMS.get(language) if language else None
+        if ecosystem is None:
+            return None
+        imports = extract_imports(language, text)
+        return {"ecosystem": ecosystem, "imports": imports} if imports else None
+
+    def aggregate(self, results: AnalyzerResults) -> Dict[str, Any]:
+        packages: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        importers: Counter = Counter()
+        for _, result in results:
+            for ecosystem, name, version in result.get("packages", []):
+                package = packages.setdefault(
+                    (ecosystem, name),
+                    {"name": name, "ecosystem": ecosystem, "version": version},
+                )
+                package["version"] = package["version"] or version
+            for module in result.get("imports", []):
+                importers[(result["ecosystem"], module)] += 1
+
+        frameworks: Dict[str, Dict[str, Any]] = {}
+
+        def framework(ecosystem: str, name: str) -> Optional[Dict[str, Any]]:
+            found = match_framework(ecosystem, name)
+            if found is None:
+                return None
+            return frameworks.setdefault(
+                found,
+                {
+                    "name": found,
+                    "category": FRAMEWORK_SIGNATURES[found][0],
+                    "ecosystem": ecosystem,
+                    "version": None,
+                    "declared": False,
+                    "files": 0,
+                },
+            )
+
+        for (ecosystem, name), package in packages.items():
+            entry = framework(ecosystem, name)
+            if entry is not None:
+                entry["declared"] = True
+                entry["version"] = entry["version"] or package["version"]
+        for (ecosystem, module), count in importers.items():
+            entry = framework(ecosystem, module)
+            if entry is not None:
+                entry["files"] += count
+
+        return {
+            "technologies.frameworks": sorted(
+                frameworks.values(), key=lambda f: (-f["files"], f["name"])
+            ),
+            "technologies.packages": sorted(
+                packages.values(), key=lambda p: (p["ecosystem"], p["name"])
+            ),
+        }
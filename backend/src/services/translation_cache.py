@@ -0,0 +1,181 @@
+# backend/src/services/translation_cache.py
+import hashlib
+import json
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from ..core.cache import LRUCache
+from ..core.config import settings
+from ..core.redis import get_redis
+from ..core.single_flight import SingleFlight
+from ..database.repositories import translation_cache_repo
+
+TranslateFn = Callable[[], Awaitable[Dict[str, Any]]]
+
+
+def normalize_source(code: str) -> str:
+    """Source text with only meaning-preserving differences removed
+
+    Line endings (CRLF/CR), a byte-order mark and blank lines or whitespace
+    at the very start and end are normalized. Nothing inside the code is
+    rewritten: comments, indentation and in-line or trailing whitespace may
+    sit inside a string or multi-line literal, and two sources that differ
+    there must never share a cached translation.
+    """
+    code = code.lstrip("\ufeff").replace("\r\n", "\n").replace("\r", "\n")
+    lines = code.split("\n")
+    while lines and not lines[0].strip():
+        lines.pop(0)
+    while lines and not lines[-1].strip():
+        lines.pop()
+    if lines:
+        lines[-1] = lines[-1].rstrip()
+    return "\n".join(lines)
+
+
+def translation_cache_key(
+    source: Dict[str, Any],
+    target: Dict[str, Any],
+    model_version: str = settings.TRANSLATION_MODEL_VERSION,
+) -> str:
+    """Content hash identifying a translation request"""
+    raw = json.dumps(
+        [
+            normalize_source(source.get("code", "")),
+            source.get("framework"),
+            target.get("framework"),
+            target.get("language"),
+            sorted(target.get("packages") or []),
+            model_version,
+        ]
+    )
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+
+class TranslationCache:
+    """Two-tier (in-process LRU + Mongo/Redis) cache of translation results"""
+
+    def __init__(
+        self,
+        backend: str = settings.TRANSLATION_CACHE_BACKEND,
+        memory_entries: int = settings.TRANSLATION_CACHE_MEMORY_ENTRIES,
+        ttl: int = settings.TRANSLATION_CACHE_TTL_SECONDS,
+    ):
+        self.backend = backend
+        self.ttl = ttl
+        self.memory = LRUCache(memory_entries)
+        self.stats = {
+            "memory_hits": 0,
+            "persistent_hits": 0,
+            "coalesced": 0,
+            "misses": 0,
+        }
+        self._flights: SingleFlight[Dict[str, Any]] = SingleFlight()
+
+    @property
+    def hit_rate(self) -> float:
+        stats = self.stats
+        hits = stats["memory_hits"] + stats["persistent_hits"] + stats["coalesced"]
+        total = hits + stats["misses"]
+        return hits / total if total else 0.0
+
+    async def _load_persistent(self, key: str) -> Optional[Dict[str, Any]]:
+        if self.backend == "mongo":
+            entry = await translation_cache_repo.find_by_key(key)
+            if entry:
+                entry.pop("_id", None)
+            return entry
+        if self.backend == "redis":
+            raw = await get_redis().get(f"translation:{key}")
+            return json.loads(raw) if raw else None
+        return None
+
+    async def _store_persistent(self, key: str, entry: Dict[str, Any]):
+        if self.backend == "mongo":
+            await translation_cache_repo.store(key, entry)
+        elif self.backend == "redis":
+            await get_redis().set(
+                f"translation:{key}", json.dumps(entry, default=str), ex=self.ttl
+            )
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Cached {target, metadata} for a key, or None"""
+        entry = self.memory.get(key)
+        if entry is not None:
+            self.stats["memory_hits"] += 1
+            return entry
+
+        entry = await self._load_persistent(key)
+        if entry is not None:
+            self.stats["persistent_hits"] += 1
+            self.memory.set(key, entry)
+            return entry
+
+        self.stats["misses"] += 1
+        return None
+
+    def key(
+        self,
+        source: Dict[str, Any],
+        target: Dict[str, Any],
+        model_version: str = settings.TRANSLATION_MODEL_VERSION,
+    ) -> str:
+        return translation_cache_key(source, target, model_version)
+
+    async def put(
+        self,
+        key: str,
+        source: Dict[str, Any],
+        target: Dict[str, Any],
+        metadata: Dict[str, Any],
+        model_version: str = settings.TRANSLATION_MODEL_VERSION,
+    ):
+        """Store a translation result in both tiers"""
+        entry = {"target": target, "metadata": metadata}
+        self.memory.set(key, entry)
+        await self._store_persistent(
+            key,
+            {
+                **entry,
+                "source_framework": source.get("framework"),
+                "target_framework": target.get("framework"),
+                "model_version": model_version,
+            },
+        )
+
+    async def get_or_translate(
+        self,
+        source: Dict[str, Any],
+        target: Dict[str, Any],
+        translate: TranslateFn,
+        model_version: str = settings.TRANSLATION_MODEL_VERSION,
+    ) -> Dict[str, Any]:
+        """Return a cached result or run `translate` once for concurrent callers
+
+        `translate` must return {"target": ..., "metadata": ...}; the result
+        gains a `cached` flag.
+        """
+        key = translation_cache_key(source, target, model_version)
+        if not self._flights.running(key):
+            entry = await self.get(key)
+            if entry is not None:
+                return {**entry, "cached": True}
+
+        async def translate_and_store() -> Dict[str, Any]:
+            result = await translate()
+            await self.put(
+                key,
+                source,
+                result["target"],
+                result.get("metadata", {}),
+                model_version,
+            )
+            return result
+
+        # Joins a run another caller started, even one begun during the lookup
+        result, shared = await self._flights.run(key, translate_and_store)
+        if shared:
+            self.stats["coalesced"] += 1
+        return {**result, "cached": shared}
+
+
+translation_cache = TranslationCache()
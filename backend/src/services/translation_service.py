@@ -0,0 +1,187 @@
+# backend/src/services/translation_service.py
+import asyncio
+import time
+from abc import ABC, abstractmethod
+from typing import Any, AsyncIterator, Dict, Optional
+
+from ..core.config import settings
+from ..core.openai_client import get_openai_client
+from ..database.repositories import translation_repo
+from .content_refs import content_refs
+from .dashboard import dashboard_service
+from .translation_cache import TranslationCache, translation_cache
+
+DEFAULT_METADATA = {
+    "confidence": 0.0,
+    "warnings": [],
+    "suggestions": [],
+    "patterns_used": [],
+    "manual_changes_required": [],
+}
+
+SYSTEM_PROMPT = (
+    "You translate code between frameworks. Reply with only the translated "
+    "code for the target framework, with no explanations or markdown fences."
+)
+
+
+class TranslationProvider(ABC):
+    """Streams translated code from a model, chunk by chunk"""
+
+    model_version = settings.TRANSLATION_MODEL_VERSION
+
+    @abstractmethod
+    def stream(
+        self, source: Dict[str, Any], target: Dict[str, Any]
+    ) -> AsyncIterator[str]:
+        ...
+
+
+class FakeTranslationProvider(TranslationProvider):
+    """Local stand-in that echoes the source back line by line (tests, dev)"""
+
+    # Kept apart from real model output in the translation cache
+    model_version = "fake"
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+
+    async def stream(
+        self, source: Dict[str, Any], target: Dict[str, Any]
+    ) -> AsyncIterator[str]:
+        yield f"// Translated from {source['framework']} to {target['framework']}\n"
+        for line in source["code"].splitlines(keepends=True):
+            if self.delay:
+                await asyncio.sleep(self.delay)
+            yield line
+
+
+class OpenAITranslationProvider(TranslationProvider):
+    """Streams chat completions from the OpenAI API"""
+
+    def __init__(self, model: str = settings.TRANSLATION_MODEL):
+        self.model = model
+        self.model_version = f"openai:{model}:{settings.TRANSLATION_MODEL_VERSION}"
+
+    @property
+    def client(self):
+        return get_openai_client()
+
+    async def stream(
+        self, source: Dict[str, Any], target: Dict[str, Any]
+    ) -> AsyncIterator[str]:
+        prompt = (
+            f"Translate this {source['framework']} ({source['language']}) code to "
+            f"{target['framework']} ({target['language']}).\n\n{source['code']}"
+        )
+        response = await self.client.chat.completions.create(
+            model=self.model,
+            messages=[
+                {"role": "system", "content": SYSTEM_PROMPT},
+                {"role": "user", "content": prompt},
+            ],
+            stream=True,
+        )
+        async for chunk in response:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+
+
+def create_translation_provider() -> TranslationProvider:
+    """Build the provider selected by TRANSLATION_PROVIDER"""
+    provider = settings.TRANSLATION_PROVIDER
+    if provider == "openai":
+        return OpenAITranslationProvider()
+    if provider == "fake":
+        return FakeTranslationProvider()
+    # Never fall back to the fake: its output would be saved as real results
+    raise ValueError(f"Unknown TRANSLATION_PROVIDER: {provider!r}")
+
+
+class TranslationService:
+    """Runs translations through the cache and provider and persists results"""
+
+    def __init__(
+        self,
+        provider: Optional[TranslationProvider] = None,
+        cache: TranslationCache = translation_cache,
+    ):
+        self.provider = provider or create_translation_provider()
+        self.cache = cache
+
+    async def translate(
+        self, source: Dict[str, Any], target: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Translate without streaming: {target, metadata, cached, execution_time}"""
+        started = time.perf_counter()
+
+        async def generate() -> Dict[str, Any]:
+            chunks = [chunk async for chunk in self.provider.stream(source, target)]
+            return {
+                "target": {**target, "code": "".join(chunks)},
+                "metadata": dict(DEFAULT_METADATA),
+            }
+
+        result = await self.cache.get_or_translate(
+            source, target, generate, self.provider.model_version
+        )
+        return {**result, "execution_time": time.perf_counter() - started}
+
+    async def stream_translation(
+        self,
+        user_id: Any,
+        source: Dict[str, Any],
+        target: Dict[str, Any],
+        result: Dict[str, Any],
+    ) -> AsyncIterator[str]:
+        """Yield translated code as it is produced
+
+        The `Translation` document is written once, after the last chunk;
+        its summary (id, execution_time, cached) is placed in `result`.
+        A stream abandoned mid-way persists nothing.
+        """
+        started = time.perf_counter()
+        model_version = self.provider.model_version
+        key = self.cache.key(source, target, model_version)
+        cached = await self.cache.get(key)
+
+        if cached is not None:
+            code = cached["target"].get("code", "")
+            metadata = cached.get("metadata", {})
+            yield code
+        else:
+            chunks = []
+            async for chunk in self.provider.stream(source, target):
+                chunks.append(chunk)
+                yield chunk
+            code = "".join(chunks)
+            metadata = dict(DEFAULT_METADATA)
+            await self.cache.put(
+                key, source, {**target, "code": code}, metadata, model_version
+            )
+
+        execution_time = time.perf_counter() - started
+        stored_source, stored_target = await asyncio.gather(
+            content_refs.offload_code(source),
+            content_refs.offload_code({**target, "code": code}),
+        )
+        translation = await translation_repo.create(
+            {
+                "user_id": user_id,
+                "source": stored_source,
+                "target": stored_target,
+                "metadata": {**metadata, "cached": cached is not None},
+                "execution_time": execution_time,
+            }
+        )
+        await dashboard_service.invalidate(user_id)
+        result.update(
+            {
+                "id": str(translation["_id"]),
+                "execution_time": execution_time,
+                "cached": cached is not None,
+            }
+        )
+
+
+translation_service = TranslationService()
@@ -0,0 +1,33 @@
+# backend/src/workers/__main__.py
+# Job worker process; run from backend/ with `python -m src.workers`
+import asyncio
+import signal
+
+from ..core.redis import close_redis
+from ..database.connection import close_db, connect_db
+from .handlers import job_handlers, periodic_jobs
+from .job_worker import JobWorkerPool
+
+
+async def main():
+    await connect_db()
+    pool = JobWorkerPool(job_handlers, periodic=periodic_jobs)
+    stopping = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(signum, stopping.set)
+
+    await pool.start()
+    print(f"🚀 Job workers started ({pool.concurrency}): {', '.join(job_handlers)}")
+    try:
+        await stopping.wait()
+    finally:
+        # In-flight jobs finish; their leases keep other workers off them
+        await pool.stop()
+        await close_db()
+        await close_redis()
+        print("👋 Job workers stopped")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
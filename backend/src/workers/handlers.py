@@ -0,0 +1,19 @@
+# backend/src/workers/handlers.py
+from ..core.config import settings
+from ..services.batch_translation import run_batch_translation
+from ..services.learning_path_service import run_learning_path_generation
+from ..services.repository_analysis import run_repository_analysis
+from ..services.skill_aggregation import run_skill_reconcile
+
+# AnalysisJob.type -> handler run by JobWorkerPool
+job_handlers = {
+    "repository": run_repository_analysis,
+    "translation": run_batch_translation,
+    "skill_reconcile": run_skill_reconcile,
+    "learning_path": run_learning_path_generation,
+}
+
+# Job types JobWorkerPool keeps scheduled -> seconds between runs
+periodic_jobs = {
+    "skill_reconcile": settings.SKILL_RECONCILE_EVERY_SECONDS,
+}
@@ -0,0 +1,170 @@
+# backend/src/workers/job_worker.py
+import asyncio
+import random
+import socket
+import time
+import traceback
+import uuid
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from ..core.config import settings
+from ..core.process_pool import close_process_pool
+from ..database.repositories import AnalysisJobRepository, analysis_job_repo
+
+JobHandler = Callable[[Dict[str, Any]], Awaitable[Optional[Dict[str, Any]]]]
+
+
+class JobWorkerPool:
+    """Asyncio worker pool that claims analysis jobs under time-bounded leases"""
+
+    def __init__(
+        self,
+        handlers: Dict[str, JobHandler],
+        repo: AnalysisJobRepository = analysis_job_repo,
+        concurrency: int = settings.JOB_WORKER_CONCURRENCY,
+        lease_seconds: int = settings.JOB_LEASE_SECONDS,
+        poll_interval: float = settings.JOB_POLL_INTERVAL_SECONDS,
+        backoff_seconds: float = settings.JOB_RETRY_BACKOFF_SECONDS,
+        backoff_max_seconds: float = settings.JOB_RETRY_BACKOFF_MAX_SECONDS,
+        periodic: Optional[Dict[str, float]] = None,
+    ):
+        self.handlers = handlers
+        self.repo = repo
+        self.concurrency = concurrency
+        self.lease_seconds = lease_seconds
+        self.poll_interval = poll_interval
+        self.backoff_seconds = backoff_seconds
+        self.backoff_max_seconds = backoff_max_seconds
+        # job type -> seconds between runs; one run is always kept queued
+        self.periodic = periodic or {}
+        self.worker_host = socket.gethostname()
+        self.pool_id = uuid.uuid4().hex[:8]
+        self._tasks: List[asyncio.Task] = []
+        self._stopping = asyncio.Event()
+
+    def retry_delay(self, retries: int) -> float:
+        """Exponential backoff with full jitter for the given retry count"""
+        ceiling = min(self.backoff_max_seconds, self.backoff_seconds * 2**retries)
+        return random.uniform(0, ceiling)
+
+    async def start(self):
+        """Start the worker loops, the lease reaper and progress flushing"""
+        self._stopping.clear()
+        self.repo.progress_buffer.start()
+        for job_type in self.periodic:
+            await self.repo.schedule_periodic(job_type, datetime.utcnow())
+        self._tasks = [
+            asyncio.create_task(self._worker_loop(f"{self.pool_id}-{i}"))
+            for i in range(self.concurrency)
+        ]
+        self._tasks.append(asyncio.create_task(self._reaper_loop()))
+
+    async def stop(self):
+        """Stop claiming new jobs and wait for in-flight jobs to finish"""
+        self._stopping.set()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        await self.repo.progress_buffer.stop()
+        close_process_pool()
+
+    async def run_once(self, worker_id: str) -> bool:
+        """Claim and process a single job; returns False when the queue is empty"""
+        job = await self.repo.claim_next_job(
+            worker_id,
+            self.worker_host,
+            self.lease_seconds,
+            job_types=list(self.handlers),
+        )
+        if not job:
+            return False
+
+        job_id = str(job["_id"])
+        handler = asyncio.create_task(self.handlers[job["type"]](job))
+        heartbeat = asyncio.create_task(self._heartbeat(job_id, worker_id, handler))
+        try:
+            result = await handler
+        except asyncio.CancelledError:
+            if not heartbeat.done():
+                raise
+            # The heartbeat lost the lease and cancelled the handler; the job
+            # may already be running elsewhere, so don't report an outcome
+            print(f"⚠️ Worker {worker_id} lost the lease on job {job_id}")
+            return True
+        except Exception as e:
+            await self.repo.fail_job(
+                job,
+                worker_id,
+                {
+                    "message": str(e),
+                    "type": type(e).__name__,
+                    "traceback": traceback.format_exc(),
+                    "at": datetime.utcnow(),
+                },
+                self.retry_delay(job.get("retries", 0)),
+            )
+        else:
+            await self.repo.complete_job(job_id, worker_id, result)
+        finally:
+            heartbeat.cancel()
+            handler.cancel()
+        if job["type"] in self.periodic:
+            # No-op while a retry of this run is still queued
+            await self.repo.schedule_periodic(
+                job["type"],
+                datetime.utcnow() + timedelta(seconds=self.periodic[job["type"]]),
+            )
+        return True
+
+    async def _worker_loop(self, worker_id: str):
+        while not self._stopping.is_set():
+            try:
+                claimed = await self.run_once(worker_id)
+            except Exception as e:
+                print(f"⚠️ Worker {worker_id} error: {e}")
+                claimed = False
+            if not claimed:
+                await self._sleep(self.poll_interval)
+
+    async def _heartbeat(self, job_id: str, worker_id: str, handler: asyncio.Task):
+        """Renew the lease while the handler runs; cancel it once the lease is lost
+
+        Renewal errors (a database blip) are retried until the current lease
+        would have expired; after that, or when the job is no longer ours,
+        another worker may claim it.
+        """
+        # Renew at a third of the lease so a single missed beat doesn't expire it
+        interval = max(self.lease_seconds / 3, 0.1)
+        expires_at = time.monotonic() + self.lease_seconds
+        while True:
+            await asyncio.sleep(interval)
+            attempted_at = time.monotonic()
+            try:
+                renewed = await self.repo.renew_lease(
+                    job_id, worker_id, self.lease_seconds
+                )
+            except Exception as e:
+                if time.monotonic() + interval < expires_at:
+                    print(f"⚠️ Lease renewal error on job {job_id}, retrying: {e}")
+                    continue
+                renewed = False
+            if not renewed:
+                handler.cancel()
+                return
+            expires_at = attempted_at + self.lease_seconds
+
+    async def _reaper_loop(self):
+        while not self._stopping.is_set():
+            try:
+                reclaimed = await self.repo.reclaim_expired_leases()
+                if reclaimed:
+                    print(f"♻️ Reclaimed {reclaimed} expired job lease(s)")
+            except Exception as e:
+                print(f"⚠️ Lease reaper error: {e}")
+            await self._sleep(self.lease_seconds)
+
+    async def _sleep(self, seconds: float):
+        try:
+            await asyncio.wait_for(self._stopping.wait(), timeout=seconds)
+        except asyncio.TimeoutError:
+            pass
@@ -0,0 +1,29 @@
+# backend/tests/conftest.py
+import os
+
+import pytest
+
+# Settings without defaults; tests never reach these services
+for name, value in {
+    "SECRET_KEY": "test-secret",
+    "JWT_SECRET_KEY": "test-jwt-secret",
+    "MONGODB_URI": "mongodb://localhost:27017",
+    "GITHUB_CLIENT_ID": "test-client-id",
+    "GITHUB_CLIENT_SECRET": "test-client-secret",
+    "GITHUB_REDIRECT_URI": "http://localhost:3000/auth/callback",
+}.items():
+    os.environ.setdefault(name, value)
+
+
+@pytest.fixture
+def mongo_db():
+    """Point the shared `db` at a fresh in-memory mongomock database"""
+    from mongomock_motor import AsyncMongoMockClient
+
+    from src.database.connection import db
+
+    previous = db.client, db.db
+    db.client = AsyncMongoMockClient()
+    db.db = db.client["codeshift_test"]
+    yield db.db
+    db.client, db.db = previous
@@ -0,0 +1,68 @@
+# backend/tests/test_code_metrics.py
+import hashlib
+
+from src.services.code_metrics import HyperLogLog, StreamingHistogram, TopK
+
+
+def hash56(value: str) -> int:
+    digest = hashlib.blake2b(value.encode(), digest_size=7).digest()
+    return int.from_bytes(digest, "big")
+
+
+def test_hyperloglog_estimates_distinct_count_within_a_few_percent():
+    hll = HyperLogLog()
+    for i in range(50_000):
+        hll.add(hash56(f"shingle-{i}"))
+    assert abs(hll.count() - 50_000) / 50_000 < 0.05
+
+
+def test_hyperloglog_ignores_duplicates():
+    hll = HyperLogLog()
+    for _ in range(10):
+        for i in range(1000):
+            hll.add(hash56(f"shingle-{i}"))
+    assert abs(hll.count() - 1000) / 1000 < 0.05
+
+
+def test_hyperloglog_is_exact_enough_for_small_sets():
+    hll = HyperLogLog()
+    assert hll.count() == 0
+    for i in range(10):
+        hll.add(hash56(str(i)))
+    assert round(hll.count()) == 10
+
+
+def test_histogram_buckets_by_upper_bound():
+    histogram = StreamingHistogram([1, 5, 10])
+    for value in [1, 2, 5, 6, 30]:
+        histogram.add(value)
+    summary = histogram.to_dict()
+    assert [bucket["files"] for bucket in summary["histogram"]] == [1, 2, 1, 1]
+    assert [bucket["le"] for bucket in summary["histogram"]] == [1, 5, 10, None]
+    assert summary["total"] == 44
+    assert summary["max"] == 30
+    assert summary["mean"] == 8.8
+
+
+def test_histogram_quantiles_are_bucket_bounds_capped_at_max():
+    histogram = StreamingHistogram([1, 5, 10])
+    for value in [1, 1, 1, 3, 4]:
+        histogram.add(value)
+    assert histogram.quantile(0.5) == 1
+    assert histogram.quantile(0.9) == 4
+
+    histogram.add(500)
+    assert histogram.quantile(1.0) == 500
+
+
+def test_empty_histogram():
+    summary = StreamingHistogram([1, 5]).to_dict()
+    assert summary["p50"] is None
+    assert summary["mean"] == 0.0
+
+
+def test_top_k_keeps_the_largest_items_in_order():
+    top = TopK(3)
+    for score in [5, 1, 9, 3, 7]:
+        top.add(score, f"file-{score}", {"score": score})
+    assert [item["score"] for item in top.items()] == [9, 7, 5]
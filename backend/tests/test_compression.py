@@ -0,0 +1,88 @@
+# backend/tests/test_compression.py
+import os
+
+import pytest
+from bson import Binary
+
+from src.database.compression import (
+    COMPRESSED_SUBTYPE,
+    FieldCodec,
+    available_compressors,
+)
+
+CODE = "export function App() {\n  return <div className='app' />;\n}\n" * 40
+
+
+@pytest.fixture
+def codec():
+    return FieldCodec("zlib", min_bytes=512, level=6)
+
+
+def is_compressed(value) -> bool:
+    return isinstance(value, Binary) and value.subtype == COMPRESSED_SUBTYPE
+
+
+def test_value_round_trip(codec):
+    for value in [CODE, {"files": [["a.py", "sha", {"lines": 3}]] * 100}]:
+        compressed = codec.compress_value(value)
+        assert is_compressed(compressed)
+        assert codec.decompress_value(compressed) == value
+
+
+def test_small_and_incompressible_values_stay_plain(codec):
+    assert codec.compress_value("short") == "short"
+    assert codec.compress_value(42) == 42
+    assert codec.compress_value(None) is None
+    random_bytes = Binary(os.urandom(4096))
+    assert codec.compress_value(random_bytes) == random_bytes
+
+
+def test_plain_values_pass_through_decompression(codec):
+    assert codec.decompress_value("plain") == "plain"
+    assert codec.decompress_value(Binary(b"raw")) == Binary(b"raw")
+
+
+def test_compress_fields_handles_nested_and_dotted_paths(codec):
+    paths = ["source.code", "target.code"]
+    document = {"source": {"framework": "react", "code": CODE}, "target": {}}
+    stored = codec.compress_fields(document, paths)
+    assert is_compressed(stored["source"]["code"])
+    assert stored["source"]["framework"] == "react"
+    assert stored["target"] == {}
+
+    update = codec.compress_fields({"target.code": CODE, "status": "done"}, paths)
+    assert is_compressed(update["target.code"])
+    assert update["status"] == "done"
+
+
+def test_compress_fields_leaves_the_input_unchanged(codec):
+    document = {"source": {"code": CODE}}
+    codec.compress_fields(document, ["source.code"])
+    assert document == {"source": {"code": CODE}}
+
+
+def test_compress_fields_without_matching_paths_returns_the_input(codec):
+    document = {"status": "queued"}
+    assert codec.compress_fields(document, ["source.code"]) is document
+
+
+def test_decompress_fields_restores_values_in_place(codec):
+    paths = ["source.code", "cached_files"]
+    document = {"source": {"code": CODE}, "cached_files": {"files": [CODE]}}
+    stored = codec.compress_fields(document, paths)
+    assert codec.decompress_fields(stored, paths) == document
+
+
+def test_decompress_fields_tolerates_missing_and_projected_fields(codec):
+    paths = ["source.code", "target.code"]
+    assert codec.decompress_fields({"source": {"framework": "vue"}}, paths) == {
+        "source": {"framework": "vue"}
+    }
+    assert codec.decompress_fields({"target": None}, paths) == {"target": None}
+    assert codec.decompress_fields(None, paths) is None
+
+
+def test_available_compressors_keeps_order_and_drops_unknown():
+    assert available_compressors("zlib, bogus") == ["zlib"]
+    assert available_compressors("") == []
+    assert available_compressors("zstd,zlib")[-1] == "zlib"
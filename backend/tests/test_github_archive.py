@@ -0,0 +1,153 @@
+# backend/tests/test_github_archive.py
+import io
+import os
+import tarfile
+
+import httpx
+import pytest
+
+from src.core.config import settings
+from src.services.github_archive import ArchiveTooLarge, TarballReader
+from src.services.github_service import GitHubService
+
+PREFIX = "octo-hello-abc123"
+
+FILES = {
+    "README.md": b"# hello\n",
+    "src/app.py": b"print('hello')\n",
+    "src/big.py": b"x = 1\n" * 100,
+    "src/logo.png": b"\x89PNG\r\n\x1a\n\x00\x00binary",
+    "node_modules/left-pad/index.js": b"module.exports = pad;\n",
+    "web/index.js": b"console.log('hi');\n",
+}
+
+
+def make_tarball(files=FILES) -> bytes:
+    """A gzipped tarball laid out like GitHub's, with one top-level directory"""
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w:gz") as tar:
+        root = tarfile.TarInfo(PREFIX)
+        root.type = tarfile.DIRTYPE
+        tar.addfile(root)
+        for path, content in files.items():
+            info = tarfile.TarInfo(f"{PREFIX}/{path}")
+            info.size = len(content)
+            tar.addfile(info, io.BytesIO(content))
+        link = tarfile.TarInfo(f"{PREFIX}/src/link.py")
+        link.type = tarfile.SYMTYPE
+        link.linkname = "app.py"
+        tar.addfile(link)
+    return buffer.getvalue()
+
+
+def read_all(reader: TarballReader):
+    files = []
+    try:
+        while (item := reader.next_file()) is not None:
+            files.append(item)
+    finally:
+        reader.close()
+    return files
+
+
+def make_service(archive: bytes, status: int = 200):
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(status, content=archive)
+
+    service = GitHubService(transport=httpx.MockTransport(handler), cache=None)
+    return service, requests
+
+
+def test_reader_strips_the_prefix_and_skips_non_files():
+    files = read_all(TarballReader(io.BytesIO(make_tarball())))
+
+    assert [path for path, _, _ in files] == list(FILES)
+    assert files[1] == ("src/app.py", len(FILES["src/app.py"]), FILES["src/app.py"])
+
+
+def test_reader_filters_by_extension_size_and_directory():
+    reader = TarballReader(
+        io.BytesIO(make_tarball()),
+        extensions=[".py", ".js"],
+        max_file_bytes=100,
+        exclude_dirs=["node_modules"],
+    )
+
+    assert [path for path, _, _ in read_all(reader)] == ["src/app.py", "web/index.js"]
+
+
+@pytest.mark.asyncio
+async def test_archive_is_streamed_through_the_service():
+    service, requests = make_service(make_tarball())
+    try:
+        files = [
+            item
+            async for item in service.iter_repository_archive(
+                "token", "octo", "hello", "main", extensions=[".py"]
+            )
+        ]
+    finally:
+        await service.close()
+
+    assert [path for path, _, _ in files] == ["src/app.py", "src/big.py"]
+    assert len(requests) == 1
+    assert requests[0].url.path == "/repos/octo/hello/tarball/main"
+    assert requests[0].headers["authorization"] == "Bearer token"
+
+
+@pytest.mark.asyncio
+async def test_small_archives_stay_in_memory(monkeypatch):
+    archive = make_tarball()
+    monkeypatch.setattr(settings, "GITHUB_ARCHIVE_MEMORY_BYTES", len(archive) + 1)
+    service, _ = make_service(archive)
+    try:
+        spooled = await service._download_archive("token", "octo", "hello", "main")
+    finally:
+        await service.close()
+
+    assert not spooled._rolled
+    assert spooled.read() == archive
+    spooled.close()
+
+
+@pytest.mark.asyncio
+async def test_large_archives_spill_to_disk(monkeypatch):
+    archive = make_tarball({"data.bin": os.urandom(64 * 1024)})
+    monkeypatch.setattr(settings, "GITHUB_ARCHIVE_MEMORY_BYTES", 1024)
+    service, _ = make_service(archive)
+    try:
+        spooled = await service._download_archive("token", "octo", "hello", "main")
+    finally:
+        await service.close()
+
+    assert spooled._rolled
+    assert spooled.read() == archive
+    spooled.close()
+
+
+@pytest.mark.asyncio
+async def test_archives_over_the_hard_cap_are_aborted(monkeypatch):
+    archive = make_tarball({"data.bin": os.urandom(64 * 1024)})
+    monkeypatch.setattr(settings, "GITHUB_ARCHIVE_MAX_BYTES", 1024)
+    service, _ = make_service(archive)
+    try:
+        with pytest.raises(ArchiveTooLarge):
+            async for _ in service.iter_repository_archive(
+                "token", "octo", "hello", "main"
+            ):
+                pass
+    finally:
+        await service.close()
+
+
+@pytest.mark.asyncio
+async def test_failed_downloads_raise():
+    service, _ = make_service(b"Not Found", status=404)
+    try:
+        with pytest.raises(Exception, match="Failed to download archive"):
+            await service._download_archive("token", "octo", "hello", "main")
+    finally:
+        await service.close()
@@ -0,0 +1,163 @@
+# backend/tests/test_github_service.py
+import asyncio
+
+import httpx
+import pytest
+
+from src.services import github_service as github_module
+from src.services.github_service import GitHubService
+
+URL = "https://api.github.com/user"
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Record the delays _request waits for instead of sleeping"""
+    delays = []
+    real_sleep = asyncio.sleep
+
+    async def fake_sleep(delay):
+        delays.append(delay)
+        await real_sleep(0)
+
+    monkeypatch.setattr(github_module.asyncio, "sleep", fake_sleep)
+    return delays
+
+
+def make_service(responses):
+    """A service whose transport replays ``responses`` and records requests"""
+    requests = []
+    replies = iter(responses)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return next(replies)
+
+    service = GitHubService(transport=httpx.MockTransport(handler), cache=None)
+    service._backoff = lambda attempt: 0.5 * 2**attempt
+    return service, requests
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("status", [429, 500, 502, 503, 504])
+async def test_throttled_and_server_errors_are_retried_with_backoff(status, sleeps):
+    service, requests = make_service(
+        [httpx.Response(status), httpx.Response(status), httpx.Response(200)]
+    )
+    try:
+        response = await service._request("GET", URL, "token")
+    finally:
+        await service.close()
+
+    assert response.status_code == 200
+    assert len(requests) == 3
+    assert sleeps == [0.5, 1.0]
+
+
+@pytest.mark.asyncio
+async def test_retry_after_header_overrides_backoff(sleeps):
+    service, requests = make_service(
+        [httpx.Response(429, headers={"Retry-After": "7"}), httpx.Response(200)]
+    )
+    try:
+        response = await service._request("GET", URL, "token")
+    finally:
+        await service.close()
+
+    assert response.status_code == 200
+    assert len(requests) == 2
+    assert sleeps == [7.0]
+
+
+@pytest.mark.asyncio
+async def test_retry_after_is_capped_at_the_max_wait(sleeps):
+    service, _ = make_service(
+        [httpx.Response(429, headers={"Retry-After": "3600"}), httpx.Response(200)]
+    )
+    try:
+        await service._request("GET", URL, "token")
+    finally:
+        await service.close()
+
+    assert sleeps == [service.rate_limits.max_wait]
+
+
+@pytest.mark.asyncio
+async def test_plain_403_is_not_retried(sleeps):
+    service, requests = make_service([httpx.Response(403), httpx.Response(200)])
+    try:
+        response = await service._request("GET", URL, "token")
+    finally:
+        await service.close()
+
+    assert response.status_code == 403
+    assert len(requests) == 1
+    assert sleeps == []
+
+
+@pytest.mark.asyncio
+async def test_non_idempotent_requests_are_not_retried(sleeps):
+    service, requests = make_service([httpx.Response(503), httpx.Response(200)])
+    try:
+        response = await service._request("POST", URL, data={"code": "abc"})
+    finally:
+        await service.close()
+
+    assert response.status_code == 503
+    assert len(requests) == 1
+    assert sleeps == []
+
+
+@pytest.mark.asyncio
+async def test_non_idempotent_transport_errors_are_raised(sleeps):
+    attempts = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal attempts
+        attempts += 1
+        raise httpx.ConnectError("connection reset", request=request)
+
+    service = GitHubService(transport=httpx.MockTransport(handler), cache=None)
+    try:
+        with pytest.raises(httpx.ConnectError):
+            await service._request("POST", URL)
+    finally:
+        await service.close()
+
+    assert attempts == 1
+    assert sleeps == []
+
+
+@pytest.mark.asyncio
+async def test_retries_stop_at_the_limit(sleeps):
+    service, requests = make_service([httpx.Response(502)] * 10)
+    service.max_retries = 2
+    try:
+        response = await service._request("GET", URL, "token")
+    finally:
+        await service.close()
+
+    assert response.status_code == 502
+    assert len(requests) == 3
+    assert sleeps == [0.5, 1.0]
+
+
+@pytest.mark.asyncio
+async def test_transport_errors_are_retried_until_the_limit(sleeps):
+    attempts = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal attempts
+        attempts += 1
+        raise httpx.ConnectError("connection reset", request=request)
+
+    service = GitHubService(transport=httpx.MockTransport(handler), cache=None)
+    service.max_retries = 2
+    try:
+        with pytest.raises(httpx.ConnectError):
+            await service._request("GET", URL, "token")
+    finally:
+        await service.close()
+
+    assert attempts == 3
+    assert len(sleeps) == 2
@@ -0,0 +1,165 @@
+# backend/tests/test_indexes.py
+from typing import Any, Dict, List
+
+import pytest
+from pymongo import ASCENDING, IndexModel
+from pymongo.errors import OperationFailure
+
+from src.database.indexes import QueryPlanError, record_plan_queries
+from src.database.repositories import (
+    BaseRepository,
+    all_repositories,
+    analysis_job_repo,
+    translation_repo,
+)
+
+
+class IndexedCollection:
+    """Just enough of a server collection to exercise index option conflicts"""
+
+    def __init__(self, existing: Dict[str, Dict[str, Any]]):
+        self.existing = existing
+        self.commands: List[tuple] = []
+        self.dropped: List[str] = []
+        self.database = self
+
+    async def command(self, name: str, collection: str, **kwargs):
+        self.commands.append((name, collection, kwargs))
+        index = kwargs["index"]
+        self.existing[index["name"]]["expireAfterSeconds"] = index[
+            "expireAfterSeconds"
+        ]
+
+    async def index_information(self) -> Dict[str, Dict[str, Any]]:
+        return {name: dict(info) for name, info in self.existing.items()}
+
+    async def drop_index(self, name: str):
+        self.dropped.append(name)
+        del self.existing[name]
+
+    async def create_indexes(self, indexes: List[IndexModel]) -> List[str]:
+        for index in indexes:
+            document = dict(index.document)
+            name = document.pop("name")
+            keys = list(document.pop("key").items())
+            for existing_name, info in self.existing.items():
+                options = {k: v for k, v in info.items() if k not in ("key", "v")}
+                if existing_name == name and options != document:
+                    raise OperationFailure("Index options conflict", code=85)
+                if existing_name != name and info["key"] == keys:
+                    raise OperationFailure("Index exists with another name", code=85)
+            self.existing[name] = {"key": keys, "v": 2, **document}
+        return [index.document["name"] for index in indexes]
+
+
+class CacheRepository(BaseRepository):
+    collection_name = "cache"
+    indexes = [
+        IndexModel([("key", ASCENDING)], unique=True),
+        IndexModel([("last_hit_at", ASCENDING)], expireAfterSeconds=60),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_changed_ttl_is_applied_with_coll_mod():
+    collection = IndexedCollection(
+        {
+            "key_1": {"key": [("key", 1)], "v": 2, "unique": True},
+            "last_hit_at_1": {
+                "key": [("last_hit_at", 1)],
+                "v": 2,
+                "expireAfterSeconds": 3600,
+            },
+        }
+    )
+    repo = CacheRepository().with_collection(collection)
+
+    assert await repo.ensure_indexes() == ["key_1", "last_hit_at_1"]
+    assert collection.commands == [
+        (
+            "collMod",
+            "cache",
+            {"index": {"name": "last_hit_at_1", "expireAfterSeconds": 60}},
+        )
+    ]
+    assert collection.dropped == []
+    assert collection.existing["last_hit_at_1"]["expireAfterSeconds"] == 60
+
+
+@pytest.mark.asyncio
+async def test_other_option_changes_rebuild_the_index():
+    collection = IndexedCollection(
+        {
+            "key_1": {"key": [("key", 1)], "v": 2},
+            "cache_ttl": {
+                "key": [("last_hit_at", 1)],
+                "v": 2,
+                "expireAfterSeconds": 60,
+            },
+        }
+    )
+    repo = CacheRepository().with_collection(collection)
+
+    await repo.ensure_indexes()
+
+    assert collection.commands == []
+    assert collection.dropped == ["key_1", "cache_ttl"]
+    assert collection.existing["key_1"]["unique"] is True
+    assert "last_hit_at_1" in collection.existing
+
+
+@pytest.mark.asyncio
+async def test_unrelated_index_errors_are_raised():
+    class BrokenCollection:
+        async def create_indexes(self, indexes):
+            raise OperationFailure("not authorized", code=13)
+
+    with pytest.raises(OperationFailure):
+        await CacheRepository().with_collection(BrokenCollection()).ensure_indexes()
+
+
+def test_with_collection_leaves_the_shared_repository_alone():
+    collection = object()
+    copy = translation_repo.with_collection(collection)
+    assert copy.collection is collection
+    assert translation_repo._collection is None
+
+
+@pytest.mark.asyncio
+async def test_every_plan_check_records_the_queries_its_method_sends():
+    for repo in all_repositories:
+        queries = await record_plan_queries(repo)
+        assert queries, repo.collection_name
+        for name, query in queries.items():
+            assert query["filter"], name
+
+
+@pytest.mark.asyncio
+async def test_plan_checks_follow_the_job_queue_methods():
+    queries = await record_plan_queries(analysis_job_repo)
+
+    claim = queries["analysisJobs.claim_next_job"]
+    assert claim["filter"]["status"] == "queued"
+    assert claim["sort"] == analysis_job_repo.claim_sort
+    assert queries["analysisJobs.find_pending_jobs"]["sort"] == (
+        analysis_job_repo.claim_sort
+    )
+    # reclaim_expired_leases fails exhausted jobs, then requeues the rest
+    assert "$expr" in queries["analysisJobs.reclaim_expired_leases#1"]["filter"]
+    requeue = queries["analysisJobs.reclaim_expired_leases#2"]
+    assert requeue["filter"]["status"] == "processing"
+
+
+@pytest.mark.asyncio
+async def test_check_that_sends_no_query_is_an_error():
+    class IdleRepository(BaseRepository):
+        collection_name = "idle"
+
+        def plan_checks(self):
+            async def run(repo):
+                return None
+
+            return [{"name": "nothing", "run": run}]
+
+    with pytest.raises(QueryPlanError, match="idle.nothing issued no queries"):
+        await record_plan_queries(IdleRepository())
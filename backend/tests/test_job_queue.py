@@ -0,0 +1,232 @@
+# backend/tests/test_job_queue.py
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.database.repositories import AnalysisJobRepository
+from src.workers.job_worker import JobWorkerPool
+
+
+@pytest.fixture
+def repo(mongo_db):
+    return AnalysisJobRepository()
+
+
+async def queue_job(repo, job_type="repository", priority=5, **fields):
+    now = datetime.utcnow()
+    return await repo.create(
+        {
+            "type": job_type,
+            "status": "queued",
+            "priority": priority,
+            "retries": 0,
+            "max_retries": 3,
+            "available_at": None,
+            "created_at": now,
+            **fields,
+        }
+    )
+
+
+async def stored(repo, job):
+    return await repo.collection.find_one({"_id": job["_id"]})
+
+
+@pytest.mark.asyncio
+async def test_claims_by_priority_then_age(repo):
+    now = datetime.utcnow()
+    old_low = await queue_job(repo, priority=1, created_at=now - timedelta(hours=1))
+    new_high = await queue_job(repo, priority=9, created_at=now)
+    old_high = await queue_job(repo, priority=9, created_at=now - timedelta(hours=1))
+
+    claimed = [
+        (await repo.claim_next_job("w", "host", 60))["_id"] for _ in range(3)
+    ]
+    assert claimed == [old_high["_id"], new_high["_id"], old_low["_id"]]
+    assert await repo.claim_next_job("w", "host", 60) is None
+
+
+@pytest.mark.asyncio
+async def test_claim_sets_the_lease_and_respects_types_and_backoff(repo):
+    await queue_job(repo, job_type="translation")
+    await queue_job(repo, available_at=datetime.utcnow() + timedelta(minutes=5))
+    assert await repo.claim_next_job("w", "host", 60, job_types=["repository"]) is None
+
+    job = await repo.claim_next_job("w", "host", 60, job_types=["translation"])
+    assert job["status"] == "processing"
+    assert job["worker_id"] == "w"
+    assert job["lease_expires_at"] > datetime.utcnow() + timedelta(seconds=50)
+
+
+@pytest.mark.asyncio
+async def test_only_the_owner_renews_a_lease(repo):
+    await queue_job(repo)
+    job = await repo.claim_next_job("w1", "host", 1)
+
+    assert await repo.renew_lease(str(job["_id"]), "w1", 120)
+    assert not await repo.renew_lease(str(job["_id"]), "w2", 120)
+    renewed = await stored(repo, job)
+    assert renewed["lease_expires_at"] > datetime.utcnow() + timedelta(seconds=100)
+
+
+@pytest.mark.asyncio
+async def test_expired_leases_are_requeued_or_failed(repo):
+    expired = datetime.utcnow() - timedelta(seconds=1)
+    retryable = await queue_job(
+        repo, status="processing", worker_id="w", lease_expires_at=expired
+    )
+    exhausted = await queue_job(
+        repo,
+        status="processing",
+        worker_id="w",
+        lease_expires_at=expired,
+        retries=3,
+    )
+    live = await queue_job(
+        repo,
+        status="processing",
+        worker_id="w",
+        lease_expires_at=datetime.utcnow() + timedelta(minutes=1),
+    )
+
+    assert await repo.reclaim_expired_leases() == 2
+    retryable, exhausted, live = [
+        await stored(repo, job) for job in (retryable, exhausted, live)
+    ]
+    assert (retryable["status"], retryable["retries"]) == ("queued", 1)
+    assert retryable["worker_id"] is None
+    assert exhausted["status"] == "failed"
+    assert live["status"] == "processing"
+
+
+@pytest.mark.asyncio
+async def test_fail_job_requeues_with_backoff_until_retries_run_out(repo):
+    await queue_job(repo, max_retries=1)
+    error = {"message": "boom"}
+
+    job = await repo.claim_next_job("w", "host", 60)
+    assert await repo.fail_job(job, "w", error, backoff_seconds=30)
+    requeued = await stored(repo, job)
+    assert (requeued["status"], requeued["retries"]) == ("queued", 1)
+    assert requeued["available_at"] > datetime.utcnow() + timedelta(seconds=20)
+    # Still backing off
+    assert await repo.claim_next_job("w", "host", 60) is None
+
+    await repo.collection.update_one(
+        {"_id": job["_id"]}, {"$set": {"available_at": datetime.utcnow()}}
+    )
+    job = await repo.claim_next_job("w", "host", 60)
+    assert await repo.fail_job(job, "w", error, backoff_seconds=30)
+    assert (await stored(repo, job))["status"] == "failed"
+
+
+@pytest.mark.asyncio
+async def test_fail_job_ignores_jobs_owned_by_another_worker(repo):
+    await queue_job(repo)
+    job = await repo.claim_next_job("w1", "host", 60)
+    assert not await repo.fail_job(job, "w2", {"message": "boom"}, 0)
+    assert (await stored(repo, job))["status"] == "processing"
+
+
+def make_pool(repo, handlers, lease_seconds=60):
+    pool = JobWorkerPool(handlers, repo=repo, lease_seconds=lease_seconds)
+    pool.backoff_seconds = 0
+    return pool
+
+
+@pytest.mark.asyncio
+async def test_run_once_completes_or_fails_the_job(repo):
+    async def succeed(job):
+        return {"files": 3}
+
+    async def explode(job):
+        raise RuntimeError("handler failed")
+
+    done = await queue_job(repo, job_type="ok")
+    assert await make_pool(repo, {"ok": succeed}).run_once("w")
+    done = await stored(repo, done)
+    assert (done["status"], done["result"]) == ("completed", {"files": 3})
+
+    failed = await queue_job(repo, job_type="bad")
+    assert await make_pool(repo, {"bad": explode}).run_once("w")
+    failed = await stored(repo, failed)
+    assert (failed["status"], failed["retries"]) == ("queued", 1)
+    assert failed["error"]["type"] == "RuntimeError"
+    assert not await make_pool(repo, {"ok": succeed}).run_once("w")
+
+
+class FlakyRenewals:
+    """Wraps the repository; renew_lease answers from a script"""
+
+    def __init__(self, repo, renewals):
+        self.repo = repo
+        self.renewals = list(renewals)
+        self.attempts = 0
+        self.completed = []
+
+    def __getattr__(self, name):
+        return getattr(self.repo, name)
+
+    async def renew_lease(self, job_id, worker_id, lease_seconds):
+        self.attempts += 1
+        outcome = self.renewals.pop(0) if self.renewals else True
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    async def complete_job(self, job_id, worker_id, result=None):
+        self.completed.append(job_id)
+        return await self.repo.complete_job(job_id, worker_id, result)
+
+
+@pytest.mark.asyncio
+async def test_heartbeat_retries_transient_renewal_errors(repo):
+    flaky = FlakyRenewals(repo, [ConnectionError("blip"), True, True])
+
+    async def slow(job):
+        await asyncio.sleep(2.5)
+        return {}
+
+    job = await queue_job(repo, job_type="slow")
+    # 3s lease: beats every second, so the blip is retried well before expiry
+    assert await make_pool(flaky, {"slow": slow}, lease_seconds=3).run_once("w")
+    # Kept beating after the failed renewal
+    assert flaky.attempts >= 2
+    assert flaky.completed == [str(job["_id"])]
+    assert (await stored(repo, job))["status"] == "completed"
+
+
+@pytest.mark.asyncio
+async def test_lost_lease_cancels_the_handler_and_reports_nothing(repo):
+    flaky = FlakyRenewals(repo, [False])
+    cancelled = asyncio.Event()
+
+    async def long_running(job):
+        try:
+            await asyncio.sleep(30)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+        return {}
+
+    job = await queue_job(repo, job_type="long")
+    pool = make_pool(flaky, {"long": long_running}, lease_seconds=0.3)
+    assert await asyncio.wait_for(pool.run_once("w"), timeout=5)
+    assert cancelled.is_set()
+    assert flaky.completed == []
+    assert (await stored(repo, job))["status"] == "processing"
+
+
+@pytest.mark.asyncio
+async def test_lease_is_given_up_when_renewals_fail_until_expiry(repo):
+    flaky = FlakyRenewals(repo, [ConnectionError("down")] * 10)
+
+    async def long_running(job):
+        await asyncio.sleep(30)
+
+    await queue_job(repo, job_type="long")
+    pool = make_pool(flaky, {"long": long_running}, lease_seconds=0.3)
+    assert await asyncio.wait_for(pool.run_once("w"), timeout=5)
+    assert flaky.completed == []
+    assert 1 <= flaky.attempts <= 3
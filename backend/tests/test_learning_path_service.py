@@ -0,0 +1,69 @@
+# backend/tests/test_learning_path_service.py
+from src.services.learning_path_service import (
+    curriculum_key,
+    normalize_lessons,
+    personalize,
+)
+
+TEMPLATE = {
+    "lessons": [
+        {"title": "JSX basics", "skills": ["React"], "estimated_time": 30},
+        {"title": "Hooks", "skills": ["react", "hooks"], "estimated_time": 45},
+        {"title": "Routing", "skills": ["react-router"], "estimated_time": 60},
+        {"title": "Project setup", "estimated_time": 15},
+    ]
+}
+
+
+def titles(lessons):
+    return [lesson["title"] for lesson in lessons]
+
+
+def test_personalize_skips_lessons_whose_skills_are_all_known():
+    path = personalize(TEMPLATE, {"react": 9.0, "hooks": 8.0}, skip_proficiency=7.0)
+    assert titles(path["lessons"]) == ["Routing", "Project setup"]
+    assert path["skipped"] == ["JSX basics", "Hooks"]
+    assert path["estimated_hours"] == 1.2
+
+
+def test_personalize_keeps_lessons_with_any_unknown_or_weak_skill():
+    path = personalize(TEMPLATE, {"React": 9.0, "hooks": 3.0}, skip_proficiency=7.0)
+    assert titles(path["lessons"]) == ["Hooks", "Routing", "Project setup"]
+    assert path["skipped"] == ["JSX basics"]
+
+
+def test_personalize_keeps_lessons_without_skills():
+    template = {"lessons": [{"title": "Intro"}]}
+    path = personalize(template, {"react": 10.0}, skip_proficiency=7.0)
+    assert titles(path["lessons"]) == ["Intro"]
+
+
+def test_personalize_never_drops_every_lesson():
+    template = {"lessons": TEMPLATE["lessons"][:2]}
+    path = personalize(template, {"react": 9.0, "hooks": 9.0}, skip_proficiency=7.0)
+    assert titles(path["lessons"]) == ["JSX basics", "Hooks"]
+    assert path["skipped"] == []
+
+
+def test_personalize_renumbers_kept_lessons():
+    path = personalize(TEMPLATE, {"react": 9.0}, skip_proficiency=7.0)
+    assert [(lesson["id"], lesson["order"]) for lesson in path["lessons"]] == [
+        ("lesson-1", 1),
+        ("lesson-2", 2),
+        ("lesson-3", 3),
+    ]
+    assert not any(lesson["completed"] for lesson in path["lessons"])
+
+
+def test_normalize_lessons_fills_defaults_and_keeps_body_refs():
+    [lesson] = normalize_lessons([{"body_ref": "abc", "estimated_time": None}])
+    assert lesson["title"] == "Lesson 1"
+    assert lesson["estimated_time"] == 30
+    assert lesson["body_ref"] == "abc"
+
+
+def test_curriculum_key_normalizes_technology_names():
+    key = curriculum_key("Next.js ", "vite-react", "beginner", None, "v1")
+    assert key == curriculum_key("next.js", "Vite-React", "beginner", "", "v1")
+    assert key != curriculum_key("next.js", "vite-react", "advanced", None, "v1")
+    assert key != curriculum_key("next.js", "vite-react", "beginner", None, "v2")
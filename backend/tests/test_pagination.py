@@ -0,0 +1,26 @@
+# backend/tests/test_pagination.py
+from datetime import datetime
+
+import pytest
+from bson import ObjectId
+
+from src.database.repositories import BaseRepository
+
+
+def test_cursor_round_trip_filters_rows_after_the_last_document():
+    last = {"_id": ObjectId(), "created_at": datetime(2024, 5, 1, 12, 30, 15, 250000)}
+    token = BaseRepository.encode_cursor(last)
+    assert "=" not in token
+
+    assert BaseRepository.decode_cursor(token) == {
+        "$or": [
+            {"created_at": {"$lt": last["created_at"]}},
+            {"created_at": last["created_at"], "_id": {"$lt": last["_id"]}},
+        ]
+    }
+
+
+@pytest.mark.parametrize("token", ["", "not-a-cursor", "e30", "eyJjIjogMX0"])
+def test_malformed_cursor_raises_value_error(token):
+    with pytest.raises(ValueError, match="Invalid pagination cursor"):
+        BaseRepository.decode_cursor(token)
@@ -0,0 +1,213 @@
+# backend/tests/test_revocation.py
+import asyncio
+import time
+
+import pytest
+
+from src.core.revocation import (
+    BloomFilter,
+    MemoryRevocationStore,
+    RedisRevocationStore,
+    TokenRevocationList,
+)
+
+
+def test_bloom_filter_has_no_false_negatives():
+    bloom = BloomFilter(1000, 0.01)
+    items = [f"jti-{i}" for i in range(1000)]
+    for item in items:
+        bloom.add(item)
+    assert all(item in bloom for item in items)
+    assert bloom.count == 1000
+
+
+def test_bloom_filter_false_positive_rate_near_target():
+    bloom = BloomFilter(1000, 0.01)
+    for i in range(1000):
+        bloom.add(f"revoked-{i}")
+    false_positives = sum(f"active-{i}" in bloom for i in range(10_000))
+    assert false_positives < 300
+
+
+def test_bloom_filter_starts_empty():
+    bloom = BloomFilter(100, 0.01)
+    assert "anything" not in bloom
+
+
+async def make_revocation_list(capacity: int = 100) -> TokenRevocationList:
+    revocations = TokenRevocationList(MemoryRevocationStore(), capacity, 0.01)
+    await revocations.start()
+    return revocations
+
+
+@pytest.mark.asyncio
+async def test_revoked_token_is_reported():
+    revocations = await make_revocation_list()
+    await revocations.revoke("jti-1", time.time() + 60)
+    assert await revocations.is_revoked("jti-1")
+    assert not await revocations.is_revoked("jti-2")
+
+
+@pytest.mark.asyncio
+async def test_expired_revocation_is_not_reported():
+    revocations = await make_revocation_list()
+    await revocations.revoke("jti-1", time.time() - 1)
+    assert not await revocations.is_revoked("jti-1")
+
+
+@pytest.mark.asyncio
+async def test_lookups_before_start_go_to_the_store():
+    store = MemoryRevocationStore()
+    await store.revoke("jti-1", time.time() + 60)
+    revocations = TokenRevocationList(store, 100, 0.01)
+    assert await revocations.is_revoked("jti-1")
+
+    await revocations.start()
+    assert "jti-1" in revocations.bloom
+    assert await revocations.is_revoked("jti-1")
+
+
+@pytest.mark.asyncio
+async def test_rebuild_grows_the_filter_instead_of_rebuilding_on_every_revoke():
+    revocations = await make_revocation_list(capacity=4)
+    rebuilds = 0
+    rebuild = revocations.rebuild
+
+    async def counting_rebuild():
+        nonlocal rebuilds
+        rebuilds += 1
+        await rebuild()
+
+    revocations.rebuild = counting_rebuild
+    expires_at = time.time() + 60
+    for i in range(64):
+        await revocations.revoke(f"jti-{i}", expires_at)
+
+    assert rebuilds <= 5
+    assert revocations.bloom.capacity >= 64
+    assert all([await revocations.is_revoked(f"jti-{i}") for i in range(64)])
+
+
+class FakePubSub:
+    def __init__(self, redis):
+        self.redis = redis
+        self.queue: asyncio.Queue = asyncio.Queue()
+
+    async def subscribe(self, channel):
+        self.redis.subscribers.append(self)
+
+    async def listen(self):
+        while True:
+            message = await self.queue.get()
+            if isinstance(message, Exception):
+                raise message
+            yield message
+
+    async def reset(self):
+        if self in self.redis.subscribers:
+            self.redis.subscribers.remove(self)
+
+
+class FakeRedis:
+    """Just enough of redis.asyncio for RedisRevocationStore"""
+
+    def __init__(self):
+        self.keys = {}
+        self.subscribers = []
+        self.on_scan = None
+
+    async def set(self, key, value, exat=None):
+        self.keys[key] = value
+
+    async def exists(self, key):
+        return int(key in self.keys)
+
+    async def publish(self, channel, data):
+        for subscriber in self.subscribers:
+            subscriber.queue.put_nowait({"type": "message", "data": data.encode()})
+
+    async def scan_iter(self, match, count):
+        keys = list(self.keys)
+        if self.on_scan:
+            await self.on_scan()
+        for key in keys:
+            yield key.encode()
+
+    def pubsub(self):
+        return FakePubSub(self)
+
+    def drop_connections(self):
+        for subscriber in list(self.subscribers):
+            subscriber.queue.put_nowait(ConnectionError("connection lost"))
+
+
+def redis_store(redis) -> RedisRevocationStore:
+    store = RedisRevocationStore()
+    store.redis = redis
+    return store
+
+
+def redis_revocation_list(redis) -> TokenRevocationList:
+    return TokenRevocationList(redis_store(redis), 100, 0.01, reconnect_delay=0.01)
+
+
+async def eventually(condition, timeout=2.0):
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not condition():
+        assert asyncio.get_running_loop().time() < deadline, "condition not met"
+        await asyncio.sleep(0.01)
+
+
+async def revoke_elsewhere(redis, jti):
+    """Another worker's revocation: written to Redis, then published"""
+    await redis_store(redis).revoke(jti, time.time() + 60)
+
+
+@pytest.mark.asyncio
+async def test_revocation_published_during_the_initial_load_is_not_missed():
+    redis = FakeRedis()
+
+    async def revoke_during_scan():
+        redis.on_scan = None
+        await revoke_elsewhere(redis, "jti-late")
+
+    redis.on_scan = revoke_during_scan
+    revocations = redis_revocation_list(redis)
+    await revocations.start()
+    try:
+        await eventually(lambda: "jti-late" in revocations.bloom)
+        assert revocations._started
+        assert await revocations.is_revoked("jti-late")
+    finally:
+        await revocations.stop()
+
+
+@pytest.mark.asyncio
+async def test_lookups_use_the_store_while_the_listener_reconnects():
+    redis = FakeRedis()
+    revocations = redis_revocation_list(redis)
+    await revocations.start()
+    try:
+        await eventually(lambda: revocations._started)
+
+        # Reconnecting is held up until the test lets it finish
+        resume = asyncio.Event()
+
+        async def slow_scan():
+            await resume.wait()
+
+        redis.on_scan = slow_scan
+        redis.drop_connections()
+        await eventually(lambda: not revocations._started)
+
+        # Published while disconnected: only the store knows about it
+        await revoke_elsewhere(redis, "jti-missed")
+        assert "jti-missed" not in revocations.bloom
+        assert await revocations.is_revoked("jti-missed")
+
+        redis.on_scan = None
+        resume.set()
+        await eventually(lambda: revocations._started)
+        assert "jti-missed" in revocations.bloom
+    finally:
+        await revocations.stop()
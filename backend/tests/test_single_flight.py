@@ -0,0 +1,69 @@
+# backend/tests/test_single_flight.py
+import asyncio
+
+import pytest
+
+from src.core.single_flight import SingleFlight
+
+
+@pytest.mark.asyncio
+async def test_concurrent_callers_share_one_call():
+    flights = SingleFlight()
+    calls = 0
+    release = asyncio.Event()
+
+    async def load():
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return {"value": 1}
+
+    tasks = [asyncio.create_task(flights.run("key", load)) for _ in range(5)]
+    await asyncio.sleep(0)
+    assert flights.running("key")
+    release.set()
+    results = await asyncio.gather(*tasks)
+
+    assert calls == 1
+    assert [shared for _, shared in results] == [False, True, True, True, True]
+    assert all(result == {"value": 1} for result, _ in results)
+    assert not flights.running("key")
+
+
+@pytest.mark.asyncio
+async def test_failures_reach_every_waiter_and_are_not_cached():
+    flights = SingleFlight()
+    release = asyncio.Event()
+
+    async def fail():
+        await release.wait()
+        raise RuntimeError("upstream down")
+
+    tasks = [asyncio.create_task(flights.run("key", fail)) for _ in range(3)]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+    async def succeed():
+        return "ok"
+
+    assert await flights.run("key", succeed) == ("ok", False)
+
+
+@pytest.mark.asyncio
+async def test_a_cancelled_waiter_does_not_cancel_the_shared_call():
+    flights = SingleFlight()
+    release = asyncio.Event()
+
+    async def load():
+        await release.wait()
+        return "done"
+
+    owner = asyncio.create_task(flights.run("key", load))
+    await asyncio.sleep(0)
+    waiter = asyncio.create_task(flights.run("key", load))
+    await asyncio.sleep(0)
+    waiter.cancel()
+    release.set()
+    assert await owner == ("done", False)
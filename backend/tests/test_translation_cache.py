@@ -0,0 +1,73 @@
+# backend/tests/test_translation_cache.py
+from src.services.translation_cache import normalize_source, translation_cache_key
+
+SOURCE = {"framework": "react", "language": "javascript", "code": "const a = 1;"}
+TARGET = {"framework": "vue", "language": "typescript", "packages": ["pinia"]}
+
+
+def test_normalize_source_only_normalizes_line_endings_and_outer_blank_lines():
+    code = "\ufeff\r\n\nconst a = 1;\r\nconst b = 2;   \n\n\n"
+    assert normalize_source(code) == "const a = 1;\nconst b = 2;"
+
+
+def test_normalize_source_keeps_comments_indentation_and_inner_whitespace():
+    code = "if ready:\n    start()  # go\n\n    finish()"
+    assert normalize_source(code) == code
+
+
+def test_normalize_source_keeps_indentation():
+    nested = "if ready:\n    start()\n    finish()\n"
+    dedented = "if ready:\n    start()\nfinish()\n"
+    assert normalize_source(nested) != normalize_source(dedented)
+
+
+def test_key_distinguishes_urls_after_a_jsx_apostrophe():
+    # The apostrophe once paired with a later quote, so `//...` inside a real
+    # string was taken for a comment and both URLs produced the same key
+    template = "const C = () => <p>Don't panic</p>;\nfetch('https://{}/v1');"
+    one = {**SOURCE, "code": template.format("api.one.com")}
+    two = {**SOURCE, "code": template.format("api.two.com")}
+    assert translation_cache_key(one, TARGET) != translation_cache_key(two, TARGET)
+
+
+def test_key_distinguishes_whitespace_inside_string_literals():
+    one = {**SOURCE, "code": 'const sep = "  ";'}
+    two = {**SOURCE, "code": 'const sep = " ";'}
+    assert translation_cache_key(one, TARGET) != translation_cache_key(two, TARGET)
+
+
+def test_key_ignores_formatting_only_changes():
+    reformatted = {**SOURCE, "code": "\r\nconst a = 1;\r\n\n"}
+    assert translation_cache_key(SOURCE, TARGET) == translation_cache_key(
+        reformatted, TARGET
+    )
+
+
+def test_key_depends_on_source_code_and_framework():
+    key = translation_cache_key(SOURCE, TARGET)
+    assert key != translation_cache_key({**SOURCE, "code": "const a = 2;"}, TARGET)
+    assert key != translation_cache_key({**SOURCE, "framework": "preact"}, TARGET)
+
+
+def test_key_depends_on_target_framework_and_language():
+    key = translation_cache_key(SOURCE, TARGET)
+    assert key != translation_cache_key(SOURCE, {**TARGET, "framework": "svelte"})
+    assert key != translation_cache_key(SOURCE, {**TARGET, "language": "javascript"})
+
+
+def test_key_depends_on_target_packages_but_not_their_order():
+    key = translation_cache_key(SOURCE, {**TARGET, "packages": ["pinia", "vueuse"]})
+    assert key == translation_cache_key(
+        SOURCE, {**TARGET, "packages": ["vueuse", "pinia"]}
+    )
+    assert key != translation_cache_key(SOURCE, TARGET)
+    without_packages = {k: v for k, v in TARGET.items() if k != "packages"}
+    assert translation_cache_key(
+        SOURCE, {**TARGET, "packages": []}
+    ) == translation_cache_key(SOURCE, without_packages)
+
+
+def test_key_depends_on_model_version():
+    assert translation_cache_key(SOURCE, TARGET, "v1") != translation_cache_key(
+        SOURCE, TARGET, "v2"
+    )
@@ -0,0 +1,158 @@
+# backend/tests/test_translation_stream.py
+import json
+
+import httpx
+import pytest
+from bson import ObjectId
+from fastapi import FastAPI
+
+from src.api.translation import router as translation_router
+from src.core.auth import get_current_user
+from src.services.translation_cache import TranslationCache
+from src.services.translation_service import (
+    FakeTranslationProvider,
+    TranslationProvider,
+    TranslationService,
+)
+
+SOURCE = {
+    "framework": "react",
+    "language": "javascript",
+    "packages": [],
+    "code": "const a = 1;\nconst b = 2;\n",
+}
+TARGET = {"framework": "vue", "language": "typescript", "packages": []}
+USER_ID = ObjectId()
+
+
+class FailingProvider(TranslationProvider):
+    """Yields one chunk, then fails mid-stream"""
+
+    model_version = "failing"
+
+    async def stream(self, source, target):
+        yield "partial"
+        raise RuntimeError("model unavailable")
+
+
+def make_service(provider=None) -> TranslationService:
+    return TranslationService(
+        provider or FakeTranslationProvider(), TranslationCache(backend="mongo")
+    )
+
+
+@pytest.fixture
+def client(monkeypatch):
+    """A client for the translation router, signed in as USER_ID"""
+
+    def use(service: TranslationService) -> httpx.AsyncClient:
+        monkeypatch.setattr(translation_router, "translation_service", service)
+        app = FastAPI()
+        app.include_router(translation_router.router, prefix="/translations")
+        app.dependency_overrides[get_current_user] = lambda: {"id": str(USER_ID)}
+        return httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://test"
+        )
+
+    return use
+
+
+def parse_events(body: str):
+    """(event, data) pairs from a server-sent event stream"""
+    events = []
+    for block in body.strip().split("\n\n"):
+        fields = dict(line.split(": ", 1) for line in block.splitlines())
+        events.append((fields["event"], json.loads(fields["data"])))
+    return events
+
+
+async def collect(service: TranslationService, result: dict):
+    return [
+        chunk
+        async for chunk in service.stream_translation(USER_ID, SOURCE, TARGET, result)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_stream_persists_one_translation_after_the_last_chunk(mongo_db):
+    service = make_service()
+    result = {}
+    chunks = []
+    async for chunk in service.stream_translation(USER_ID, SOURCE, TARGET, result):
+        # Nothing is written while chunks are still being produced
+        assert await mongo_db.translations.count_documents({}) == 0
+        chunks.append(chunk)
+
+    assert len(chunks) == 3
+    docs = await mongo_db.translations.find().to_list(None)
+    assert len(docs) == 1
+    assert str(docs[0]["_id"]) == result["id"]
+    assert docs[0]["user_id"] == USER_ID
+    assert docs[0]["target"]["code"] == "".join(chunks)
+    assert result["cached"] is False
+
+
+@pytest.mark.asyncio
+async def test_repeat_stream_is_served_from_the_cache(mongo_db):
+    service = make_service()
+    first = await collect(service, {})
+    result = {}
+    second = await collect(service, result)
+
+    assert second == ["".join(first)]
+    assert result["cached"] is True
+    assert await mongo_db.translations.count_documents({}) == 2
+
+
+@pytest.mark.asyncio
+async def test_failed_stream_persists_nothing(mongo_db):
+    service = make_service(FailingProvider())
+    result = {}
+    with pytest.raises(RuntimeError):
+        await collect(service, result)
+
+    assert result == {}
+    assert await mongo_db.translations.count_documents({}) == 0
+    assert await mongo_db.translationCache.count_documents({}) == 0
+
+
+@pytest.mark.asyncio
+async def test_abandoned_stream_persists_nothing(mongo_db):
+    stream = make_service().stream_translation(USER_ID, SOURCE, TARGET, {})
+    await stream.__anext__()
+    await stream.aclose()
+
+    assert await mongo_db.translations.count_documents({}) == 0
+
+
+@pytest.mark.asyncio
+async def test_route_emits_chunks_then_done(mongo_db, client):
+    async with client(make_service()) as http:
+        response = await http.post(
+            "/translations/stream", json={"source": SOURCE, "target": TARGET}
+        )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    events = parse_events(response.text)
+    assert [name for name, _ in events] == ["chunk", "chunk", "chunk", "done"]
+
+    docs = await mongo_db.translations.find().to_list(None)
+    assert len(docs) == 1
+    assert events[-1][1]["id"] == str(docs[0]["_id"])
+    streamed = "".join(data["text"] for _, data in events[:-1])
+    assert streamed == docs[0]["target"]["code"]
+
+
+@pytest.mark.asyncio
+async def test_route_reports_errors_without_done(mongo_db, client):
+    async with client(make_service(FailingProvider())) as http:
+        response = await http.post(
+            "/translations/stream", json={"source": SOURCE, "target": TARGET}
+        )
+
+    events = parse_events(response.text)
+    assert [name for name, _ in events] == ["chunk", "error"]
+    assert events[0][1] == {"text": "partial"}
+    assert "model unavailable" in events[1][1]["detail"]
+    assert await mongo_db.translations.count_documents({}) == 0